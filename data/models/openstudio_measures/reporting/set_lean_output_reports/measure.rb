@@ -0,0 +1,156 @@
+# -----------------------------------------------------------------------------------------------
+# SetLeanOutputReports
+#
+# Author:  Robert Donohue, enviENERGY Studio LLC
+# Version: 0.1.0
+# Date:    2025-08-04
+# -----------------------------------------------------------------------------------------------
+
+class SetLeanOutputReports < OpenStudio::Measure::EnergyPlusMeasure
+
+    # objects that only feed output files the KPI pipeline never reads
+    REMOVED_OUTPUT_TYPES = [
+        'Output:Variable',
+        'Output:Meter',
+        'Output:Meter:MeterFileOnly',
+        'Output:Meter:Cumulative',
+        'Output:Meter:Cumulative:MeterFileOnly',
+        'Output:Table:Monthly',
+        'Output:Table:Annual',
+        'Output:Table:TimeBins',
+        'Output:VariableDictionary',
+        'Output:Surfaces:Drawing',
+        'Output:Surfaces:List',
+        'Output:Constructions',
+        'Output:Schedules',
+        'Output:EnergyManagementSystem',
+        'Output:DebuggingData',
+        'Output:JSON',
+    ]
+
+    # OutputControl:Files fields, by name (index looked up in the IDD, so field order and
+    # fields added in newer EnergyPlus versions do not matter). Tabular and END are always on:
+    # eplustbl.csv holds the KPIs and OpenStudio checks eplusout.end for completion.
+    OUTPUT_FILES = {
+        'Output CSV' => false,
+        'Output MTR' => false,
+        'Output ESO' => false,
+        'Output EIO' => false,
+        'Output Tabular' => true,
+        'Output JSON' => false,
+        'Output AUDIT' => false,
+        'Output Space Sizing' => false,
+        'Output Zone Sizing' => false,
+        'Output System Sizing' => false,
+        'Output DXF' => false,
+        'Output BND' => false,
+        'Output RDD' => false,
+        'Output MDD' => false,
+        'Output MTD' => false,
+        'Output END' => true,
+        'Output SHD' => false,
+        'Output DFS' => false,
+        'Output GLHE' => false,
+        'Output DelightIn' => false,
+        'Output DelightELdmp' => false,
+        'Output DelightDFdmp' => false,
+        'Output EDD' => false,
+        'Output DBG' => false,
+        'Output PerfLog' => false,
+        'Output SLN' => false,
+        'Output SCI' => false,
+        'Output WRL' => false,
+        'Output Screen' => false,
+        'Output ExtShd' => false,
+        'Output Tarcog' => false,
+    }
+
+    def name
+        return 'Set Lean Output Reports'
+    end
+
+    def arguments(workspace)
+        args = OpenStudio::Measure::OSArgumentVector.new
+
+        # comma-separated Output:Table:SummaryReports to keep (the KPI tables' reports)
+        summary_reports = OpenStudio::Measure::OSArgument.makeStringArgument('summary_reports', true)
+        summary_reports.setDisplayName('Summary reports to write (comma-separated)')
+        summary_reports.setDefaultValue('AnnualBuildingUtilityPerformanceSummary,InputVerificationandResultsSummary')
+        args << summary_reports
+
+        # keep eplusout.sql (tabular data only) for the SQL KPI backend
+        keep_sqlite = OpenStudio::Measure::OSArgument.makeBoolArgument('keep_sqlite', true)
+        keep_sqlite.setDisplayName('Write eplusout.sql (tabular data only)')
+        keep_sqlite.setDefaultValue(true)
+        args << keep_sqlite
+
+        # return argument vector
+        return args
+    end
+
+    def run(workspace, runner, user_arguments)
+        super(workspace, runner, user_arguments)
+
+        # validate the user arguments
+        return false unless runner.validateUserArguments(arguments(workspace), user_arguments)
+
+        summary_reports = runner.getStringArgumentValue('summary_reports', user_arguments)
+        keep_sqlite = runner.getBoolArgumentValue('keep_sqlite', user_arguments)
+
+        reports = summary_reports.split(',').map(&:strip).reject(&:empty?)
+        if reports.empty?
+            runner.registerError('No summary reports given; eplustbl.csv would be empty.')
+            return false
+        end
+
+        # remove time-series and diagnostic outputs
+        removed_count = 0
+        REMOVED_OUTPUT_TYPES.each do |type|
+            workspace.getObjectsByType(type.to_IddObjectType).each do |object|
+                workspace.removeObject(object.handle)
+                removed_count += 1
+            end
+        end
+
+        # write only the summary reports the KPI extractors read
+        workspace.getObjectsByType('Output:Table:SummaryReports'.to_IddObjectType).each do |object|
+            workspace.removeObject(object.handle)
+        end
+        workspace.addObject(OpenStudio::IdfObject.load("Output:Table:SummaryReports,\n  #{reports.join(",\n  ")};").get)
+
+        # tabular output as CSV only (no eplustbl.htm), keeping the unit conversion setting
+        styles = workspace.getObjectsByType('OutputControl:Table:Style'.to_IddObjectType)
+        if styles.empty?
+            workspace.addObject(OpenStudio::IdfObject.load('OutputControl:Table:Style, Comma;').get)
+        else
+            styles.each { |style| style.setString(0, 'Comma') }
+        end
+
+        # SQLite: tabular data only, or none at all
+        workspace.getObjectsByType('Output:SQLite'.to_IddObjectType).each do |object|
+            workspace.removeObject(object.handle)
+        end
+        if keep_sqlite
+            workspace.addObject(OpenStudio::IdfObject.load('Output:SQLite, SimpleAndTabular;').get)
+        end
+
+        # switch off every output file the pipeline does not read
+        workspace.getObjectsByType('OutputControl:Files'.to_IddObjectType).each do |object|
+            workspace.removeObject(object.handle)
+        end
+        output_files = OpenStudio::IdfObject.new('OutputControl:Files'.to_IddObjectType)
+        OUTPUT_FILES.merge('Output SQLite' => keep_sqlite).each do |field_name, enabled|
+            index = output_files.iddObject.getFieldIndex(field_name)
+            next unless index.is_initialized
+            output_files.setString(index.get, enabled ? 'Yes' : 'No')
+        end
+        workspace.addObject(output_files)
+
+        runner.registerFinalCondition("Removed #{removed_count} output objects; writing #{reports.join(', ')} (SQLite: #{keep_sqlite ? 'tabular' : 'off'}).")
+
+        return true
+    end
+
+end
+# register the measure to be used by the application
+SetLeanOutputReports.new.registerWithApplication
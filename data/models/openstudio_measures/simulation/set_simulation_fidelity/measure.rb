@@ -0,0 +1,130 @@
+# -----------------------------------------------------------------------------------------------
+# SetSimulationFidelity
+#
+# Author:  Robert Donohue, enviENERGY Studio LLC
+# Version: 0.1.0
+# Date:    2025-08-11
+# -----------------------------------------------------------------------------------------------
+
+class SetSimulationFidelity < OpenStudio::Measure::EnergyPlusMeasure
+
+    def name
+        return 'Set Simulation Fidelity'
+    end
+
+    def arguments(workspace)
+        args = OpenStudio::Measure::OSArgumentVector.new
+
+        # timesteps per hour (0 keeps the model's Timestep)
+        timesteps_per_hour = OpenStudio::Measure::OSArgument.makeIntegerArgument('timesteps_per_hour', true)
+        timesteps_per_hour.setDisplayName('Timesteps per hour (0 = unchanged)')
+        timesteps_per_hour.setDefaultValue(0)
+        args << timesteps_per_hour
+
+        # days between shading recalculations (0 keeps the model's ShadowCalculation)
+        shadow_calculation_frequency = OpenStudio::Measure::OSArgument.makeIntegerArgument('shadow_calculation_frequency', true)
+        shadow_calculation_frequency.setDisplayName('Shadow calculation frequency in days (0 = unchanged)')
+        shadow_calculation_frequency.setDefaultValue(0)
+        args << shadow_calculation_frequency
+
+        # comma-separated MM/DD-MM/DD run periods replacing the annual RunPeriod (empty = unchanged)
+        run_periods = OpenStudio::Measure::OSArgument.makeStringArgument('run_periods', true)
+        run_periods.setDisplayName('Run periods, MM/DD-MM/DD comma-separated (empty = unchanged)')
+        run_periods.setDefaultValue('')
+        args << run_periods
+
+        # return argument vector
+        return args
+    end
+
+    def set_field(object, field_name, value)
+        index = object.iddObject.getFieldIndex(field_name)
+        return false unless index.is_initialized
+        object.setString(index.get, value.to_s)
+    end
+
+    def parse_run_periods(run_periods, runner)
+        periods = []
+        run_periods.split(',').map(&:strip).reject(&:empty?).each do |period|
+            match = period.match(%r{\A(\d{1,2})/(\d{1,2})-(\d{1,2})/(\d{1,2})\z})
+            if match.nil?
+                runner.registerError("Invalid run period '#{period}' (expected MM/DD-MM/DD).")
+                return nil
+            end
+            periods << match.captures.map(&:to_i)
+        end
+        return periods
+    end
+
+    def run(workspace, runner, user_arguments)
+        super(workspace, runner, user_arguments)
+
+        # validate the user arguments
+        return false unless runner.validateUserArguments(arguments(workspace), user_arguments)
+
+        timesteps_per_hour = runner.getIntegerArgumentValue('timesteps_per_hour', user_arguments)
+        shadow_calculation_frequency = runner.getIntegerArgumentValue('shadow_calculation_frequency', user_arguments)
+        run_periods = parse_run_periods(runner.getStringArgumentValue('run_periods', user_arguments), runner)
+        return false if run_periods.nil?
+
+        changes = []
+
+        # coarser zone timestep
+        if timesteps_per_hour > 0
+            timesteps = workspace.getObjectsByType('Timestep'.to_IddObjectType)
+            if timesteps.empty?
+                workspace.addObject(OpenStudio::IdfObject.load("Timestep, #{timesteps_per_hour};").get)
+            else
+                timesteps.each { |timestep| timestep.setString(0, timesteps_per_hour.to_s) }
+            end
+            changes << "#{timesteps_per_hour} timesteps/hour"
+        end
+
+        # less frequent shading recalculation
+        if shadow_calculation_frequency > 0
+            shadow_calculations = workspace.getObjectsByType('ShadowCalculation'.to_IddObjectType)
+            if shadow_calculations.empty?
+                shadow_calculation = OpenStudio::IdfObject.new('ShadowCalculation'.to_IddObjectType)
+                workspace.addObject(shadow_calculation)
+                shadow_calculations = workspace.getObjectsByType('ShadowCalculation'.to_IddObjectType)
+            end
+            shadow_calculations.each do |object|
+                set_field(object, 'Shading Calculation Update Frequency Method', 'Periodic')
+                set_field(object, 'Shading Calculation Update Frequency', shadow_calculation_frequency)
+            end
+            changes << "shading every #{shadow_calculation_frequency} days"
+        end
+
+        # representative run periods in place of the annual run
+        unless run_periods.empty?
+            existing = workspace.getObjectsByType('RunPeriod'.to_IddObjectType)
+            if existing.empty?
+                runner.registerError('No RunPeriod in the model to derive representative periods from.')
+                return false
+            end
+            template = existing.first.idfObject.clone
+            existing.each { |object| workspace.removeObject(object.handle) }
+            run_periods.each_with_index do |(begin_month, begin_day, end_month, end_day), i|
+                period = template.clone
+                set_field(period, 'Name', "Fidelity Run Period #{i + 1}")
+                set_field(period, 'Begin Month', begin_month)
+                set_field(period, 'Begin Day of Month', begin_day)
+                set_field(period, 'End Month', end_month)
+                set_field(period, 'End Day of Month', end_day)
+                workspace.addObject(period)
+            end
+            changes << "#{run_periods.size} run periods"
+        end
+
+        if changes.empty?
+            runner.registerAsNotApplicable('Full fidelity requested; model left unchanged.')
+        else
+            runner.registerFinalCondition("Simulation fidelity set: #{changes.join(', ')}.")
+        end
+
+        return true
+    end
+
+end
+# register the measure to be used by the application
+SetSimulationFidelity.new.registerWithApplication
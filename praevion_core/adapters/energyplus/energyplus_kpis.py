@@ -1,18 +1,28 @@
 import pandas as pd
 
 from praevion_core.adapters.energyplus.energyplus_tables import (
+    as_table_report,
     clean_table_with_headers,
-    extract_named_table,
 )
 
+GJ_TO_MMBTU = 0.947817
 
-def extract_total_energy(filepath):
+# Summary tables read by the KPI extractors, mapped to the EnergyPlus report that contains them
+KPI_SUMMARY_TABLES = {
+    "End Uses": "AnnualBuildingUtilityPerformanceSummary",
+    "Zone Summary": "InputVerificationandResultsSummary",
+    "Skylight-Roof Ratio": "InputVerificationandResultsSummary",
+}
+
+
+def extract_total_energy(report):
     """
     Extracts total site energy usage for each major end use from an EnergyPlus eplustbl.csv file.
     This function identifies the 'End Uses' table and parses electricity and natural gas values.
 
     Parameters:
-        filepath (string): Path to the EnergyPlus simulation output CSV file (eplustbl.csv)
+        report (EplusTableReport or str): Shared report for the run's eplustbl.csv, or a path
+            to the file
 
     Returns:
         dict: {
@@ -23,7 +33,8 @@ def extract_total_energy(filepath):
     """
 
     # STEP 1: Extract End Uses Table and clean
-    df = extract_named_table(filepath, "End Uses", "End Uses By Subcategory")
+    report = as_table_report(report)
+    df = report.table("End Uses", "End Uses By Subcategory")
     df = clean_table_with_headers(df)
 
     # STEP 2: Only keep relevant rows and convert to numeric
@@ -31,8 +42,6 @@ def extract_total_energy(filepath):
     df["Natural Gas [GJ]"] = pd.to_numeric(df["Natural Gas [GJ]"], errors="coerce")
     df["Total Energy Usage [GJ]"] = df["Electricity [GJ]"] + df["Natural Gas [GJ]"]
 
-    GJ_TO_MMBTU = 0.947817
-
     return {
         "electricity_mmbtu": df["Electricity [GJ]"].sum() * GJ_TO_MMBTU,
         "natural_gas_mmbtu": df["Natural Gas [GJ]"].sum() * GJ_TO_MMBTU,
@@ -40,14 +49,15 @@ def extract_total_energy(filepath):
     }
 
 
-def extract_zone_area(filepath):
+def extract_zone_area(report):
     """
     Parses the 'Zone Summary' section of eplustbl.csv to calculate floor areas of
     apartment and non-apartment zones. Used to normalize embodied carbon and distinguish
     residential vs. circulation area.
 
     Parameters:
-        filepath (string): Path to the EnergyPlus simulation output CSV file (eplustbl.csv)
+        report (EplusTableReport or str): Shared report for the run's eplustbl.csv, or a path
+            to the file
 
     Returns:
         dict: {
@@ -58,7 +68,8 @@ def extract_zone_area(filepath):
         }
     """
     # STEP 1: Extract and clean Zone Summary Table
-    df = extract_named_table(filepath, "Zone Summary", "Space Summary")
+    report = as_table_report(report)
+    df = report.table("Zone Summary", "Space Summary")
     df = clean_table_with_headers(df)
 
     df["Area [m2]"] = pd.to_numeric(df["Area [m2]"], errors="coerce")
@@ -75,14 +86,15 @@ def extract_zone_area(filepath):
     }
 
 
-def extract_construction_areas(filepath):
+def extract_construction_areas(report):
     """
     Parses the 'Zone Summary' and 'Skylight-Roof-Ratio' sections of eplustbl.csv to extract
     the total exterior wall area, window area, and roof area. These are used to normalize
     embodied carbon values for envelope-related measures.
 
     Parameters:
-        filepath (string): Path to the EnergyPlus simulation output CSV file (eplustbl.csv)
+        report (EplusTableReport or str): Shared report for the run's eplustbl.csv, or a path
+            to the file
 
     Returns:
         dict: {
@@ -93,7 +105,8 @@ def extract_construction_areas(filepath):
     """
 
     # STEP 1: Extract and clean Zone Summary Table
-    zone_df = extract_named_table(filepath, "Zone Summary", "Space Summary")
+    report = as_table_report(report)
+    zone_df = report.table("Zone Summary", "Space Summary")
     zone_df = clean_table_with_headers(zone_df)
 
     zone_df["Wall Area [m2]"] = pd.to_numeric(
@@ -106,7 +119,7 @@ def extract_construction_areas(filepath):
     window_area = zone_df["Window Area [m2]"].sum()
 
     # Step 3: Extract and clean Skylight-Roof Ratio Table
-    roof_df = extract_named_table(filepath, "Skylight-Roof Ratio", "PERFORMANCE")
+    roof_df = report.table("Skylight-Roof Ratio", "PERFORMANCE")
     roof_df = clean_table_with_headers(roof_df)
 
     # Transpose because this table is vertical (row keys)
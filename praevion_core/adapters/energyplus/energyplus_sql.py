@@ -0,0 +1,183 @@
+import sqlite3
+from pathlib import Path
+
+from praevion_core.adapters.energyplus.energyplus_kpis import GJ_TO_MMBTU, KPI_SUMMARY_TABLES
+
+
+class EplusSqlReport:
+    """
+    Read-only view over the tabular reports stored in an EnergyPlus eplusout.sql file.
+
+    Each summary table is fetched with a single parameterized query against the
+    `TabularDataWithStrings` view on first access and memoized, so all KPI extractors for a
+    run share one connection and never build DataFrames.
+
+    Parameters:
+        sql_path (str): Path to the eplusout.sql file
+    """
+
+    def __init__(self, sql_path):
+        self.sql_path = str(sql_path)
+        if not Path(self.sql_path).is_file():
+            raise FileNotFoundError(f"eplusout.sql not found at {self.sql_path}")
+
+        uri = Path(self.sql_path).resolve().as_uri() + "?mode=ro"
+        self._conn = sqlite3.connect(uri, uri=True)
+        self._tables = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        self._conn.close()
+
+    def table(self, table_name, report_for="Entire Facility"):
+        """
+        Returns the cells of one summary table as (row_name, column_name, units, value) tuples.
+
+        Parameters:
+            table_name (str): EnergyPlus table name (a key of KPI_SUMMARY_TABLES)
+            report_for (str): ReportForString filter, 'Entire Facility' for building totals
+
+        Returns:
+            list[tuple]: Table cells in storage order
+        """
+        key = (table_name, report_for)
+        if key not in self._tables:
+            rows = self._conn.execute(
+                """
+                SELECT RowName, ColumnName, Units, Value
+                FROM TabularDataWithStrings
+                WHERE ReportName = ? AND ReportForString = ? AND TableName = ?
+                """,
+                (KPI_SUMMARY_TABLES[table_name], report_for, table_name),
+            ).fetchall()
+            if not rows:
+                raise ValueError(f"Could not locate table '{table_name}' in {self.sql_path}")
+            self._tables[key] = rows
+
+        return self._tables[key]
+
+    def column(self, table_name, column_name, units=None):
+        """
+        Returns {row_name: float} for one column of a summary table. Blank or non-numeric
+        cells are skipped, matching `pd.to_numeric(errors="coerce")` followed by a sum.
+        """
+        values = {}
+        for row_name, col, col_units, value in self.table(table_name):
+            if col != column_name or (units is not None and col_units != units):
+                continue
+            try:
+                values[row_name] = float(value)
+            except (TypeError, ValueError):
+                continue
+        return values
+
+
+def as_sql_report(source):
+    """
+    Returns `source` unchanged if it is already an EplusSqlReport, otherwise opens the
+    eplusout.sql file at that path.
+    """
+    if isinstance(source, EplusSqlReport):
+        return source
+    return EplusSqlReport(source)
+
+
+def extract_total_energy_sql(report):
+    """
+    SQLite equivalent of `extract_total_energy`, reading the 'End Uses' table.
+
+    Like the CSV extractor, every row of the table (including 'Total End Uses') is summed,
+    so both backends return identical values for the same run.
+
+    Parameters:
+        report (EplusSqlReport or str): Shared report for the run's eplusout.sql, or a path
+
+    Returns:
+        dict: {
+            "electricity_mmbtu": float,
+            "natural_gas_mmbtu": float,
+            "site_energy_mmbtu": float
+        }
+    """
+    report = as_sql_report(report)
+
+    electricity = report.column("End Uses", "Electricity", units="GJ")
+    natural_gas = report.column("End Uses", "Natural Gas", units="GJ")
+
+    electricity_gj = sum(electricity.values())
+    natural_gas_gj = sum(natural_gas.values())
+
+    # Site total only counts rows where both fuels are reported (NaN + x drops out in pandas)
+    site_gj = sum(electricity[row] + natural_gas[row] for row in electricity if row in natural_gas)
+
+    return {
+        "electricity_mmbtu": electricity_gj * GJ_TO_MMBTU,
+        "natural_gas_mmbtu": natural_gas_gj * GJ_TO_MMBTU,
+        "site_energy_mmbtu": site_gj * GJ_TO_MMBTU,
+    }
+
+
+def extract_zone_area_sql(report):
+    """
+    SQLite equivalent of `extract_zone_area`, reading the 'Zone Summary' table.
+
+    Parameters:
+        report (EplusSqlReport or str): Shared report for the run's eplusout.sql, or a path
+
+    Returns:
+        dict: {
+            "apartment_floor_area_m2": float,
+            "non_apartment_floor_area_m2": float,
+            "total_floor_area_m2": float,
+            "apartment_count": int
+        }
+    """
+    report = as_sql_report(report)
+
+    # Zones are counted from the row names, areas only where the cell is numeric
+    zone_names = {row for row, col, _, _ in report.table("Zone Summary") if col == "Area"}
+    areas = report.column("Zone Summary", "Area", units="m2")
+
+    apartment_zones = {zone for zone in zone_names if "apartment" in zone.lower()}
+    apartment_area = sum(area for zone, area in areas.items() if zone in apartment_zones)
+    total_area = sum(areas.values())
+
+    return {
+        "apartment_floor_area_m2": apartment_area,
+        "non_apartment_floor_area_m2": total_area - apartment_area,
+        "total_floor_area_m2": total_area,
+        "apartment_count": len(apartment_zones),
+    }
+
+
+def extract_construction_areas_sql(report):
+    """
+    SQLite equivalent of `extract_construction_areas`, reading the 'Zone Summary' and
+    'Skylight-Roof Ratio' tables.
+
+    Parameters:
+        report (EplusSqlReport or str): Shared report for the run's eplusout.sql, or a path
+
+    Returns:
+        dict: {
+            "wall_area_m2": float,
+            "window_area_m2": float,
+            "roof_area_m2": float
+        }
+    """
+    report = as_sql_report(report)
+
+    wall_area = sum(report.column("Zone Summary", "Above Ground Gross Wall Area", "m2").values())
+    window_area = sum(report.column("Zone Summary", "Window Glass Area", "m2").values())
+
+    # The CSV extractor reads the first data column ('Total') of the 'Gross Roof Area' row
+    roof_area = report.column("Skylight-Roof Ratio", "Total", units="m2").get(
+        "Gross Roof Area", 0.0
+    )
+
+    return {"wall_area_m2": wall_area, "window_area_m2": window_area, "roof_area_m2": roof_area}
@@ -3,10 +3,96 @@ import io
 import pandas as pd
 
 
+class EplusTableReport:
+    """
+    Single-pass index over an EnergyPlus eplustbl.csv report.
+
+    The report is read once and the byte offset of every section heading (any non-blank line
+    that is not a table row, e.g. 'REPORT:,...', 'End Uses', 'Zone Summary') is recorded.
+    Tables are only parsed into DataFrames when first requested and are memoized, so all KPI
+    extractors for a run can share one object instead of re-reading the file per table.
+
+    Parameters:
+        filepath (str): Path to the eplustbl.csv file
+    """
+
+    def __init__(self, filepath):
+        self.filepath = filepath
+
+        with open(filepath, "rb") as f:
+            self._raw = f.read()
+
+        # (lowercased heading text, offset of heading line, offset of the line after it)
+        self._headings = []
+        self._tables = {}
+
+        offset = 0
+        for line in self._raw.splitlines(keepends=True):
+            next_offset = offset + len(line)
+            stripped = line.strip()
+            if stripped and not stripped.startswith(b","):
+                text = line.decode("utf-8").lower()
+                self._headings.append((text, offset, next_offset))
+            offset = next_offset
+
+    @property
+    def headings(self):
+        """list[str]: Section headings in file order (lowercased)."""
+        return [text.strip() for text, _, _ in self._headings]
+
+    def _locate(self, start_marker, end_marker):
+        start_marker = start_marker.lower()
+        end_marker = end_marker.lower()
+
+        start = None
+        for i, (text, _, body_start) in enumerate(self._headings):
+            if start is None and start_marker in text:
+                start = body_start
+            elif start is not None and end_marker in text:
+                return start, self._headings[i][1]
+
+        raise ValueError(f"Could not locate section: {start_marker} to {end_marker}")
+
+    def table(self, start_marker, end_marker):
+        """
+        Returns the raw table between two section headings, parsing it on first access.
+
+        The returned DataFrame is shared between callers; use `clean_table_with_headers`
+        (which copies) before modifying it.
+
+        Parameters:
+            start_marker (str): Heading text that signals the start of the table
+            end_marker (str): Heading text that signals the end of the table
+
+        Returns:
+            pd.DataFrame: DataFrame parsed from that section
+        """
+        key = (start_marker.lower(), end_marker.lower())
+        if key not in self._tables:
+            start, end = self._locate(start_marker, end_marker)
+            section = self._raw[start:end].decode("utf-8")
+            section_lines = [line for line in section.splitlines(keepends=True) if line.strip()]
+            self._tables[key] = pd.read_csv(io.StringIO("".join(section_lines)), header=None)
+
+        return self._tables[key]
+
+
+def as_table_report(source):
+    """
+    Returns `source` unchanged if it is already an EplusTableReport, otherwise indexes the
+    eplustbl.csv file at that path.
+    """
+    if isinstance(source, EplusTableReport):
+        return source
+    return EplusTableReport(source)
+
+
 def extract_named_table(filepath, start_marker, end_marker):
     """
     Extracts a tabular section from a messy EnergyPlus CSV report.
 
+    Prefer building one `EplusTableReport` per run when more than one table is needed.
+
     Parameters:
         filepath (str): Path to the .csv file
         start_marker (str): Line of text that signals the start of the table
@@ -15,29 +101,7 @@ def extract_named_table(filepath, start_marker, end_marker):
     Returns:
         pd.DataFrame: DataFrame parsed from that section
     """
-
-    with open(filepath, encoding="utf-8") as f:
-        lines = f.readlines()
-
-    # Find start and end of desired table
-    start = None
-    end = None
-    for i, line in enumerate(lines):
-        if start is None and start_marker.lower() in line.lower():
-            start = i
-        elif start is not None and end_marker.lower() in line.lower():
-            end = i
-            break
-
-    if start is None or end is None:
-        raise ValueError(f"Could not locate section: {start_marker} to {end_marker}")
-
-    # Extract and join into a CSV-compatible string
-    section_lines = lines[start + 1 : end]
-    section_lines = [line for line in section_lines if line.strip() != ""]
-
-    csv_content = "".join(section_lines)
-    return pd.read_csv(io.StringIO(csv_content), header=None)
+    return EplusTableReport(filepath).table(start_marker, end_marker)
 
 
 def clean_table_with_headers(df_raw):
@@ -66,7 +130,7 @@ def clean_table_with_headers(df_raw):
     new_header = df_raw.iloc[0].astype(str).str.strip().tolist()
 
     # Replace first column name if blank or nan
-    if not new_header[0] or new_header[0].lower() in ("nan", ""):
+    if not isinstance(new_header[0], str) or new_header[0].lower() in ("nan", ""):
         new_header[0] = "Zone"
 
     # Apply new headers and remove original header row
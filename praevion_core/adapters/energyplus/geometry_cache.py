@@ -0,0 +1,133 @@
+import json
+import math
+import os
+import random
+
+from praevion_core.config.paths import GEOMETRY_CACHE_DIR
+from praevion_core.pipelines.cache_utils import atomic_write_json, hash_file
+
+# Extractor outputs that only depend on the seed model geometry
+GEOMETRY_KEYS = ("zone_data", "surface_areas")
+
+
+class GeometryCache:
+    """
+    Persistent cache of zone and construction areas keyed by a content hash of the seed OSM.
+
+    None of the ECMs in ecm_options.json change geometry, so every run against the same seed
+    model reports identical areas. The first successful run fills the cache; later runs reuse
+    it. With `check_rate > 0`, that fraction of runs re-extracts the areas and verifies them
+    against the cached values; a mismatch invalidates the entry and the fresh values are used.
+
+    Parameters:
+        cache_dir (str): Directory holding one JSON file per seed model hash
+        check_rate (float): Fraction of cache hits to verify against the run's own report
+        seed (int | None): Random seed for the consistency-check sampler
+    """
+
+    def __init__(self, cache_dir=GEOMETRY_CACHE_DIR, check_rate=0.0, seed=None):
+        self.cache_dir = str(cache_dir)
+        self.check_rate = check_rate
+        self._rng = random.Random(seed)
+        self._memory = {}
+
+    def path_for(self, seed_hash):
+        return os.path.join(self.cache_dir, f"{seed_hash}.json")
+
+    def load(self, seed_hash):
+        """Returns cached geometry for a seed model hash, or None if not cached yet."""
+        if seed_hash in self._memory:
+            return self._memory[seed_hash]
+
+        path = self.path_for(seed_hash)
+        if not os.path.exists(path):
+            return None
+
+        with open(path) as f:
+            geometry = json.load(f)
+        self._memory[seed_hash] = geometry
+        return geometry
+
+    def store(self, seed_hash, geometry):
+        geometry = {key: _to_builtin(geometry[key]) for key in GEOMETRY_KEYS}
+        atomic_write_json(self.path_for(seed_hash), geometry)
+        self._memory[seed_hash] = geometry
+
+    def invalidate(self, seed_hash):
+        self._memory.pop(seed_hash, None)
+        path = self.path_for(seed_hash)
+        if os.path.exists(path):
+            os.remove(path)
+
+    def resolve(self, seed_file, extract_geometry):
+        """
+        Returns geometry for `seed_file`, calling `extract_geometry()` only on a cache miss or
+        when the run is sampled for a consistency check.
+
+        Parameters:
+            seed_file (str): Path to the seed .osm the run was generated from
+            extract_geometry (callable): Returns {"zone_data": dict, "surface_areas": dict}
+                from the current run's report
+
+        Returns:
+            dict: {"zone_data": dict, "surface_areas": dict}
+        """
+        seed_hash = hash_file(seed_file)
+        cached = self.load(seed_hash)
+
+        if cached is None:
+            geometry = extract_geometry()
+            self.store(seed_hash, geometry)
+            return geometry
+
+        if self.check_rate > 0 and self._rng.random() < self.check_rate:
+            geometry = extract_geometry()
+            if not geometry_matches(cached, geometry):
+                print(
+                    f"⚠️ Cached geometry for {os.path.basename(seed_file)} no longer matches "
+                    "this run's report — invalidating the geometry cache entry."
+                )
+                self.invalidate(seed_hash)
+                return geometry
+
+        return cached
+
+
+def geometry_matches(cached, fresh, rel_tol=1e-6, abs_tol=1e-6):
+    """Compares two geometry dicts value by value with a floating-point tolerance."""
+    for group in GEOMETRY_KEYS:
+        if set(cached[group]) != set(fresh[group]):
+            return False
+        for key, cached_val in cached[group].items():
+            fresh_val = float(fresh[group][key])
+            cached_val = float(cached_val)
+            if math.isnan(cached_val) and math.isnan(fresh_val):
+                continue
+            if not math.isclose(cached_val, fresh_val, rel_tol=rel_tol, abs_tol=abs_tol):
+                return False
+    return True
+
+
+def _to_builtin(values):
+    # numpy scalars → plain Python numbers so the cache stays valid JSON
+    return {key: val.item() if hasattr(val, "item") else val for key, val in values.items()}
+
+
+_geometry_cache = None
+
+
+def get_geometry_cache():
+    """
+    Returns the process-wide GeometryCache, or None if disabled with GEOMETRY_CACHE=off.
+    GEOMETRY_CACHE_CHECK_RATE sets the fraction of runs that are verified (default 0).
+    """
+    global _geometry_cache
+
+    if os.getenv("GEOMETRY_CACHE", "on").lower() in ("off", "0", "false"):
+        return None
+
+    if _geometry_cache is None:
+        _geometry_cache = GeometryCache(
+            check_rate=float(os.getenv("GEOMETRY_CACHE_CHECK_RATE", "0")),
+        )
+    return _geometry_cache
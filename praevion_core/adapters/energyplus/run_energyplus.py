@@ -0,0 +1,192 @@
+import os
+import shutil
+
+from praevion_core.config.paths import IDF_CACHE_DIR
+from praevion_core.pipelines.cache_utils import atomic_copy
+from praevion_core.pipelines.resource_usage import empty_usage, run_with_resource_usage
+from praevion_core.pipelines.scratch_dirs import (
+    abandon_scratch_dir,
+    make_scratch_dir,
+    scratch_root,
+)
+
+
+def run_energyplus(idf_path, weather_file, run_dir):
+    """
+    Runs the EnergyPlus binary directly on a translated IDF, skipping the OpenStudio Ruby
+    workflow (interpreter startup, measure application and OSM→IDF translation).
+
+    The executable is taken from ENERGYPLUS_EXE, the same way OPENSTUDIO_EXE selects the
+    OpenStudio CLI. Outputs (eplustbl.csv, eplusout.sql, ...) are written to `run_dir`, or to
+    a scratch directory standing in for it when RUN_SCRATCH_ROOT is set.
+
+    Parameters:
+        idf_path (str): Path to the IDF to simulate (e.g. a cached in.idf)
+        weather_file (str): Path to the .epw weather file
+        run_dir (str): Output directory for this run (recreated if it exists)
+
+    Returns:
+        dict: A result summary with the following fields:
+            - success (bool): Whether EnergyPlus completed without errors.
+            - stderr (bytes): Captured stderr output.
+            - stdout (bytes): Captured stdout output.
+            - log_path (str or None): Path to the run outputs, or None if the run failed.
+            - resource_usage (dict): Wall time, CPU time and peak RSS of the EnergyPlus process.
+            - persist_path (str or None): Persistent destination of a scratch run's artifacts.
+            - scratch_dir (str or None): Scratch tree to drop once the outputs are parsed.
+    """
+    work_dir = prepare_energyplus_run(run_dir)
+
+    try:
+        returncode, stdout, stderr, usage = run_with_resource_usage(
+            energyplus_command(idf_path, weather_file, work_dir), cwd=work_dir
+        )
+        success = returncode == 0
+
+    except Exception as e:
+        success = False
+        stderr, stdout = str(e).encode(), b"(no stdout captured)"
+        usage = empty_usage()
+
+    return energyplus_result(run_dir, work_dir, success, stdout, stderr, usage)
+
+
+def prepare_energyplus_run(run_dir):
+    """
+    Creates an empty output directory for an EnergyPlus run and returns it: `run_dir` itself,
+    or a scratch directory named after it when RUN_SCRATCH_ROOT is set.
+    """
+    if scratch_root() is not None:
+        return make_scratch_dir(f"{os.path.basename(os.path.normpath(run_dir))}_eplus")
+
+    if os.path.exists(run_dir):
+        shutil.rmtree(run_dir)
+    os.makedirs(run_dir)
+    return run_dir
+
+
+def energyplus_result(run_dir, work_dir, success, stdout, stderr, resource_usage):
+    """
+    Builds the result summary returned by `run_energyplus`. A failed scratch run is moved to
+    `run_dir` in full (for debugging), as an in-place run would have left it.
+    """
+    persist_path = scratch_dir = None
+    if work_dir != run_dir:
+        if success:
+            persist_path, scratch_dir = run_dir, work_dir
+        else:
+            abandon_scratch_dir(work_dir, run_dir)
+            work_dir = run_dir
+
+    return {
+        "success": success,
+        "stderr": stderr,
+        "stdout": stdout,
+        "log_path": work_dir if success else None,
+        "resource_usage": resource_usage,
+        "persist_path": persist_path,
+        "scratch_dir": scratch_dir,
+    }
+
+
+def energyplus_command(idf_path, weather_file, run_dir):
+    """Builds the EnergyPlus CLI command for an IDF (executable from ENERGYPLUS_EXE)."""
+    energyplus_exe = os.getenv("ENERGYPLUS_EXE", "C:/openstudio-3.9.0/EnergyPlus/energyplus.exe")
+    return [energyplus_exe, "-w", str(weather_file), "-d", str(run_dir), str(idf_path)]
+
+
+def run_idf_and_get_csv_path(idf_path, weather_file, run_dir):
+    """
+    Runs EnergyPlus on an IDF and returns the path to its eplustbl.csv.
+
+    Parameters:
+        idf_path (str): Path to the IDF to simulate
+        weather_file (str): Path to the .epw weather file
+        run_dir (str): Output directory for this run
+
+    Returns:
+        str: Path to the resulting eplustbl.csv file
+    """
+    return csv_path_from_energyplus_result(run_energyplus(idf_path, weather_file, run_dir))
+
+
+def csv_path_from_energyplus_result(result):
+    """Validates a `run_energyplus` result and returns the path to its eplustbl.csv."""
+    # Raise RuntimeError if the model fails to run
+    if not result["success"]:
+        stderr = result["stderr"].decode("utf-8", errors="replace")
+        stdout = result["stdout"].decode("utf-8", errors="replace")
+        raise RuntimeError(f"EnergyPlus run failed:\nSTDERR:\n{stderr}\n\nSTDOUT:\n{stdout}")
+
+    run_dir = result["log_path"]
+    csv_path = os.path.join(run_dir, "eplustbl.csv")
+    if not os.path.exists(csv_path):
+        raise FileNotFoundError(f"eplustbl.csv not found in {run_dir}")
+
+    return csv_path
+
+
+def idf_cache_key(sim_key: str, lean_output: bool) -> str:
+    """
+    IDF cache key of a simulation key. The captured in.idf includes the lean-output measure's
+    edits, which the simulation key does not cover, so lean and full-output IDFs are kept
+    apart.
+    """
+    return f"{sim_key}-lean" if lean_output else sim_key
+
+
+class IdfCache:
+    """
+    Translated IDFs keyed by `idf_cache_key` (the simulation key, i.e. canonical OSW steps,
+    seed OSM, EPW, measures, fidelity and OpenStudio version, plus the lean-output flag),
+    captured from the first OpenStudio run of each distinct model.
+
+    The simulation key is the result cache's, so a repeat of a key is always served from the
+    result cache first; the IDF cache is therefore only consulted (and filled) when
+    RESULT_CACHE is off.
+
+    Parameters:
+        cache_dir (str): Directory holding one .idf per simulation key
+    """
+
+    def __init__(self, cache_dir=IDF_CACHE_DIR):
+        self.cache_dir = str(cache_dir)
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, f"{key}.idf")
+
+    def get(self, key):
+        """Returns the cached IDF path for `key`, or None if it has not been captured."""
+        path = self.path_for(key)
+        return path if os.path.exists(path) else None
+
+    def store(self, key, run_dir):
+        """
+        Captures run_dir/in.idf (the final IDF after EnergyPlus measures) under `key`.
+        Must be called before `clean_output_dir`, which deletes in.idf.
+        """
+        idf_path = os.path.join(run_dir, "in.idf")
+        if not os.path.exists(idf_path):
+            return None
+        atomic_copy(idf_path, self.path_for(key))
+        return self.path_for(key)
+
+    def invalidate(self, key):
+        path = self.path_for(key)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+_idf_cache = None
+
+
+def get_idf_cache():
+    """Returns the process-wide IdfCache if enabled with IDF_CACHE=on (default off), else None."""
+    global _idf_cache
+
+    if os.getenv("IDF_CACHE", "off").lower() not in ("on", "1", "true"):
+        return None
+
+    if _idf_cache is None:
+        _idf_cache = IdfCache()
+    return _idf_cache
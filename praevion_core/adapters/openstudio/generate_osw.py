@@ -1,14 +1,177 @@
+import hashlib
 import json
 import os
 from pathlib import Path
 
+from praevion_core.adapters.energyplus.energyplus_kpis import KPI_SUMMARY_TABLES
+from praevion_core.config.fidelity import (
+    FULL_FIDELITY,
+    fidelity_run_periods,
+    get_fidelity_profile,
+)
 from praevion_core.config.paths import MODEL_DIR
 from praevion_core.pipelines.logging_utils import clean_and_prepare_osw_paths
 
+# Order in which measures are applied: envelope, windows, infiltration, then systems
+PREFERRED_MEASURE_ORDER = (
+    # Envelope first
+    "upgrade_wall_insulation",
+    "upgrade_roof_insulation",
+    # Windows
+    "upgrade_window_u_value",
+    "upgrade_window_shgc",
+    # Infiltration next
+    "adjust_infiltration_rates",
+    # Systems
+    "upgrade_hvac_system_choice",
+    "upgrade_dhw_to_hpwh",
+)
+
+# EnergyPlus measure appended in lean-output mode (under openstudio_measures/)
+LEAN_OUTPUT_MEASURE_DIR = "reporting/set_lean_output_reports"
+
+# EnergyPlus measure applying reduced-fidelity profiles (see config/fidelity.py)
+FIDELITY_MEASURE_DIR = "simulation/set_simulation_fidelity"
+
+
+def canonical_option(measure_info, selection) -> str:
+    """
+    Maps a selected value onto the spelling listed in ecm_options.json, so '0.4', 0.4 and
+    '0.40' (or 'r-10' and 'R-10') all produce the same measure argument.
+
+    Parameters:
+        measure_info (dict): The measure's entry in ecm_options.json
+        selection: Selected option as it appears in the config
+
+    Returns:
+        str: Canonical option string (the stripped input if no listed option matches)
+    """
+    selection = str(selection).strip()
+    options = [str(option) for option in measure_info.get("options", [])]
+    if selection in options:
+        return selection
+
+    try:
+        numeric = float(selection)
+    except ValueError:
+        numeric = None
+
+    for option in options:
+        if option.lower() == selection.lower():
+            return option
+        if numeric is not None:
+            try:
+                if float(option) == numeric:
+                    return option
+            except ValueError:
+                continue
+
+    return selection
+
+
+def canonical_measure_steps(config, ecm_options):
+    """
+    Builds the ordered, canonical OSW steps for an ECM config.
+
+    Argument values are normalized with `canonical_option`, and steps whose selection is the
+    measure's `noop_option` (the choice each measure.rb returns early on without touching the
+    model) are dropped, so physically identical configs produce identical step lists.
+
+    Parameters:
+        config (dict): ECM configuration {measure_name: option}
+        ecm_options (dict): Parsed ecm_options.json
+
+    Returns:
+        list[tuple[str, dict]]: (measure_name, OSW step) pairs in application order
+    """
+    ordered = [m for m in PREFERRED_MEASURE_ORDER if m in ecm_options and m in config]
+    ordered += [m for m in config if m not in ordered and m in ecm_options]
+
+    steps = []
+    for measure_name in ordered:
+        measure_info = ecm_options[measure_name]
+
+        # 'measure_dir' is expected to end in category/dir_name
+        full_path = measure_info.get("measure_dir", "").strip()
+        if not full_path:
+            raise ValueError(f"Missing 'measure_dir' for {measure_name} in ecm_options.json")
+
+        step = {"measure_dir_name": os.path.basename(full_path)}
+        argument_key = measure_info.get("argument_key")
+        if argument_key:
+            selection = canonical_option(measure_info, config[measure_name])
+            if selection == measure_info.get("noop_option"):
+                continue
+            step["arguments"] = {argument_key: selection}
+
+        steps.append((measure_name, step))
+
+    return steps
 
-def generate_osw_from_config(config, ecm_options_path, output_path, seed_file, weather_file):
+
+def lean_output_enabled() -> bool:
+    """Whether OSWs get the lean-output reporting step (LEAN_OUTPUT=on, default off)."""
+    return os.getenv("LEAN_OUTPUT", "off").lower() in ("on", "1", "true")
+
+
+def lean_output_step() -> dict:
     """
-    Generates an OpenStudio Workflow (.osw) file from a configuration dictionary of ECMs.
+    OSW step that limits EnergyPlus output to the summary reports the KPI extractors read.
+
+    The reports are derived from KPI_SUMMARY_TABLES, so a table added to the extractors is
+    written automatically. eplusout.sql is kept with tabular data only, which the SQL backend
+    needs and which stays small once time-series outputs are gone.
+    """
+    reports = sorted(set(KPI_SUMMARY_TABLES.values()))
+    return {
+        "measure_dir_name": os.path.basename(LEAN_OUTPUT_MEASURE_DIR),
+        "arguments": {"summary_reports": ",".join(reports), "keep_sqlite": True},
+    }
+
+
+def fidelity_step(fidelity: str) -> dict | None:
+    """
+    OSW step applying a named fidelity profile (FIDELITY_PROFILES), or None for full fidelity.
+
+    Unset profile settings are passed as 0 / empty, which the measure leaves unchanged.
+    """
+    profile = get_fidelity_profile(fidelity)
+    if not profile:
+        return None
+    return {
+        "measure_dir_name": os.path.basename(FIDELITY_MEASURE_DIR),
+        "arguments": {
+            "timesteps_per_hour": profile.get("timesteps_per_hour") or 0,
+            "shadow_calculation_frequency": profile.get("shadow_calculation_frequency") or 0,
+            "run_periods": ",".join(fidelity_run_periods(fidelity)),
+        },
+    }
+
+
+def canonical_steps_hash(steps) -> str:
+    """
+    Returns the SHA-256 of canonical OSW steps (as produced by `canonical_measure_steps`).
+    Configs that only differ by no-op selections or value spelling share a hash.
+    """
+    payload = [step for _, step in steps]
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+def generate_osw_from_config(
+    config,
+    ecm_options_path,
+    output_path,
+    seed_file,
+    weather_file,
+    start_step=0,
+    stop_step=None,
+    lean_output=False,
+    fidelity=FULL_FIDELITY,
+):
+    """
+    Generates a canonical OpenStudio Workflow (.osw) file from a configuration dictionary
+    of ECMs. No-op selections are left out and argument values are normalized (see
+    `canonical_measure_steps`).
 
     Parameters:
         config (dict): ECM configuration {measure_name: option}
@@ -16,6 +179,13 @@ def generate_osw_from_config(config, ecm_options_path, output_path, seed_file, w
         output_path (str): Path to save the generated .osw file
         seed_file (str): Path to the baseline .osm model
         weather_file (str): Path to the .epw weather file
+        start_step (int): Index of the first canonical step to include (earlier steps are
+            already applied to `seed_file`, e.g. a cached measure-prefix model)
+        stop_step (int | None): Index after the last canonical step to include
+        lean_output (bool): Append the lean-output EnergyPlus measure (see `lean_output_step`);
+            ignored for partial workflows (`stop_step` set), which never reach EnergyPlus
+        fidelity (str): Simulation fidelity profile (see `fidelity_step`); like `lean_output`,
+            only applied to complete workflows
 
     Returns:
         str: Absolute path to the generated .osw file
@@ -37,69 +207,40 @@ def generate_osw_from_config(config, ecm_options_path, output_path, seed_file, w
     # Root where all measures live in your new layout
     measures_root = os.path.join(str(MODEL_DIR), "openstudio_measures")
 
-    # Preferred ordering
-    preferred_order_candidates = [
-        # Envelope first
-        "upgrade_wall_insulation",
-        "upgrade_roof_insulation",
-        # Windows
-        "upgrade_window_u_value",
-        "upgrade_window_shgc",
-        # Infiltration next
-        "adjust_infiltration_rates",
-        # Systems
-        "upgrade_hvac_system_choice",
-        "upgrade_dhw_to_hpwh",
-    ]
-    preferred_order = [m for m in preferred_order_candidates if m in ecm_options and m in config]
-
-    # Track already-applied measures to avoid duplicates
-    applied_measures = set()
-    measure_paths = set()  # unique parent directories of measure folders (OSW 'measure_paths')
-
-    # Utility function to append a measure step
-    def append_measure_step(measure_name):
-        selection = str(config[measure_name]).strip()
-        measure_info = ecm_options[measure_name]
-
-        # Get folder structure from ECM options
-        full_path = measure_info.get("measure_dir", "").strip()
-        if not full_path:
-            raise ValueError(f"Missing 'measure_dir' for {measure_name} in {ecm_options_path}")
-        # 'measure_dir' is expected to be category/dir_name
-        parent_dir, measure_dir_name = os.path.split(full_path)
+    # unique parent directories of measure folders (OSW 'measure_paths')
+    measure_paths = set()
 
+    # 1) Add the canonical measure steps in preferred order
+    steps = canonical_measure_steps(config, ecm_options)[start_step:stop_step]
+    for measure_name, step in steps:
         # Resolve absolute parent path under the measures root
+        parent_dir = os.path.dirname(ecm_options[measure_name]["measure_dir"].strip())
         abs_parent_path = os.path.abspath(os.path.join(measures_root, parent_dir))
         measure_paths.add(abs_parent_path.replace("\\", "/"))
 
-        # Build the step
-        step = {"measure_dir_name": measure_dir_name}
-        argument_key = measure_info.get("argument_key")
-        if argument_key:
-            step["arguments"] = {argument_key: selection}
-
         osw["steps"].append(step)
-        applied_measures.add(measure_name)
 
-    # 1) Add all measures in preferred order
-    for m in preferred_order:
-        append_measure_step(m)
+    # Reduced fidelity: coarser timestep/shading and representative weeks (EnergyPlus measure)
+    reduced_fidelity = fidelity_step(fidelity)
+    if reduced_fidelity is not None and stop_step is None:
+        fidelity_parent = os.path.dirname(os.path.join(measures_root, FIDELITY_MEASURE_DIR))
+        measure_paths.add(os.path.abspath(fidelity_parent).replace("\\", "/"))
+        osw["steps"].append(reduced_fidelity)
 
-    # 2) Add any remaining measures present in config & options (not already added)
-    for m in config:
-        if m not in applied_measures and m in ecm_options:
-            append_measure_step(m)
+    # Lean output: suppress reports nobody reads (runs after all model measures)
+    if lean_output and stop_step is None:
+        lean_parent = os.path.dirname(os.path.join(measures_root, LEAN_OUTPUT_MEASURE_DIR))
+        measure_paths.add(os.path.abspath(lean_parent).replace("\\", "/"))
+        osw["steps"].append(lean_output_step())
 
-    # 3) Attach measure paths (normalized, unique)
-    osw["measure_paths"] = list(measure_paths)
+    # 2) Attach measure paths (normalized, unique)
     osw["measure_paths"] = [os.path.abspath(p).replace("\\", "/") for p in measure_paths]
 
-    # 4) Clean previous OSW + run dir (derive run dir robustly)
+    # 3) Clean previous OSW + run dir (derive run dir robustly)
     osw_dir = str(Path(output_path).with_suffix("")) + "_run"
     clean_and_prepare_osw_paths(output_path, osw_dir)
 
-    # 5) Final validations and write
+    # 4) Final validations and write
     assert os.path.isfile(seed_file), f"Seed file missing: {seed_file}"
     assert os.path.isfile(weather_file), f"Weather file missing: {weather_file}"
 
@@ -0,0 +1,253 @@
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import dataclass
+
+from praevion_core.adapters.openstudio.generate_osw import (
+    canonical_measure_steps,
+    generate_osw_from_config,
+)
+from praevion_core.adapters.openstudio.run_osw import run_osw_and_organize_logs
+from praevion_core.config.paths import MEASURES_DIR, MODEL_CACHE_DIR
+from praevion_core.pipelines.cache_utils import atomic_copy, hash_directory, hash_file
+from praevion_core.pipelines.result_cache import openstudio_version
+
+# Leading measures whose combined model is materialized and shared across configs. These are
+# the envelope steps, which hundreds of configs have in common ahead of the system upgrades.
+PREFIX_MEASURES = (
+    "upgrade_wall_insulation",
+    "upgrade_roof_insulation",
+    "upgrade_window_u_value",
+    "upgrade_window_shgc",
+    "adjust_infiltration_rates",
+)
+
+
+@dataclass(frozen=True)
+class PrefixPlan:
+    """Outcome of a prefix-cache lookup (see `MeasurePrefixCache.plan`)."""
+
+    seed_file: str  # model to start from: the deepest cached prefix, or the seed
+    start_step: int  # canonical steps already applied to seed_file
+    build_depth: int | None = None  # prefix depth to materialize first, if any
+    build_key: str | None = None
+
+
+class MeasurePrefixCache:
+    """
+    Cache of intermediate OpenStudio models keyed by the canonical measure-step prefix that
+    produced them.
+
+    Keys are hash-chained (key_i = sha256(key_{i-1} + step_i), rooted in the seed model, the
+    measure sources and the OpenStudio version), so the cache forms an implicit trie over
+    step sequences: a config resumes from the deepest prefix any earlier config has stored
+    and only applies its remaining measures.
+
+    Materializing a prefix costs an extra `openstudio run --measures_only`, which only pays
+    off if later configs reuse it. Every resolve therefore counts a sighting for each prefix
+    depth, and a prefix is built once it has been seen `min_uses` times; the deepest such
+    prefix is chosen, so shallow prefixes shared by many configs (e.g. wall + roof) get
+    built long before the full envelope combinations repeat.
+
+    Parameters:
+        cache_dir (str): Directory holding one .osm per cached prefix
+        prefix_measures (tuple): Leading measures that make up the materialized prefix
+        min_uses (int): Sightings of a prefix before it is materialized
+    """
+
+    def __init__(self, cache_dir=MODEL_CACHE_DIR, prefix_measures=PREFIX_MEASURES, min_uses=2):
+        self.cache_dir = str(cache_dir)
+        self.prefix_measures = tuple(prefix_measures)
+        self.min_uses = max(1, int(min_uses))
+
+    def path_for(self, key):
+        return os.path.join(self.cache_dir, f"{key}.osm")
+
+    def prefix_keys(self, seed_file, steps, measures_dir=MEASURES_DIR, version=None):
+        """
+        Returns len(steps) + 1 chained keys; keys[i] identifies the model after steps[:i].
+
+        Parameters:
+            seed_file (str): Path to the baseline .osm model
+            steps (list): Canonical (measure_name, step) pairs from `canonical_measure_steps`
+            measures_dir (str): Root of the OpenStudio measures applied by the workflow
+            version (str | None): OpenStudio version (defaults to `openstudio_version()`)
+        """
+        root = {
+            "seed_file": hash_file(seed_file),
+            "measures": hash_directory(measures_dir),
+            "openstudio_version": version if version is not None else openstudio_version(),
+        }
+        keys = [hashlib.sha256(json.dumps(root, sort_keys=True).encode()).hexdigest()]
+        for _, step in steps:
+            link = keys[-1] + json.dumps(step, sort_keys=True)
+            keys.append(hashlib.sha256(link.encode()).hexdigest())
+        return keys
+
+    def prefix_depth(self, steps):
+        """Number of leading steps that belong to the shared (materialized) prefix."""
+        depth = 0
+        for measure_name, _ in steps:
+            if measure_name not in self.prefix_measures:
+                break
+            depth += 1
+        return depth
+
+    def deepest(self, keys, max_depth):
+        """
+        Returns (depth, model_path) for the deepest cached prefix with depth <= max_depth,
+        or (0, None) if no prefix is cached.
+        """
+        for depth in range(max_depth, 0, -1):
+            path = self.path_for(keys[depth])
+            if os.path.exists(path):
+                return depth, path
+        return 0, None
+
+    def record_sighting(self, key) -> int:
+        """
+        Counts one more config needing the prefix `key` and returns its sighting count. The
+        count is the size of an append-only marker file, so workers share it without locks.
+        """
+        seen_dir = os.path.join(self.cache_dir, "seen")
+        os.makedirs(seen_dir, exist_ok=True)
+        path = os.path.join(seen_dir, key)
+        fd = os.open(path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, b".")
+        finally:
+            os.close(fd)
+        return os.path.getsize(path)
+
+    def build_depth(self, keys, cached_depth, target):
+        """
+        Records a sighting of every uncached prefix deeper than `cached_depth` (up to
+        `target`) and returns the deepest one seen at least `min_uses` times, or
+        `cached_depth` when none is worth building yet.
+        """
+        depth = cached_depth
+        for i in range(cached_depth + 1, target + 1):
+            if self.record_sighting(keys[i]) >= self.min_uses:
+                depth = i
+        return depth
+
+    def store(self, key, osm_path):
+        """Copies a model into the cache atomically (readers never see a partial file)."""
+        atomic_copy(osm_path, self.path_for(key))
+        return self.path_for(key)
+
+    def plan(self, config, ecm_options_path, seed_file):
+        """
+        Looks up the cached prefixes of a config and decides whether a deeper one is worth
+        materializing (see `build_depth`).
+
+        Parameters:
+            config (dict): ECM configuration {measure_name: option}
+            ecm_options_path (str): Path to the ecm_options.json file
+            seed_file (str): Path to the baseline .osm model
+
+        Returns:
+            PrefixPlan: The model to start from, and the prefix to build first (if any)
+        """
+        with open(ecm_options_path) as f:
+            ecm_options = json.load(f)
+
+        steps = canonical_measure_steps(config, ecm_options)
+        target = self.prefix_depth(steps)
+        if target == 0:
+            return PrefixPlan(seed_file, 0)
+
+        keys = self.prefix_keys(seed_file, steps)
+        depth, model_path = self.deepest(keys, target)
+        if depth == target:
+            return PrefixPlan(model_path, depth)
+
+        build_depth = self.build_depth(keys, depth, target)
+        if build_depth == depth:
+            return PrefixPlan(model_path or seed_file, depth)
+        return PrefixPlan(model_path or seed_file, depth, build_depth, keys[build_depth])
+
+    def prefix_osw(self, plan, config, ecm_options_path, weather_file, work_dir, run_id):
+        """Writes the OSW applying a plan's missing prefix steps to its start model."""
+        return generate_osw_from_config(
+            config=config,
+            ecm_options_path=ecm_options_path,
+            output_path=os.path.join(work_dir, f"{run_id}_prefix.osw"),
+            seed_file=plan.seed_file,
+            weather_file=weather_file,
+            start_step=plan.start_step,
+            stop_step=plan.build_depth,
+        )
+
+    def finish(self, plan, result, run_id):
+        """
+        Stores the model of a plan's measures-only run and returns (seed_file, start_step) to
+        simulate from; falls back to the plan's start model if the run failed.
+        """
+        try:
+            in_osm = os.path.join(result["log_path"] or "", "in.osm")
+            if not result["success"] or not os.path.exists(in_osm):
+                print(f"⚠️ Could not materialize measure prefix for {run_id} — using full chain.")
+                return plan.seed_file, plan.start_step
+
+            print(f"🧱 Cached measure prefix ({plan.build_depth} steps) for {run_id}")
+            return self.store(plan.build_key, in_osm), plan.build_depth
+
+        finally:
+            # Prefix runs are only needed for in.osm: drop the whole scratch tree if any
+            if result["scratch_dir"] or result["log_path"]:
+                shutil.rmtree(result["scratch_dir"] or result["log_path"], ignore_errors=True)
+
+    def resolve(self, config, ecm_options_path, seed_file, weather_file, work_dir, run_id):
+        """
+        Returns the model a config's simulation should start from, and how many of its
+        canonical steps that model already includes.
+
+        When a prefix deeper than the cached ones has been seen `min_uses` times, it is
+        materialized with `openstudio run --measures_only` from the deepest cached ancestor
+        and stored. Otherwise, or on any failure, the deepest cached prefix is used. The
+        async evaluator runs the same `plan` / `prefix_osw` / `finish` steps, with the
+        measures-only run on its own subprocess runner.
+
+        Parameters:
+            config (dict): ECM configuration {measure_name: option}
+            ecm_options_path (str): Path to the ecm_options.json file
+            seed_file (str): Path to the baseline .osm model
+            weather_file (str): Path to the .epw weather file
+            work_dir (str): Directory for the prefix OSW and its run folder
+            run_id (str): Label of the simulation the prefix is built for
+
+        Returns:
+            tuple:
+                - seed_file (str): Path to the model to use as the OSW seed
+                - start_step (int): Number of canonical steps already applied to it
+        """
+        plan = self.plan(config, ecm_options_path, seed_file)
+        if plan.build_key is None:
+            return plan.seed_file, plan.start_step
+
+        prefix_osw = self.prefix_osw(plan, config, ecm_options_path, weather_file, work_dir, run_id)
+        result = run_osw_and_organize_logs(
+            prefix_osw, os.path.join(work_dir, "prefix_runs"), measures_only=True
+        )
+        return self.finish(plan, result, run_id)
+
+
+_model_cache = None
+
+
+def get_model_cache():
+    """
+    Returns the process-wide MeasurePrefixCache if enabled with MODEL_CACHE=on (default off),
+    else None. MODEL_CACHE_MIN_USES (default 2) sets how often a prefix must be seen before
+    it is materialized.
+    """
+    global _model_cache
+
+    if os.getenv("MODEL_CACHE", "off").lower() not in ("on", "1", "true"):
+        return None
+
+    if _model_cache is None:
+        _model_cache = MeasurePrefixCache(min_uses=int(os.getenv("MODEL_CACHE_MIN_USES", "2")))
+    return _model_cache
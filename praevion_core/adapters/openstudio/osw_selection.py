@@ -1,4 +1,5 @@
 import json
+import os
 
 
 def extract_measure_selections(osw_path):
@@ -36,3 +37,43 @@ def extract_measure_selections(osw_path):
             selections[f"{measure}.{key}"] = val
 
     return selections
+
+
+def extract_seed_file(osw_path):
+    """
+    Returns the seed model (.osm) path referenced by an OpenStudio Workflow (.osw) file.
+
+    Parameters:
+        osw_path (str): Path to the .osw workflow file
+
+    Returns:
+        str: Path to the seed .osm file
+    """
+    with open(osw_path) as f:
+        return json.load(f)["seed_file"]
+
+
+def selections_from_config(config, ecm_options):
+    """
+    Builds the same measure.argument → value mapping that `extract_measure_selections` reads
+    back from a generated .osw, directly from an ECM config (no workflow file needed).
+
+    Parameters:
+        config (dict): ECM configuration {measure_name: option}
+        ecm_options (dict): Parsed ecm_options.json
+
+    Returns:
+        dict: {
+            "measure_dir_name.argument_name": value (str)
+        }
+    """
+    selections = {}
+    for measure_name, option in config.items():
+        measure_info = ecm_options.get(measure_name)
+        if not isinstance(measure_info, dict) or not measure_info.get("argument_key"):
+            continue
+
+        measure_dir_name = os.path.basename(measure_info["measure_dir"].strip())
+        selections[f"{measure_dir_name}.{measure_info['argument_key']}"] = str(option).strip()
+
+    return selections
@@ -1,9 +1,16 @@
 import os
 import shutil
-import subprocess
 
+from praevion_core.pipelines.resource_usage import empty_usage, run_with_resource_usage
+from praevion_core.pipelines.scratch_dirs import (
+    abandon_scratch_dir,
+    in_scratch,
+    make_scratch_dir,
+    scratch_root,
+)
 
-def run_osw_and_organize_logs(osw_path, run_logs_dir):
+
+def run_osw_and_organize_logs(osw_path, run_logs_dir, measures_only=False):
     """
     Runs an OpenStudio workflow (.osw) in a clean subdirectory and moves its output logs.
 
@@ -18,9 +25,14 @@ def run_osw_and_organize_logs(osw_path, run_logs_dir):
     - Captures and returns stdout/stderr
     - Moves successful run outputs to `7-run_logs/`
 
+    With RUN_SCRATCH_ROOT set, the run directory is created in scratch space (e.g. /dev/shm)
+    and successful outputs stay there until `clean_output_dir` copies back the whitelisted
+    artifacts to `persist_path` and drops the scratch tree.
+
     Parameters:
         osw_path (str): Path to the OpenStudio Workflow (.osw) file to execute.
         run_logs_dir (str): Destination folder for organized run outputs (e.g., "7-run_logs/").
+        measures_only (bool): Only apply the measures (writes run/in.osm, skips EnergyPlus).
 
     Returns:
         dict: A result summary with the following fields:
@@ -29,63 +41,104 @@ def run_osw_and_organize_logs(osw_path, run_logs_dir):
             - stderr (bytes or str): Captured stderr output, if available.
             - stdout (bytes or str): Captured stdout output, if available.
             - log_path (str or None): Path to moved run logs, or None if the run failed.
+            - resource_usage (dict): Wall time, CPU time and peak RSS of the OpenStudio process.
+            - persist_path (str or None): Persistent destination of a scratch run's artifacts.
+            - scratch_dir (str or None): Scratch tree to drop once the outputs are parsed.
+    """
+    # Create isolated run directory: 05_osws/test_name_run/
+    test_name, osw_dir, new_osw_path = prepare_osw_run(osw_path)
+
+    # attempt to run the OpenStudio Ruby Measure
+    try:
+        returncode, stdout, stderr, usage = run_with_resource_usage(
+            openstudio_command(new_osw_path, measures_only), cwd=osw_dir
+        )
+        success = returncode == 0
+
+    except Exception as e:
+        success = False
+        stderr, stdout = str(e), "(no stdout captured)"
+        usage = empty_usage()
+
+    return organize_run_outputs(
+        test_name, osw_dir, run_logs_dir, success, stdout, stderr, resource_usage=usage
+    )
+
+
+def prepare_osw_run(osw_path):
+    """
+    Creates the isolated run directory for an .osw (05_osws/test_name_run/, or
+    RUN_SCRATCH_ROOT/test_name_run/ in scratch mode) and copies the workflow into it.
+
+    Parameters:
+        osw_path (str): Path to the OpenStudio Workflow (.osw) file to execute.
+
+    Returns:
+        tuple:
+            - test_name (str): Identifier for this run, derived from the .osw filename.
+            - osw_dir (str): Isolated run directory (the subprocess working directory).
+            - new_osw_path (str): Path to the copied .osw inside osw_dir.
     """
     # Extract test name from file
     test_name = os.path.splitext(os.path.basename(osw_path))[0]
 
-    # Create isolated run directory: 05_osws/test_name_run/
-    osw_dir = os.path.join(os.path.dirname(osw_path), f"{test_name}_run")
-    os.makedirs(osw_dir, exist_ok=True)
+    # Create isolated run directory: 05_osws/test_name_run/ (OSW paths are absolute, so the
+    # workflow runs unchanged from a RAM-backed scratch directory)
+    if scratch_root() is not None:
+        osw_dir = make_scratch_dir(f"{test_name}_run")
+    else:
+        osw_dir = os.path.join(os.path.dirname(osw_path), f"{test_name}_run")
+        os.makedirs(osw_dir, exist_ok=True)
 
     # Copy the OSW into that directory and redefine the path
     new_osw_path = os.path.join(osw_dir, os.path.basename(osw_path))
     shutil.copy(osw_path, new_osw_path)
 
-    # attempt to run the OpenStudio Ruby Measure
-    try:
-        openstudio_exe = os.getenv("OPENSTUDIO_EXE", "C:/openstudio-3.9.0/bin/openstudio.exe")
-        result = subprocess.run(
-            [openstudio_exe, "run", "-w", new_osw_path],
-            cwd=osw_dir,
-            capture_output=True,
-            text=True,
-            check=True,
-        )
-        success = True
+    return test_name, osw_dir, new_osw_path
 
-    except subprocess.CalledProcessError as e:
-        result = e
-        success = False
 
-    except Exception as e:
-        result = e
-        success = False
+def openstudio_command(osw_path, measures_only=False):
+    """Builds the OpenStudio CLI command for a workflow (executable from OPENSTUDIO_EXE)."""
+    openstudio_exe = os.getenv("OPENSTUDIO_EXE", "C:/openstudio-3.9.0/bin/openstudio.exe")
+    command = [openstudio_exe, "run", "-w", osw_path]
+    if measures_only:
+        command.insert(2, "--measures_only")
+    return command
 
-    # Move results to run_logs_dir
+
+def organize_run_outputs(
+    test_name, osw_dir, run_logs_dir, success, stdout, stderr, resource_usage=None
+):
+    """
+    Moves a successful run's outputs into `run_logs_dir` and builds the result summary
+    returned by `run_osw_and_organize_logs`.
+    """
     run_dir = os.path.join(osw_dir, "run")
     destination = os.path.join(run_logs_dir, test_name)
-    if success and os.path.exists(run_dir):
+    log_path = destination if success else None
+    persist_path = scratch_dir = None
+
+    if in_scratch(osw_dir):
+        if success and os.path.exists(run_dir):
+            # Parse in place; clean_output_dir persists the whitelist and drops the tree
+            log_path, persist_path, scratch_dir = run_dir, destination, osw_dir
+        else:
+            # Keep failed runs in full for debugging, as in-place runs keep their _run folder
+            abandon_scratch_dir(osw_dir, destination)
+
+    # Move results to run_logs_dir
+    elif success and os.path.exists(run_dir):
         if os.path.exists(destination):
             shutil.rmtree(destination)
         shutil.move(run_dir, destination)
 
-    # Default empty values
-    stderr = stdout = "(not available)"
-
-    # Extract stdout/stderr if result is a subprocess result or exception
-    if isinstance(result, subprocess.CalledProcessError) or isinstance(
-        result, subprocess.CompletedProcess
-    ):
-        stderr = result.stderr.encode() if isinstance(result.stderr, str) else result.stderr
-        stdout = result.stdout.encode() if isinstance(result.stdout, str) else result.stdout
-    elif isinstance(result, Exception):
-        stderr = str(result)
-        stdout = "(no stdout captured)"
-
     return {
         "test_name": test_name,
         "success": success,
         "stderr": stderr,
         "stdout": stdout,
-        "log_path": destination if success else None,
+        "log_path": log_path,
+        "resource_usage": resource_usage or empty_usage(),
+        "persist_path": persist_path,
+        "scratch_dir": scratch_dir,
     }
@@ -20,6 +20,21 @@ def run_osw_and_get_csv_path(osw_path, run_logs_dir):
     # Run OpenStudio simulation using provided .osw configuration
     result = run_osw_and_organize_logs(osw_path, run_logs_dir)
 
+    return csv_path_from_run_result(result)
+
+
+def csv_path_from_run_result(result):
+    """
+    Validates a `run_osw_and_organize_logs` result and locates its eplustbl.csv.
+
+    Parameters:
+        result (dict): Result summary from an OpenStudio run
+
+    Returns:
+        tuple:
+            - csv_path (str): Path to the resulting eplustbl.csv file
+            - run_dir (str): Directory where simulation output was moved
+    """
     # Raise RuntimeError if the model fails to run
     if not result["success"]:
         stderr = result.get("stderr", b"").decode("utf-8")
@@ -0,0 +1,166 @@
+import json
+import os
+
+import numpy as np
+from ConfigSpace import ForbiddenAndConjunction, ForbiddenEqualsClause, ForbiddenInClause
+
+from praevion_core.config.paths import ECM_DIR
+
+# Section of ecm_options.json holding the declarative constraints (not a measure)
+CONSTRAINTS_KEY = "constraints"
+
+
+def measure_options(ecm_options: dict) -> dict:
+    """The measure entries of a parsed ecm_options.json (without the constraints section)."""
+    return {name: info for name, info in ecm_options.items() if name != CONSTRAINTS_KEY}
+
+
+def load_ecm_options(path=None) -> dict:
+    """Parses ecm_options.json (defaults to the one under ECM_DIR)."""
+    with open(path or os.path.join(ECM_DIR, "ecm_options.json")) as f:
+        return json.load(f)
+
+
+def forbidden_clauses(space, constraints: list[dict]) -> list:
+    """
+    Compiles declarative constraints into ConfigSpace forbidden clauses.
+
+    Each constraint's "forbid" maps measures to the options that may not be combined: a config
+    is forbidden when every listed measure takes one of its listed options.
+
+    Parameters:
+        space (ConfigurationSpace): Space holding the constrained hyperparameters
+        constraints (list[dict]): The "constraints" section of ecm_options.json
+
+    Returns:
+        list: ForbiddenAndConjunction (or single Forbidden*Clause) objects
+    """
+    clauses = []
+    for constraint in constraints:
+        components = []
+        for measure, options in constraint["forbid"].items():
+            hp = space[measure]
+            if len(options) == 1:
+                components.append(ForbiddenEqualsClause(hp, options[0]))
+            else:
+                components.append(ForbiddenInClause(hp, options))
+        clauses.append(
+            ForbiddenAndConjunction(*components) if len(components) > 1 else components[0]
+        )
+    return clauses
+
+
+class ConstraintIndex:
+    """
+    Valid-config bitmap over the mixed-radix index of the measure options.
+
+    A config's index is the mixed-radix number formed by its option positions (measures and
+    options in ecm_options.json order, last measure varying fastest). The bitmap holds one
+    bool per index, so validity checks are a single lookup, and batches of encoded configs
+    are checked with one fancy-indexing operation.
+
+    Parameters:
+        ecm_options (dict): Parsed ecm_options.json, including its "constraints" section
+    """
+
+    def __init__(self, ecm_options: dict):
+        measures = measure_options(ecm_options)
+        self.names = list(measures)
+        self.choices = [list(info["options"]) for info in measures.values()]
+        self.defaults = {name: info.get("noop_option") for name, info in measures.items()}
+        self.constraints = ecm_options.get(CONSTRAINTS_KEY, [])
+
+        sizes = [len(choices) for choices in self.choices]
+        self.radix = np.cumprod([1] + sizes[:0:-1])[::-1].astype(np.int64)
+        self._measures = set(self.names)
+        self._positions = [
+            {choice: i for i, choice in enumerate(choices)} for choices in self.choices
+        ]
+
+        grid = np.indices(sizes).reshape(len(sizes), -1).T
+        forbidden = np.zeros(len(grid), dtype=bool)
+        for constraint in self.constraints:
+            mask = np.ones(len(grid), dtype=bool)
+            for measure, options in constraint["forbid"].items():
+                j = self._measure_column(measure)
+                mask &= np.isin(grid[:, j], self._option_positions(j, options))
+            forbidden |= mask
+        self.bitmap = ~forbidden
+
+    def _measure_column(self, measure: str) -> int:
+        if measure not in self.names:
+            raise ValueError(f"Constraint refers to unknown measure '{measure}'")
+        return self.names.index(measure)
+
+    def _option_positions(self, j: int, options: list) -> list[int]:
+        unknown = [option for option in options if option not in self._positions[j]]
+        if unknown:
+            raise ValueError(
+                f"Constraint refers to unknown options of '{self.names[j]}': {unknown}"
+            )
+        return [self._positions[j][option] for option in options]
+
+    def __len__(self):
+        return len(self.bitmap)
+
+    def is_valid(self, index: int) -> bool:
+        """Whether the config with this mixed-radix index satisfies all constraints."""
+        return bool(self.bitmap[index])
+
+    def index_of(self, config: dict) -> int | None:
+        """
+        Mixed-radix index of a config (missing measures take their no-op option), or None
+        when a value is not one of the listed options or a key is not a measure.
+        """
+        if not config.keys() <= self._measures:
+            return None
+
+        index = 0
+        for j, name in enumerate(self.names):
+            position = self._positions[j].get(config.get(name, self.defaults[name]))
+            if position is None:
+                return None
+            index += position * int(self.radix[j])
+        return index
+
+    def is_valid_config(self, config: dict) -> bool:
+        """Validity of a config dict; configs with unlisted values are checked rule by rule."""
+        index = self.index_of(config)
+        if index is not None:
+            return self.is_valid(index)
+
+        return not any(
+            all(
+                config.get(measure, self.defaults.get(measure)) in options
+                for measure, options in constraint["forbid"].items()
+            )
+            for constraint in self.constraints
+        )
+
+    def valid_mask(self, names: list[str], choices: list[list], matrix: np.ndarray):
+        """
+        Vectorized validity of configs encoded as choice indices in another column layout
+        (e.g. ConfigSpace order). Columns are mapped onto the index's option positions, so
+        the whole batch is checked with one bitmap lookup.
+        """
+        index = np.zeros(len(matrix), dtype=np.int64)
+        for j, name in enumerate(self.names):
+            if name in names:
+                k = names.index(name)
+                positions = np.asarray([self._positions[j][c] for c in choices[k]])
+                index += positions[matrix[:, k]] * self.radix[j]
+            else:
+                index += self._positions[j][self.defaults[name]] * self.radix[j]
+        return self.bitmap[index]
+
+
+_constraint_index = None
+
+
+def get_constraint_index() -> ConstraintIndex:
+    """Returns the process-wide ConstraintIndex of ecm_options.json (built on first use)."""
+    global _constraint_index
+
+    if _constraint_index is None:
+        _constraint_index = ConstraintIndex(load_ecm_options())
+    return _constraint_index
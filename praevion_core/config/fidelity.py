@@ -0,0 +1,62 @@
+import os
+from datetime import date, timedelta
+
+FULL_FIDELITY = "full"
+
+# Mid-month weeks used by the representative-week profiles
+_SEASONAL_WEEKS = ["01/15", "04/15", "07/15", "10/15"]
+_MONTHLY_WEEKS = [f"{month:02d}/15" for month in range(1, 13)]
+
+# Named simulation fidelity profiles applied through the OSW (set_simulation_fidelity measure).
+#   timesteps_per_hour: EnergyPlus Timestep (None = keep the seed model's)
+#   shadow_calculation_frequency: days between shading recalculations (None = keep)
+#   representative_weeks: "MM/DD" start dates of 7-day run periods (None = annual run);
+#       energy results are scaled to a year by `annualization_factor`
+FIDELITY_PROFILES = {
+    FULL_FIDELITY: {},
+    "timestep_2": {"timesteps_per_hour": 2},
+    "shadow_30d": {"shadow_calculation_frequency": 30},
+    "monthly_weeks": {"representative_weeks": _MONTHLY_WEEKS},
+    "seasonal_weeks": {"representative_weeks": _SEASONAL_WEEKS},
+    "screening": {
+        "timesteps_per_hour": 2,
+        "shadow_calculation_frequency": 30,
+        "representative_weeks": _SEASONAL_WEEKS,
+    },
+}
+
+
+def get_fidelity_profile(name: str) -> dict:
+    """Returns the settings of a named fidelity profile (ValueError if unknown)."""
+    if name not in FIDELITY_PROFILES:
+        raise ValueError(
+            f"Unknown fidelity profile: {name} (expected one of {list(FIDELITY_PROFILES)})"
+        )
+    return FIDELITY_PROFILES[name]
+
+
+def active_fidelity() -> str:
+    """Fidelity used for optimization runs (SIM_FIDELITY, default full)."""
+    name = os.getenv("SIM_FIDELITY", FULL_FIDELITY).strip()
+    get_fidelity_profile(name)
+    return name
+
+
+def annualization_factor(name: str) -> float:
+    """Factor scaling a profile's simulated energy to a full year (1.0 for annual runs)."""
+    weeks = get_fidelity_profile(name).get("representative_weeks")
+    if not weeks:
+        return 1.0
+    return 365 / (7 * len(weeks))
+
+
+def fidelity_run_periods(name: str) -> list[str]:
+    """Run periods ("MM/DD-MM/DD") of a representative-week profile ([] for annual runs)."""
+    periods = []
+    for start in get_fidelity_profile(name).get("representative_weeks") or []:
+        month, day = (int(part) for part in start.split("/"))
+        # A non-leap reference year; weeks never wrap past December 31
+        begin = date(2023, month, day)
+        end = min(begin + timedelta(days=6), date(2023, 12, 31))
+        periods.append(f"{begin:%m/%d}-{end:%m/%d}")
+    return periods
@@ -21,3 +21,11 @@ KPI_LOG_DIR = LOG_DIR / "kpi_logs"
 RUN_LOGS_DIR = LOG_DIR / "run_logs"
 SUMMARY_DIR = LOG_DIR / "summary_stats"
 RESULTS_ARCHIVE = LOG_DIR / "archive"
+
+# Persistent cache paths (kept outside LOG_DIR so archive_logs/clean_batch_folders leave them alone)
+CACHE_DIR = REPO_ROOT / "cache"
+GEOMETRY_CACHE_DIR = CACHE_DIR / "geometry"
+RESULT_CACHE_DB = CACHE_DIR / "simulation_results.sqlite"
+MODEL_CACHE_DIR = CACHE_DIR / "models"
+IDF_CACHE_DIR = CACHE_DIR / "idf"
+RESOURCE_USAGE_DB = CACHE_DIR / "resource_usage.sqlite"
@@ -1,9 +1,9 @@
 import json
 import os
 
-import ConfigSpace as cs
 from deephyper.hpo import HpProblem
 
+from praevion_core.config.constraints import CONSTRAINTS_KEY, forbidden_clauses
 from praevion_core.config.paths import ECM_DIR
 
 # Resolve the absolute path to the ECM options JSON file
@@ -38,46 +38,9 @@ hvac_hp = problem.add_hyperparameter(
 )
 dhw_hp = problem.add_hyperparameter(value=["Baseline", "Upgrade"], name="upgrade_dhw_to_hpwh")
 
-# Condition 1: U-value & SHGC Pairing
-window_condition_1 = cs.ForbiddenAndConjunction(
-    cs.ForbiddenEqualsClause(window_shgc_value_hp, "None"),
-    cs.ForbiddenInClause(window_u_value_hp, ["0.32", "0.28", "0.22", "0.18"]),
-)
-window_condition_2 = cs.ForbiddenAndConjunction(
-    cs.ForbiddenEqualsClause(window_u_value_hp, "None"),
-    cs.ForbiddenInClause(window_shgc_value_hp, ["0.25", "0.35", "0.40"]),
-)
-problem.add_forbidden_clause(window_condition_1)
-problem.add_forbidden_clause(window_condition_2)
-
-# Condition 2: Infiltration Rate = 0.40
-forbidden_clause_wall_1 = cs.ForbiddenAndConjunction(
-    cs.ForbiddenEqualsClause(inf_rate_hp, "0.40"),
-    cs.ForbiddenInClause(wall_hp, ["R-7.5", "R-10", "R-15"]),
-)
-forbidden_clause_window_1 = cs.ForbiddenAndConjunction(
-    cs.ForbiddenEqualsClause(inf_rate_hp, "0.40"),
-    cs.ForbiddenEqualsClause(window_u_value_hp, "None"),
-)
-problem.add_forbidden_clause(forbidden_clause_wall_1)
-problem.add_forbidden_clause(forbidden_clause_window_1)
-
-# Condition 3: Infiltration Rate = 0.60
-forbidden_clause_wall_2 = cs.ForbiddenAndConjunction(
-    cs.ForbiddenEqualsClause(inf_rate_hp, "0.60"), cs.ForbiddenInClause(wall_hp, ["R-7.5", "R-10"])
-)
-forbidden_clause_window_2 = cs.ForbiddenAndConjunction(
-    cs.ForbiddenEqualsClause(inf_rate_hp, "0.60"),
-    cs.ForbiddenEqualsClause(window_u_value_hp, "None"),
-)
-problem.add_forbidden_clause(forbidden_clause_wall_2)
-problem.add_forbidden_clause(forbidden_clause_window_2)
-
-# Condition 4: Infiltration Rate = 0.75
-forbidden_clause_wall_3 = cs.ForbiddenAndConjunction(
-    cs.ForbiddenEqualsClause(inf_rate_hp, "0.75"), cs.ForbiddenInClause(wall_hp, ["R-7.5"])
-)
-problem.add_forbidden_clause(forbidden_clause_wall_3)
+# Forbidden combinations, compiled from the "constraints" section of ecm_options.json
+for clause in forbidden_clauses(problem.space, ecm_options[CONSTRAINTS_KEY]):
+    problem.add_forbidden_clause(clause)
 
 # Initialize the MOO with 4 variables
 problem.num_objectives = 4
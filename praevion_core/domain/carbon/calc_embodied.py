@@ -1,17 +1,34 @@
 import pandas as pd
 
+from praevion_core.domain.ecm_coefficients import (
+    EcmCoefficientTable,
+    normalize_option,
+    unit_quantities,
+)
 
-def calculate_embodied_carbon_from_df(
+# Column of embodied-carbon-inputs.csv holding the per-unit GWP
+EC_VALUE_COLUMN = "GWP (kg per unit)"
+
+# Measures with no EC impact
+EC_SKIP_MEASURES = frozenset({"upgrade_window_shgc"})
+
+# Baseline options that have no EC line items and are skipped silently
+EC_BASELINE_OPTIONS = frozenset(
+    {"baseline", "r-7.5", "r-15", "1.00", "1.0", "no erv", "condensing boiler"}
+)
+
+
+def calculate_embodied_carbon(
     selections: dict,
     surface_areas: dict,
     total_floor_area: int,
     apartment_floor_area: int,
     apartment_count: int,
-    df_ec: pd.DataFrame,
+    ec_table: EcmCoefficientTable,
 ) -> dict:
     """
     Calculates total embodied carbon (kg CO2e) using ECM selection data, surface areas,
-    apartment count, and a DataFrame of embodied carbon intensities by measure.
+    apartment count, and a compiled table of embodied carbon intensities by measure.
 
     Parameters:
         selections (dict): Keys like 'measure.argument', values like 'R-10' or 'Upgrade'
@@ -19,120 +36,62 @@ def calculate_embodied_carbon_from_df(
         total_floor_area (int): total floor area of all residential and non-residential areas
         apartment_floor_area (int): total floor area of apartment units
         apartment_count (int): number of apartments in the model
-        df_ec (pd.DataFrame): loaded EC data with measure_name, argument_value, GWP, etc.
+        ec_table (EcmCoefficientTable): compiled GWP line items by (measure, option)
 
     Returns:
         dict: kg CO2e by component and total
     """
+    quantities = unit_quantities(
+        surface_areas, total_floor_area, apartment_floor_area, apartment_count
+    )
+    totals, unmatched = ec_table.totals_by_category(
+        selections, quantities, skip_measures=EC_SKIP_MEASURES
+    )
 
-    # Initialize embodied carbon result dictionary
-    result = {
-        "wall_ec_kg": 0.0,
-        "roof_ec_kg": 0.0,
-        "window_ec_kg": 0.0,
-        "hvac_ec_kg": 0.0,
-        "erv_ec_kg": 0.0,
-        "dhw_ec_kg": 0.0,
-        "other_ec_kg": 0.0,
-        "total_ec_kg": 0.0,
-    }
-
-    # Measures with no EC impact
-    skip_measures = {"upgrade_window_shgc"}
-
-    # Loop through each selected ECM from the workflow (.osw)
-    for key, selected_value in selections.items():
-        measure, _ = key.split(".")
-        measure = measure.lower()  # Normalize casing for match
-
-        # Skip non-embodied carbon measures
-        if measure in skip_measures:
-            continue
-
-        # Normalize values for comparison
-        def normalize_val(val):
-            try:
-                return str(float(val))
-            except (ValueError, TypeError):
-                return str(val).strip().lower()
-
-        matched_rows = df_ec[
-            (df_ec["measure_name"].str.strip().str.lower() == measure.strip().lower())
-            and (df_ec["argument_value"].apply(normalize_val) == normalize_val(selected_value))
-        ]
-
-        if matched_rows.empty:
-            if normalize_val(selected_value) in {
-                "baseline",
-                "r-7.5",
-                "r-15",
-                "1.00",
-                "no erv",
-                "condensing boiler",
-            }:
-                continue  # Silently skip baseline
-            print(
-                f"[WARNING] No EC match found for: measure_id='{measure}', option_id='{selected_value}'"
-            )
-            continue
-
-        # Handle all rows (in case more than one entry exists for same measure/option)
-        for _, row in matched_rows.iterrows():
-            gwp = row["GWP (kg per unit)"]
-            unit_type = row["unit_mapping"]
-
-            # Decide how to normalize the GWP value
-            if unit_type == "wall_area":
-                quantity = surface_areas.get("wall_area_m2", 0)
-            elif unit_type == "roof_area":
-                quantity = surface_areas.get("roof_area_m2", 0)
-            elif unit_type == "window_area":
-                quantity = surface_areas.get("window_area_m2", 0)
-            elif unit_type == "total_floor_area":
-                quantity = total_floor_area
-            elif unit_type == "apartment_floor_area":
-                quantity = apartment_floor_area
-            elif unit_type == "per_unit":
-                quantity = apartment_count
-            else:
-                # Default to 1 if no matching unit type is found (e.g., per building)
-                quantity = 1
-
-            # If insulation, apply thickness scaling (e.g., 1.2 kg CO2e per inch x 6 inches
-            thickness = row.get("insulation_thickness", 1)
-            if pd.notna(thickness):
-                gwp *= thickness
-
-            # Calculate subtotal embodied carbon for this line item
-            subtotal = gwp * quantity
-
-            # Categorize the subtotal based on the type of measure
-            if "wall" in measure:
-                result["wall_ec_kg"] += subtotal
-            elif "roof" in measure:
-                result["roof_ec_kg"] += subtotal
-            elif "window" in measure:
-                result["window_ec_kg"] += subtotal
-            elif "hvac" in measure:
-                result["hvac_ec_kg"] += subtotal
-            elif "erv" in measure:
-                result["erv_ec_kg"] += subtotal
-            elif "dhw" in measure:
-                result["dhw_ec_kg"] += subtotal
-            else:
-                result["other_ec_kg"] += subtotal
+    for measure, selected_value in unmatched:
+        if normalize_option(selected_value) in EC_BASELINE_OPTIONS:
+            continue  # Silently skip baseline
+        print(
+            f"[WARNING] No EC match found for: measure_id='{measure}', option_id='{selected_value}'"
+        )
+
+    result = {f"{category}_ec_kg": subtotal for category, subtotal in totals.items()}
 
     # Sum all categories into the total
-    result["total_ec_kg"] = sum(
-        [
-            result["wall_ec_kg"],
-            result["roof_ec_kg"],
-            result["window_ec_kg"],
-            result["erv_ec_kg"],
-            result["hvac_ec_kg"],
-            result["dhw_ec_kg"],
-            result["other_ec_kg"],
-        ]
-    )
+    result["total_ec_kg"] = sum(totals.values())
 
     return result
+
+
+def calculate_embodied_carbon_from_df(
+    selections: dict,
+    surface_areas: dict,
+    total_floor_area: int,
+    apartment_floor_area: int,
+    apartment_count: int,
+    df_ec: pd.DataFrame,
+) -> dict:
+    """
+    Calculates total embodied carbon (kg CO2e) from a DataFrame of embodied carbon
+    intensities by measure. Compiles the DataFrame into an `EcmCoefficientTable` first;
+    prefer `calculate_embodied_carbon` with a table built once when scoring many configs.
+
+    Parameters:
+        selections (dict): Keys like 'measure.argument', values like 'R-10' or 'Upgrade'
+        surface_areas (dict): wall_area_m2, roof_area_m2, window_area_m2
+        total_floor_area (int): total floor area of all residential and non-residential areas
+        apartment_floor_area (int): total floor area of apartment units
+        apartment_count (int): number of apartments in the model
+        df_ec (pd.DataFrame): loaded EC data with measure_name, argument_value, GWP, etc.
+
+    Returns:
+        dict: kg CO2e by component and total
+    """
+    return calculate_embodied_carbon(
+        selections=selections,
+        surface_areas=surface_areas,
+        total_floor_area=total_floor_area,
+        apartment_floor_area=apartment_floor_area,
+        apartment_count=apartment_count,
+        ec_table=EcmCoefficientTable.from_dataframe(df_ec, EC_VALUE_COLUMN),
+    )
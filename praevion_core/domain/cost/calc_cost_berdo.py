@@ -1,5 +1,14 @@
 import pandas as pd
 
+from praevion_core.domain.cost.lifecycle_finance import (
+    ANALYSIS_YEARS,
+    ELECTRICITY_FACTOR_COLUMN,
+    NATURAL_GAS_FACTOR_COLUMN,
+    THRESHOLD_COLUMN,
+    berdo_fines_batch,
+    discount_factors,
+)
+
 
 def calculate_berdo_fine_from_factors(
     electricity_mmbtu: float,
@@ -12,6 +21,9 @@ def calculate_berdo_fine_from_factors(
     """
     Calculates the discounted total BERDO fine over a 25-year period.
 
+    Single-candidate wrapper around `berdo_fines_batch`; use `LifecycleFinanceModel` to
+    score many candidates against the same factor tables.
+
     Parameters:
         electricity_mmbtu (float): Annual electricity usage (MMBtu)
         natural_gas_mmbtu (float): Annual natural gas usage (MMBtu)
@@ -23,30 +35,19 @@ def calculate_berdo_fine_from_factors(
     Returns:
         dict: {"berdo_fine_usd": float}, total discounted fine over 25 years (min $1)
     """
-    total_fine_usd = 0.0
-
     try:
-        # Calculate fine year-by-year
-        for i in range(min(25, len(df_factors))):
-            elec_factor = df_factors.loc[i, "Electricity"]
-            gas_factor = df_factors.loc[i, "Natural Gas"]
-            threshold = df_thresholds.loc[i, "Emissions Threshold (kg CO2e/ft2/yr)"]
-
-            # Calculate total emissions and CEI
-            emissions_kg = electricity_mmbtu * elec_factor + natural_gas_mmbtu * gas_factor
-            cei_kg_per_ft2 = emissions_kg / gsf
-
-            # Apply fine only if above threshold
-            if cei_kg_per_ft2 > threshold:  # type: ignore
-                excess = cei_kg_per_ft2 - threshold
-                fine_tons = (excess * gsf) / 1000  # kg to metric tons
-                annual_fine = fine_tons * 234  # $234/ton CO2e
-
-                # Apply present value discount
-                discounted_fine = annual_fine / ((1 + discount_rate) ** i)
-                total_fine_usd += discounted_fine  # type: ignore
-
-        return {"berdo_fine_usd": max(total_fine_usd, 1)}  # type: ignore
+        n_years = min(ANALYSIS_YEARS, len(df_factors))
+        fines = berdo_fines_batch(
+            electricity_mmbtu,
+            natural_gas_mmbtu,
+            gsf,
+            df_factors[ELECTRICITY_FACTOR_COLUMN].to_numpy(dtype=float)[:n_years],
+            df_factors[NATURAL_GAS_FACTOR_COLUMN].to_numpy(dtype=float)[:n_years],
+            df_thresholds[THRESHOLD_COLUMN].to_numpy(dtype=float)[:n_years],
+            discount_factors(n_years, discount_rate),
+        )
+
+        return {"berdo_fine_usd": float(fines[0])}
 
     except Exception:
         print("🚨 Exception in calculate_berdo_fine_from_factors")
@@ -1,5 +1,13 @@
 import pandas as pd
 
+from praevion_core.domain.cost.lifecycle_finance import (
+    ANALYSIS_YEARS,
+    ELECTRICITY_RATE_COLUMN,
+    NATURAL_GAS_RATE_COLUMN,
+    discount_factors,
+    utility_costs_batch,
+)
+
 
 def calculate_discounted_utility_costs(
     electricity_mmbtu: float,
@@ -10,6 +18,9 @@ def calculate_discounted_utility_costs(
     """
     Calculates the discounted total utility cost (electricity + gas) over 25 years.
 
+    Single-candidate wrapper around `utility_costs_batch`; use `LifecycleFinanceModel` to
+    score many candidates against the same rate table.
+
     Parameters:
         electricity_mmbtu (float): Annual electricity usage (MMBtu)
         natural_gas_mmbtu (float): Annual natural gas usage (MMBtu)
@@ -19,22 +30,21 @@ def calculate_discounted_utility_costs(
     Returns:
         dict: {"discounted_utility_cost_usd": float}
     """
-    total_cost_usd = 0.0
-
-    # Ensure DataFrame columns are numeric
-    df_rates["Electricity $/MMBtu"] = pd.to_numeric(df_rates["Electricity $/MMBtu"], errors="raise")
-    df_rates["Natural Gas $/MMBtu"] = pd.to_numeric(df_rates["Natural Gas $/MMBtu"], errors="raise")
+    # Ensure rate columns are numeric (without modifying the caller's DataFrame)
+    n_years = min(ANALYSIS_YEARS, len(df_rates))
+    elec_rates = pd.to_numeric(df_rates[ELECTRICITY_RATE_COLUMN], errors="raise")
+    gas_rates = pd.to_numeric(df_rates[NATURAL_GAS_RATE_COLUMN], errors="raise")
 
     try:
-        for i in range(min(25, len(df_rates))):
-            elec_rate = df_rates.loc[i, "Electricity $/MMBtu"]
-            gas_rate = df_rates.loc[i, "Natural Gas $/MMBtu"]
-
-            annual_cost = electricity_mmbtu * elec_rate + natural_gas_mmbtu * gas_rate
-            discounted_cost = annual_cost / ((1 + discount_rate) ** i)
-            total_cost_usd += discounted_cost  # type: ignore
-
-        return {"discounted_utility_cost_usd": total_cost_usd}
+        costs = utility_costs_batch(
+            electricity_mmbtu,
+            natural_gas_mmbtu,
+            elec_rates.to_numpy(dtype=float)[:n_years],
+            gas_rates.to_numpy(dtype=float)[:n_years],
+            discount_factors(n_years, discount_rate),
+        )
+
+        return {"discounted_utility_cost_usd": float(costs[0])}
 
     except Exception:
         print("🚨 Exception in calculate_discounted_utility_costs")
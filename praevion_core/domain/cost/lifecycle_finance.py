@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+
+# Analysis horizon (years) and BERDO alternative compliance payment ($ per metric ton CO2e)
+ANALYSIS_YEARS = 25
+BERDO_USD_PER_TON = 234
+
+ELECTRICITY_FACTOR_COLUMN = "Electricity"
+NATURAL_GAS_FACTOR_COLUMN = "Natural Gas"
+THRESHOLD_COLUMN = "Emissions Threshold (kg CO2e/ft2/yr)"
+ELECTRICITY_RATE_COLUMN = "Electricity $/MMBtu"
+NATURAL_GAS_RATE_COLUMN = "Natural Gas $/MMBtu"
+
+
+def discount_factors(n_years: int, discount_rate: float) -> np.ndarray:
+    """Present-value factors 1 / (1 + r)^i for i = 0 .. n_years - 1."""
+    return 1.0 / (1.0 + discount_rate) ** np.arange(n_years)
+
+
+def _readonly(values) -> np.ndarray:
+    array = np.array(values, dtype=float)
+    array.flags.writeable = False
+    return array
+
+
+def berdo_fines_batch(
+    electricity_mmbtu,
+    natural_gas_mmbtu,
+    gsf,
+    electricity_factors: np.ndarray,
+    natural_gas_factors: np.ndarray,
+    thresholds: np.ndarray,
+    discount: np.ndarray,
+) -> np.ndarray:
+    """
+    Discounted total BERDO fines for N candidates at once.
+
+    Parameters:
+        electricity_mmbtu (array-like): Annual electricity usage per candidate (MMBtu), shape (N,)
+        natural_gas_mmbtu (array-like): Annual natural gas usage per candidate (MMBtu), shape (N,)
+        gsf (array-like or float): Gross floor area per candidate (ft²)
+        electricity_factors (np.ndarray): kg CO2e/MMBtu by year, shape (Y,)
+        natural_gas_factors (np.ndarray): kg CO2e/MMBtu by year, shape (Y,)
+        thresholds (np.ndarray): BERDO CEI thresholds by year (kg CO2e/ft²/yr), shape (Y,)
+        discount (np.ndarray): Present-value factors by year, shape (Y,)
+
+    Returns:
+        np.ndarray: Discounted total fine per candidate (min $1), shape (N,)
+    """
+    electricity = np.atleast_1d(np.asarray(electricity_mmbtu, dtype=float))
+    natural_gas = np.atleast_1d(np.asarray(natural_gas_mmbtu, dtype=float))
+    gsf = np.broadcast_to(np.asarray(gsf, dtype=float), electricity.shape)
+
+    # (N, Y) annual emissions and carbon emissions intensity
+    emissions_kg = np.outer(electricity, electricity_factors) + np.outer(
+        natural_gas, natural_gas_factors
+    )
+    cei_kg_per_ft2 = emissions_kg / gsf[:, None]
+
+    # Fine only applies above the threshold: excess kg → metric tons → $
+    excess = np.maximum(cei_kg_per_ft2 - thresholds, 0.0)
+    annual_fines = excess * gsf[:, None] / 1000 * BERDO_USD_PER_TON
+
+    return np.maximum(annual_fines @ discount, 1)
+
+
+def utility_costs_batch(
+    electricity_mmbtu,
+    natural_gas_mmbtu,
+    electricity_rates: np.ndarray,
+    natural_gas_rates: np.ndarray,
+    discount: np.ndarray,
+) -> np.ndarray:
+    """
+    Discounted total utility cost (electricity + gas) for N candidates at once.
+
+    Parameters:
+        electricity_mmbtu (array-like): Annual electricity usage per candidate (MMBtu), shape (N,)
+        natural_gas_mmbtu (array-like): Annual natural gas usage per candidate (MMBtu), shape (N,)
+        electricity_rates (np.ndarray): $/MMBtu by year, shape (Y,)
+        natural_gas_rates (np.ndarray): $/MMBtu by year, shape (Y,)
+        discount (np.ndarray): Present-value factors by year, shape (Y,)
+
+    Returns:
+        np.ndarray: Discounted total utility cost per candidate, shape (N,)
+    """
+    electricity = np.atleast_1d(np.asarray(electricity_mmbtu, dtype=float))
+    natural_gas = np.atleast_1d(np.asarray(natural_gas_mmbtu, dtype=float))
+
+    # Annual cost is linear in usage, so discount the rate vectors once
+    return electricity * (electricity_rates @ discount) + natural_gas * (
+        natural_gas_rates @ discount
+    )
+
+
+class LifecycleFinanceModel:
+    """
+    Precomputed discount, emissions factor, threshold and rate vectors for scoring the
+    25-year BERDO fine and discounted utility cost of many candidates in one shot.
+
+    Parameters:
+        df_factors (pd.DataFrame): Emissions factors by year (kg CO2e/MMBtu)
+        df_thresholds (pd.DataFrame): BERDO CEI thresholds by year (kg CO2e/ft²/yr)
+        df_rates (pd.DataFrame): Utility rates by year ($/MMBtu)
+        discount_rate (float): Real discount rate (e.g., 0.03 for 3%)
+    """
+
+    def __init__(
+        self,
+        df_factors: pd.DataFrame,
+        df_thresholds: pd.DataFrame,
+        df_rates: pd.DataFrame,
+        discount_rate: float = 0.03,
+    ):
+        self.discount_rate = discount_rate
+
+        # BERDO horizon follows the emissions factor table (thresholds are indexed by the same year)
+        n_berdo = min(ANALYSIS_YEARS, len(df_factors))
+        self.electricity_factors = _readonly(df_factors[ELECTRICITY_FACTOR_COLUMN].iloc[:n_berdo])
+        self.natural_gas_factors = _readonly(df_factors[NATURAL_GAS_FACTOR_COLUMN].iloc[:n_berdo])
+        self.thresholds = _readonly(df_thresholds[THRESHOLD_COLUMN].iloc[:n_berdo])
+        self.berdo_discount = _readonly(discount_factors(n_berdo, discount_rate))
+
+        n_rates = min(ANALYSIS_YEARS, len(df_rates))
+        self.electricity_rates = _readonly(
+            pd.to_numeric(df_rates[ELECTRICITY_RATE_COLUMN].iloc[:n_rates], errors="raise")
+        )
+        self.natural_gas_rates = _readonly(
+            pd.to_numeric(df_rates[NATURAL_GAS_RATE_COLUMN].iloc[:n_rates], errors="raise")
+        )
+        self.utility_discount = _readonly(discount_factors(n_rates, discount_rate))
+
+    def berdo_fines(self, electricity_mmbtu, natural_gas_mmbtu, gsf) -> np.ndarray:
+        """Discounted total BERDO fine per candidate (min $1), shape (N,)."""
+        return berdo_fines_batch(
+            electricity_mmbtu,
+            natural_gas_mmbtu,
+            gsf,
+            self.electricity_factors,
+            self.natural_gas_factors,
+            self.thresholds,
+            self.berdo_discount,
+        )
+
+    def utility_costs(self, electricity_mmbtu, natural_gas_mmbtu) -> np.ndarray:
+        """Discounted total utility cost per candidate, shape (N,)."""
+        return utility_costs_batch(
+            electricity_mmbtu,
+            natural_gas_mmbtu,
+            self.electricity_rates,
+            self.natural_gas_rates,
+            self.utility_discount,
+        )
+
+    def evaluate(self, electricity_mmbtu, natural_gas_mmbtu, gsf) -> dict:
+        """
+        Scores N candidates described by arrays of (electricity_mmbtu, natural_gas_mmbtu, gsf).
+
+        Returns:
+            dict: {"berdo_fine_usd": np.ndarray, "discounted_utility_cost_usd": np.ndarray}
+        """
+        return {
+            "berdo_fine_usd": self.berdo_fines(electricity_mmbtu, natural_gas_mmbtu, gsf),
+            "discounted_utility_cost_usd": self.utility_costs(electricity_mmbtu, natural_gas_mmbtu),
+        }
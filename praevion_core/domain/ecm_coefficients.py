@@ -0,0 +1,157 @@
+from types import MappingProxyType
+from typing import NamedTuple
+
+import pandas as pd
+
+# Result buckets, matched in order against the measure name ("other" if none match)
+MEASURE_CATEGORIES = ("wall", "roof", "window", "hvac", "erv", "dhw")
+
+
+class EcmCoefficient(NamedTuple):
+    """One line item of an ECM option (e.g. the insulation board of a wall upgrade)."""
+
+    coefficient: float  # value per unit (kg CO2e/unit or $/unit)
+    unit_mapping: str  # quantity the coefficient is multiplied by (wall_area, per_unit, ...)
+    thickness: float | None  # insulation thickness scaling, None when not applicable
+    category: str  # result bucket (wall, roof, window, hvac, erv, dhw, other)
+
+
+def normalize_option(val) -> str:
+    """Normalizes an ECM option so '1', '1.00' and 1.0 (or 'R-10' and 'r-10 ') compare equal."""
+    try:
+        return str(float(val))
+    except (ValueError, TypeError):
+        return str(val).strip().lower()
+
+
+def normalize_measure(measure) -> str:
+    return str(measure).strip().lower()
+
+
+def measure_category(measure: str) -> str:
+    """Maps a measure name to the result bucket its line items are summed into."""
+    for category in MEASURE_CATEGORIES:
+        if category in measure:
+            return category
+    return "other"
+
+
+def unit_quantities(
+    surface_areas: dict, total_floor_area, apartment_floor_area, apartment_count
+) -> dict:
+    """
+    Quantities that `unit_mapping` values refer to. Unknown mappings (e.g. per_building)
+    default to a quantity of 1.
+    """
+    return {
+        "wall_area": surface_areas.get("wall_area_m2", 0),
+        "roof_area": surface_areas.get("roof_area_m2", 0),
+        "window_area": surface_areas.get("window_area_m2", 0),
+        "total_floor_area": total_floor_area,
+        "apartment_floor_area": apartment_floor_area,
+        "per_unit": apartment_count,
+    }
+
+
+class EcmCoefficientTable:
+    """
+    Compiled lookup of ECM line items keyed by normalized (measure, option).
+
+    Built once from an input CSV (embodied carbon or material cost), so evaluating a
+    selection is a dict lookup instead of a filtered scan over the whole DataFrame.
+
+    Parameters:
+        entries (dict): {(measure, option): tuple[EcmCoefficient, ...]} with normalized keys
+    """
+
+    def __init__(self, entries: dict):
+        self._entries = MappingProxyType(dict(entries))
+
+    @classmethod
+    def from_dataframe(cls, df: pd.DataFrame, value_column: str) -> "EcmCoefficientTable":
+        """
+        Compiles a table from an input DataFrame with measure_name, argument_value,
+        unit_mapping, insulation_thickness and a per-unit value column.
+
+        Parameters:
+            df (pd.DataFrame): Embodied carbon or material cost inputs
+            value_column (str): Column holding the per-unit value, e.g. 'GWP (kg per unit)'
+        """
+        thickness_col = (
+            df["insulation_thickness"]
+            if "insulation_thickness" in df.columns
+            else pd.Series(float("nan"), index=df.index)
+        )
+
+        entries = {}
+        for measure, option, value, unit_mapping, thickness in zip(
+            df["measure_name"],
+            df["argument_value"],
+            df[value_column],
+            df["unit_mapping"],
+            thickness_col,
+            strict=True,
+        ):
+            measure = normalize_measure(measure)
+            key = (measure, normalize_option(option))
+            item = EcmCoefficient(
+                coefficient=float(value),
+                unit_mapping=unit_mapping,
+                thickness=float(thickness) if pd.notna(thickness) else None,
+                category=measure_category(measure),
+            )
+            entries[key] = entries.get(key, ()) + (item,)
+
+        return cls(entries)
+
+    @classmethod
+    def from_csv(cls, path: str, value_column: str) -> "EcmCoefficientTable":
+        return cls.from_dataframe(pd.read_csv(path), value_column)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        measure, option = key
+        return (normalize_measure(measure), normalize_option(option)) in self._entries
+
+    def lookup(self, measure: str, option) -> tuple:
+        """Returns all line items for a measure option (empty tuple if none are defined)."""
+        return self._entries.get((normalize_measure(measure), normalize_option(option)), ())
+
+    def totals_by_category(
+        self, selections: dict, quantities: dict, skip_measures=frozenset()
+    ) -> tuple[dict, list]:
+        """
+        Sums coefficient x thickness x quantity for each selection into result buckets.
+
+        Parameters:
+            selections (dict): Keys like 'measure.argument', values like 'R-10' or 'Upgrade'
+            quantities (dict): unit_mapping → quantity, see `unit_quantities`
+            skip_measures (set): Measures excluded from the totals
+
+        Returns:
+            tuple:
+                - dict: {category: subtotal} for every bucket in MEASURE_CATEGORIES + "other"
+                - list: (measure, option) selections with no matching line items
+        """
+        totals = dict.fromkeys((*MEASURE_CATEGORIES, "other"), 0.0)
+        unmatched = []
+
+        for key, selected_value in selections.items():
+            measure = normalize_measure(key.split(".")[0])
+            if measure in skip_measures:
+                continue
+
+            items = self.lookup(measure, selected_value)
+            if not items:
+                unmatched.append((measure, selected_value))
+                continue
+
+            for item in items:
+                value = item.coefficient
+                if item.thickness is not None:
+                    value *= item.thickness
+                totals[item.category] += value * quantities.get(item.unit_mapping, 1)
+
+        return totals, unmatched
@@ -1,29 +1,126 @@
+import json
 import os
 import uuid
 from datetime import UTC, datetime
 
-import pandas as pd
-
 from praevion_core.adapters.energyplus.energyplus_kpis import (
     extract_construction_areas,
     extract_total_energy,
     extract_zone_area,
 )
-from praevion_core.adapters.openstudio.generate_osw import generate_osw_from_config
-from praevion_core.adapters.openstudio.osw_selection import extract_measure_selections
-from praevion_core.adapters.openstudio.run_simulation import run_osw_and_get_csv_path
+from praevion_core.adapters.energyplus.energyplus_sql import (
+    EplusSqlReport,
+    extract_construction_areas_sql,
+    extract_total_energy_sql,
+    extract_zone_area_sql,
+)
+from praevion_core.adapters.energyplus.energyplus_tables import EplusTableReport
+from praevion_core.adapters.energyplus.geometry_cache import get_geometry_cache
+from praevion_core.adapters.energyplus.run_energyplus import (
+    csv_path_from_energyplus_result,
+    get_idf_cache,
+    idf_cache_key,
+    run_energyplus,
+)
+from praevion_core.adapters.openstudio.generate_osw import (
+    canonical_measure_steps,
+    generate_osw_from_config,
+    lean_output_enabled,
+)
+from praevion_core.adapters.openstudio.model_cache import get_model_cache
+from praevion_core.adapters.openstudio.osw_selection import (
+    extract_measure_selections,
+    extract_seed_file,
+    selections_from_config,
+)
+from praevion_core.adapters.openstudio.run_osw import run_osw_and_organize_logs
+from praevion_core.adapters.openstudio.run_simulation import csv_path_from_run_result
+from praevion_core.config.fidelity import FULL_FIDELITY, annualization_factor
 from praevion_core.config.paths import ECM_DIR, OS_DIR, OSW_DIR, RUN_LOGS_DIR
-from praevion_core.domain.carbon.calc_embodied import calculate_embodied_carbon_from_df
+from praevion_core.domain.carbon.calc_embodied import calculate_embodied_carbon
 from praevion_core.domain.carbon.calc_operational import calculate_operational_emissions
-from praevion_core.domain.cost.calc_cost_berdo import calculate_berdo_fine_from_factors
-from praevion_core.domain.cost.calc_cost_material import calculate_material_cost_from_df
-from praevion_core.domain.cost.calc_cost_utility import calculate_discounted_utility_costs
+from praevion_core.domain.cost.calc_cost_material import calculate_material_cost
+from praevion_core.domain.kpis.input_tables import get_input_registry
 from praevion_core.pipelines.logging_utils import clean_output_dir
+from praevion_core.pipelines.resource_scheduler import get_memory_scheduler, memory_slot
+from praevion_core.pipelines.result_cache import simulation_key
+from praevion_core.pipelines.scratch_dirs import discard_failed_run
 
+# Supported sources for simulation results: eplustbl.csv scraping or eplusout.sql queries
+KPI_BACKENDS = ("csv", "sql")
 
-def evaluate_kpis_from_osw_and_csv(
-    osw_path: str,
+# Model inputs shared by every simulation
+ECM_OPTIONS_PATH = os.path.join(ECM_DIR, "ecm_options.json")
+SEED_FILE = os.path.join(OS_DIR, "cluster4-existing-condition.osm")
+WEATHER_FILE = os.path.join(OS_DIR, "USA_MA_Boston-Logan.Intl.AP.725090_TMY3.epw")
+
+
+def extract_simulation_results(
     csv_path: str,
+    kpi_backend: str = "csv",
+    seed_file: str | None = None,
+    fidelity: str = FULL_FIDELITY,
+) -> dict:
+    """
+    Extracts the raw simulation results (energy by fuel, zone areas, construction areas)
+    for one completed run using the selected KPI backend.
+
+    When `seed_file` is given and the geometry cache is enabled, zone and construction areas
+    are served from the cache keyed by the seed model's content hash instead of being
+    re-derived from every run's report.
+
+    Runs of a representative-week fidelity profile only cover part of the year; their energy
+    totals are scaled to annual values with `annualization_factor`.
+
+    Parameters:
+        csv_path (str): Path to the run's eplustbl.csv; eplusout.sql is expected next to it.
+        kpi_backend (str): "csv" to parse eplustbl.csv, "sql" to query eplusout.sql.
+        seed_file (str | None): Seed .osm the run was generated from (enables geometry cache).
+        fidelity (str): Fidelity profile the run was simulated at.
+
+    Returns:
+        dict: {"energy": dict, "zone_data": dict, "surface_areas": dict}
+    """
+    if kpi_backend == "csv":
+        # Index eplustbl.csv once and share it across all extractors
+        report = EplusTableReport(csv_path)
+        extract_energy, extract_zones, extract_areas = (
+            extract_total_energy,
+            extract_zone_area,
+            extract_construction_areas,
+        )
+    elif kpi_backend == "sql":
+        report = EplusSqlReport(os.path.join(os.path.dirname(csv_path), "eplusout.sql"))
+        extract_energy, extract_zones, extract_areas = (
+            extract_total_energy_sql,
+            extract_zone_area_sql,
+            extract_construction_areas_sql,
+        )
+    else:
+        raise ValueError(f"Unsupported KPI backend: {kpi_backend} (expected one of {KPI_BACKENDS})")
+
+    def extract_geometry():
+        return {"zone_data": extract_zones(report), "surface_areas": extract_areas(report)}
+
+    try:
+        geometry_cache = get_geometry_cache() if seed_file else None
+        if geometry_cache is not None:
+            geometry = geometry_cache.resolve(seed_file, extract_geometry)
+        else:
+            geometry = extract_geometry()
+
+        scale = annualization_factor(fidelity)
+        energy = {fuel: value * scale for fuel, value in extract_energy(report).items()}
+        return {"energy": energy, **geometry}
+
+    finally:
+        if isinstance(report, EplusSqlReport):
+            report.close()
+
+
+def evaluate_kpis_from_results(
+    selections: dict,
+    results: dict,
     ec_input_path: str,
     oc_input_path: str,
     threshold_input_path: str,
@@ -31,15 +128,16 @@ def evaluate_kpis_from_osw_and_csv(
     utility_rate_input_path: str,
 ) -> dict:
     """
-    Evaluates key performance indicators (KPIs) for a completed OpenStudio simulation run.
+    Computes the embodied carbon, operational carbon, BERDO fine, material cost and utility
+    cost KPIs from measure selections and raw simulation results.
 
-    This function parses the measure selections from a .osw file, extracts relevant
-    surface and zone metrics from the associated eplustbl.csv report, and computes both
-    embodied and operational carbon values using provided emissions factor tables.
+    This is the simulation-independent half of the pipeline, so results served from a cache
+    are scored exactly like freshly parsed ones.
 
     Parameters:
-        osw_path (str): Path to the OpenStudio Workflow (.osw) file used for the run.
-        csv_path (str): Path to the corresponding EnergyPlus eplustbl.csv output file.
+        selections (dict): Selected ECM arguments (measure.argument: value)
+        results (dict): {"energy": dict, "zone_data": dict, "surface_areas": dict}, as
+            returned by `extract_simulation_results`
         ec_input_path (str): Path to the embodied carbon data CSV (e.g. component GWP).
         oc_input_path (str): Path to the operational emissions factor CSV (per fuel type).
         threshold_input_path (str): Path to multifamily BERDO CEI thresholds CSV.
@@ -47,86 +145,72 @@ def evaluate_kpis_from_osw_and_csv(
         utility_rate_input_path (str): Path to utility rates CSV.
 
     Returns:
-        dict: Flattened dictionary containing:
-            - Full paths to the .osw and .csv
-            - Selected ECM arguments (measure.argument: value)
-            - Embodied carbon metrics (wall_ec_kg, hvac_ec_kg, total_ec_kg, etc.)
-            - Operational emissions (electricity emissions, natural gas emissions, total_emissions)
+        dict: Selections and all KPI components, flattened into one dictionary
     """
 
-    # Load dataframes
-    df_ec = pd.read_csv(ec_input_path)
-    df_oc = pd.read_csv(oc_input_path)
-    df_thresholds = pd.read_csv(threshold_input_path)
-    df_material = pd.read_csv(mat_cost_input_path)
-    df_rates = pd.read_csv(utility_rate_input_path)
-
-    # Ensure consistent naming by enforcing all measures be lower case
-    df_ec["measure_name"] = df_ec["measure_name"].str.strip().str.lower()
-    df_ec["argument_value"] = df_ec["argument_value"].astype(str).str.strip().str.lower()
-
-    df_material["measure_name"] = df_material["measure_name"].str.strip().str.lower()
-    df_material["argument_value"] = (
-        df_material["argument_value"].astype(str).str.strip().str.lower()
+    # Load input tables (parsed once per worker, reloaded only when a file changes)
+    inputs = get_input_registry().kpi_inputs(
+        ec_input_path=ec_input_path,
+        oc_input_path=oc_input_path,
+        threshold_input_path=threshold_input_path,
+        mat_cost_input_path=mat_cost_input_path,
+        utility_rate_input_path=utility_rate_input_path,
     )
 
-    # Parse .osw for selections
-    selections = extract_measure_selections(osw_path)
-
-    # Extract surface and zone metrics
-    surface_areas = extract_construction_areas(csv_path)
-    zone_data = extract_zone_area(csv_path)
+    # Surface and zone metrics
+    surface_areas = results["surface_areas"]
+    zone_data = results["zone_data"]
     total_floor_area_m2 = zone_data["total_floor_area_m2"]
     total_floor_area_ft2 = total_floor_area_m2 * 10.7639
     apartment_floor_area_m2 = zone_data["apartment_floor_area_m2"]
     apartment_count = zone_data["apartment_count"]
 
-    # Extract energy usage by fuel type
-    energy = extract_total_energy(csv_path)
+    # Energy usage by fuel type
+    energy = results["energy"]
 
     # Compute KPI metrics (Operational, Embodied Carbon, and BERDO fines)
-    ec = calculate_embodied_carbon_from_df(
+    ec = calculate_embodied_carbon(
         selections=selections,
         surface_areas=surface_areas,
         total_floor_area=total_floor_area_m2,
         apartment_floor_area=apartment_floor_area_m2,
         apartment_count=apartment_count,
-        df_ec=df_ec,
+        ec_table=inputs.ec_table,
     )
 
     oc = calculate_operational_emissions(
         electricity_mmbtu=energy["electricity_mmbtu"],
         natural_gas_mmbtu=energy["natural_gas_mmbtu"],
-        df_factors=df_oc,
-    )
-
-    utility_cost_usd = calculate_discounted_utility_costs(
-        electricity_mmbtu=energy["electricity_mmbtu"],
-        natural_gas_mmbtu=energy["natural_gas_mmbtu"],
-        df_rates=df_rates,
+        df_factors=inputs.df_factors,
     )
 
-    fine_usd = calculate_berdo_fine_from_factors(
-        electricity_mmbtu=energy["electricity_mmbtu"],
-        natural_gas_mmbtu=energy["natural_gas_mmbtu"],
-        gsf=total_floor_area_ft2,
-        df_factors=df_oc,
-        df_thresholds=df_thresholds,
-    )
+    # Lifecycle finance from the precomputed discount, factor and rate vectors
+    utility_cost_usd = {
+        "discounted_utility_cost_usd": float(
+            inputs.finance.utility_costs(energy["electricity_mmbtu"], energy["natural_gas_mmbtu"])[
+                0
+            ]
+        )
+    }
+    fine_usd = {
+        "berdo_fine_usd": float(
+            inputs.finance.berdo_fines(
+                energy["electricity_mmbtu"], energy["natural_gas_mmbtu"], total_floor_area_ft2
+            )[0]
+        )
+    }
 
-    mat_cost = calculate_material_cost_from_df(
+    mat_cost = calculate_material_cost(
         selections=selections,
         surface_areas=surface_areas,
         total_floor_area=total_floor_area_m2,
         apartment_floor_area=apartment_floor_area_m2,
         apartment_count=apartment_count,
-        df_material=df_material,
+        cost_table=inputs.mat_cost_table,
     )
 
     # Combine everything into one dictionary
     return {
-        "osw_path": os.path.abspath(osw_path),
-        "csv_path": os.path.abspath(csv_path),
         **selections,
         **ec,
         **oc,
@@ -136,6 +220,220 @@ def evaluate_kpis_from_osw_and_csv(
     }
 
 
+def evaluate_kpis_from_osw_and_csv(
+    osw_path: str,
+    csv_path: str,
+    ec_input_path: str,
+    oc_input_path: str,
+    threshold_input_path: str,
+    mat_cost_input_path: str,
+    utility_rate_input_path: str,
+    kpi_backend: str = "csv",
+    selections: dict | None = None,
+    fidelity: str = FULL_FIDELITY,
+    seed_file: str | None = None,
+) -> dict:
+    """
+    Evaluates key performance indicators (KPIs) for a completed OpenStudio simulation run.
+
+    This function parses the measure selections from a .osw file, extracts relevant
+    surface and zone metrics from the associated eplustbl.csv report, and computes both
+    embodied and operational carbon values using provided emissions factor tables.
+
+    Parameters:
+        osw_path (str): Path to the OpenStudio Workflow (.osw) file used for the run.
+        csv_path (str): Path to the corresponding EnergyPlus eplustbl.csv output file.
+        ec_input_path (str): Path to the embodied carbon data CSV (e.g. component GWP).
+        oc_input_path (str): Path to the operational emissions factor CSV (per fuel type).
+        threshold_input_path (str): Path to multifamily BERDO CEI thresholds CSV.
+        mat_cost_input_path (str): Path to material costs CSV.
+        utility_rate_input_path (str): Path to utility rates CSV.
+        kpi_backend (str): "csv" (eplustbl.csv) or "sql" (eplusout.sql) result extraction.
+        selections (dict | None): Selected ECM arguments; read from the .osw when omitted.
+            The .osw leaves out no-op steps, so callers holding the config pass its own
+            selections (see `selections_from_config`).
+        fidelity (str): Fidelity profile the run was simulated at (see
+            `extract_simulation_results`).
+        seed_file (str | None): Project seed model the geometry cache is keyed on; read from
+            the .osw when omitted. Callers whose OSW starts from a cached prefix model pass
+            the project seed, so geometry is not re-extracted per prefix.
+
+    Returns:
+        dict: Flattened dictionary containing:
+            - Full paths to the .osw and .csv
+            - Selected ECM arguments (measure.argument: value)
+            - Embodied carbon metrics (wall_ec_kg, hvac_ec_kg, total_ec_kg, etc.)
+            - Operational emissions (electricity emissions, natural gas emissions, total_emissions)
+            - simulation_results: the raw results the KPIs were computed from
+    """
+
+    # Parse .osw for selections
+    if selections is None:
+        selections = extract_measure_selections(osw_path)
+
+    # Extract energy, surface and zone metrics
+    if seed_file is None:
+        seed_file = extract_seed_file(osw_path)
+    results = extract_simulation_results(
+        csv_path, kpi_backend, seed_file=seed_file, fidelity=fidelity
+    )
+
+    kpis = evaluate_kpis_from_results(
+        selections=selections,
+        results=results,
+        ec_input_path=ec_input_path,
+        oc_input_path=oc_input_path,
+        threshold_input_path=threshold_input_path,
+        mat_cost_input_path=mat_cost_input_path,
+        utility_rate_input_path=utility_rate_input_path,
+    )
+
+    return {
+        "osw_path": os.path.abspath(osw_path),
+        "csv_path": os.path.abspath(csv_path),
+        **kpis,
+        "simulation_results": results,
+    }
+
+
+def prepare_config_evaluation(config: dict, fidelity: str = FULL_FIDELITY) -> tuple[dict, str]:
+    """
+    Returns the config's own measure selections and its simulation key at `fidelity`.
+
+    Embodied carbon and cost always follow the config's own selections, even when the
+    simulation itself is shared with an energy-equivalent config; configs with the same
+    canonical OSW steps share one simulation key (and one cached IDF).
+    """
+    with open(ECM_OPTIONS_PATH) as f:
+        ecm_options = json.load(f)
+
+    selections = selections_from_config(config, ecm_options)
+    sim_key = simulation_key(
+        canonical_measure_steps(config, ecm_options), SEED_FILE, WEATHER_FILE, fidelity=fidelity
+    )
+    return selections, sim_key
+
+
+def kpis_from_cached_results(selections: dict, results: dict, **input_paths) -> dict:
+    """Evaluates KPIs for results served from the result cache (no run artifacts)."""
+    kpis = evaluate_kpis_from_results(selections=selections, results=results, **input_paths)
+    return {
+        "osw_path": None,
+        "csv_path": None,
+        **kpis,
+        "simulation_results": results,
+        "cache_hit": True,
+    }
+
+
+def is_fatal_energyplus_error(error: Exception) -> bool:
+    return "EnergyPlus Terminated with a Fatal Error" in str(error)
+
+
+def fatal_error_kpis(osw_path: str) -> dict:
+    """Infinite KPIs recorded for a config whose simulation hit an EnergyPlus fatal error."""
+    return {
+        "osw_path": os.path.abspath(osw_path),
+        "csv_path": None,
+        "total_emissions_kg": float("inf"),
+        "total_ec_kg": float("inf"),
+        "berdo_fine_usd": float("inf"),
+        "material_cost_usd": float("inf"),
+    }
+
+
+def evaluate_kpis_from_idf(
+    idf_path: str,
+    run_dir: str,
+    selections: dict,
+    ec_input_path: str,
+    oc_input_path: str,
+    threshold_input_path: str,
+    mat_cost_input_path: str,
+    utility_rate_input_path: str,
+    kpi_backend: str = "csv",
+    config: dict | None = None,
+    fidelity: str = FULL_FIDELITY,
+) -> dict:
+    """
+    Runs EnergyPlus directly on a translated IDF and evaluates KPIs from its report.
+
+    Parameters:
+        idf_path (str): Path to the IDF (e.g. from the IDF cache)
+        run_dir (str): Output directory for the EnergyPlus run
+        selections (dict): Selected ECM arguments (measure.argument: value)
+        ec_input_path (str): Path to the embodied carbon data CSV (e.g. component GWP).
+        oc_input_path (str): Path to the operational emissions factor CSV (per fuel type).
+        threshold_input_path (str): Path to multifamily BERDO CEI thresholds CSV.
+        mat_cost_input_path (str): Path to material costs CSV.
+        utility_rate_input_path (str): Path to utility rates CSV.
+        kpi_backend (str): "csv" (eplustbl.csv) or "sql" (eplusout.sql) result extraction.
+        config (dict | None): ECM config, used for memory-aware scheduling of the run
+        fidelity (str): Fidelity profile the IDF was translated at
+
+    Returns:
+        dict: Same layout as `evaluate_kpis_from_osw_and_csv` (osw_path is None), plus the
+            run's resource_usage
+    """
+    scheduler = get_memory_scheduler() if config is not None else None
+    with memory_slot(scheduler, config, runner="energyplus"):
+        result = run_energyplus(idf_path, WEATHER_FILE, run_dir)
+    if scheduler is not None and result["success"]:
+        scheduler.record(config, result["resource_usage"], runner="energyplus")
+
+    try:
+        csv_path = csv_path_from_energyplus_result(result)
+    except FileNotFoundError:
+        discard_failed_run(result)
+        raise
+
+    kpis = evaluate_energyplus_run_outputs(
+        csv_path,
+        result["log_path"],
+        selections,
+        kpi_backend,
+        persist_path=result["persist_path"],
+        scratch_dir=result["scratch_dir"],
+        fidelity=fidelity,
+        ec_input_path=ec_input_path,
+        oc_input_path=oc_input_path,
+        threshold_input_path=threshold_input_path,
+        mat_cost_input_path=mat_cost_input_path,
+        utility_rate_input_path=utility_rate_input_path,
+    )
+    return {**kpis, "resource_usage": result["resource_usage"]}
+
+
+def evaluate_energyplus_run_outputs(
+    csv_path: str,
+    run_dir: str,
+    selections: dict,
+    kpi_backend: str,
+    persist_path: str | None = None,
+    scratch_dir: str | None = None,
+    fidelity: str = FULL_FIDELITY,
+    **input_paths,
+) -> dict:
+    """
+    Evaluates KPIs from a direct EnergyPlus run (see `evaluate_kpis_from_idf`) and cleans
+    its run directory (or persists and drops it, for scratch runs).
+    """
+    try:
+        results = extract_simulation_results(
+            csv_path, kpi_backend, seed_file=SEED_FILE, fidelity=fidelity
+        )
+        kpis = evaluate_kpis_from_results(selections=selections, results=results, **input_paths)
+    finally:
+        clean_output_dir(run_dir, persist_path, scratch_dir)
+
+    return {
+        "osw_path": None,
+        "csv_path": persisted_path(csv_path, persist_path),
+        **kpis,
+        "simulation_results": results,
+    }
+
+
 def evaluate_kpis_from_config(
     config: dict,
     df_factors: str,
@@ -143,6 +441,9 @@ def evaluate_kpis_from_config(
     df_thresholds: str,
     df_material: str,
     df_rates: str,
+    kpi_backend: str = "csv",
+    result_cache=None,
+    fidelity: str = FULL_FIDELITY,
 ) -> dict:
     """
     Run a full simulation + KPI evaluation pipeline from a single ECM config dictionary.
@@ -154,15 +455,95 @@ def evaluate_kpis_from_config(
         df_thresholds (str): Path to BERDO threshold CSV.
         df_material (str): Path to material costs CSV.
         df_rates (str): Path to utility rates CSV.
+        kpi_backend (str): "csv" (eplustbl.csv) or "sql" (eplusout.sql) result extraction.
+        result_cache (SimulationResultCache | None): Persistent cache of raw simulation results,
+            consulted before an OSW is generated; successful runs are added to it and
+            concurrent duplicates across worker processes wait for a single simulation.
+        fidelity (str): Simulation fidelity profile (see `config/fidelity.py`); reduced
+            profiles are cached separately from full-fidelity results.
 
     Returns:
         dict: Contains total and component-level metrics, as well as file paths and selections.
     """
 
-    # Setup input file paths
-    ecm_options_path = os.path.join(ECM_DIR, "ecm_options.json")
-    seed_file = os.path.join(OS_DIR, "cluster4-existing-condition.osm")
-    weather_file = os.path.join(OS_DIR, "USA_MA_Boston-Logan.Intl.AP.725090_TMY3.epw")
+    selections, cache_key = prepare_config_evaluation(config, fidelity)
+
+    # Serve previously simulated configs straight from the result cache. A config that is
+    # already simulating in another worker is waited on rather than launched a second time.
+    if result_cache is not None:
+        cached_results = result_cache.acquire(cache_key)
+        if cached_results is not None:
+            return kpis_from_cached_results(
+                selections,
+                cached_results,
+                ec_input_path=df_embodied,
+                oc_input_path=df_factors,
+                threshold_input_path=df_thresholds,
+                mat_cost_input_path=df_material,
+                utility_rate_input_path=df_rates,
+            )
+
+    # This worker now owns the simulation for cache_key; release the claim however it ends
+    try:
+        kpis = simulate_and_evaluate_config(
+            config,
+            df_factors=df_factors,
+            df_embodied=df_embodied,
+            df_thresholds=df_thresholds,
+            df_material=df_material,
+            df_rates=df_rates,
+            kpi_backend=kpi_backend,
+            selections=selections,
+            # A cached IDF shares the result cache's key, so it can only hit without one
+            sim_key=(
+                idf_cache_key(cache_key, lean_output_enabled()) if result_cache is None else None
+            ),
+            fidelity=fidelity,
+        )
+        if result_cache is not None and "simulation_results" in kpis:
+            result_cache.put(cache_key, config, kpis["simulation_results"])
+        return kpis
+
+    finally:
+        if result_cache is not None:
+            result_cache.release(cache_key)
+
+
+def simulate_and_evaluate_config(
+    config: dict,
+    df_factors: str,
+    df_embodied: str,
+    df_thresholds: str,
+    df_material: str,
+    df_rates: str,
+    kpi_backend: str = "csv",
+    selections: dict | None = None,
+    sim_key: str | None = None,
+    fidelity: str = FULL_FIDELITY,
+) -> dict:
+    """
+    Generates the OSW for an ECM config, runs OpenStudio and evaluates KPIs from its report.
+    Always simulates; see `evaluate_kpis_from_config` for the cached entry point.
+
+    When `sim_key` is given and its translated IDF was captured by an earlier run, EnergyPlus
+    is invoked directly on that IDF instead (no Ruby startup, measures or translation).
+
+    Parameters:
+        config (dict): ECM measure selections.
+        df_factors (str): Path to operational carbon inputs CSV.
+        df_embodied (str): Path to embodied carbon inputs CSV.
+        df_thresholds (str): Path to BERDO threshold CSV.
+        df_material (str): Path to material costs CSV.
+        df_rates (str): Path to utility rates CSV.
+        kpi_backend (str): "csv" (eplustbl.csv) or "sql" (eplusout.sql) result extraction.
+        selections (dict | None): Selections to cost; defaults to the config's own selections.
+        sim_key (str | None): IDF cache key from `idf_cache_key` (enables the IDF cache).
+        fidelity (str): Simulation fidelity profile applied through the OSW.
+
+    Returns:
+        dict: KPIs, raw simulation results and the run's resource_usage (wall time, CPU time,
+            peak RSS), or infinite KPIs if EnergyPlus failed fatally.
+    """
 
     # Set label for individual DeepHyper optimization runs
     timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
@@ -172,42 +553,148 @@ def evaluate_kpis_from_config(
     osw_path = os.path.join(OSW_DIR, f"{run_id}.osw")
     run_logs_dir = os.path.join(RUN_LOGS_DIR, run_id)
 
-    # Generate OSW
+    if selections is None:
+        with open(ECM_OPTIONS_PATH) as f:
+            selections = selections_from_config(config, json.load(f))
+
+    input_paths = {
+        "ec_input_path": df_embodied,
+        "oc_input_path": df_factors,
+        "threshold_input_path": df_thresholds,
+        "mat_cost_input_path": df_material,
+        "utility_rate_input_path": df_rates,
+    }
+
+    # Re-run a previously translated model directly with EnergyPlus when its IDF is cached
+    idf_cache = get_idf_cache() if sim_key else None
+    cached_idf = idf_cache.get(sim_key) if idf_cache is not None else None
+    if cached_idf is not None:
+        try:
+            return evaluate_kpis_from_idf(
+                idf_path=cached_idf,
+                run_dir=os.path.join(run_logs_dir, run_id),
+                selections=selections,
+                kpi_backend=kpi_backend,
+                config=config,
+                fidelity=fidelity,
+                **input_paths,
+            )
+        except (RuntimeError, FileNotFoundError) as e:
+            print(f"⚠️ Direct EnergyPlus run failed for {run_id} — falling back to OpenStudio: {e}")
+            idf_cache.invalidate(sim_key)
+
+    # Start from the deepest cached measure-prefix model (e.g. an already-insulated envelope)
+    seed_file, start_step = SEED_FILE, 0
+    model_cache = get_model_cache()
+    if model_cache is not None:
+        seed_file, start_step = model_cache.resolve(
+            config, ECM_OPTIONS_PATH, SEED_FILE, WEATHER_FILE, OSW_DIR, run_id
+        )
+
+    # Generate OSW with only the measures the seed model does not include yet
     generate_osw_from_config(
         config=config,
-        ecm_options_path=ecm_options_path,
+        ecm_options_path=ECM_OPTIONS_PATH,
         output_path=osw_path,
         seed_file=seed_file,
-        weather_file=weather_file,
+        weather_file=WEATHER_FILE,
+        start_step=start_step,
+        lean_output=lean_output_enabled(),
+        fidelity=fidelity,
     )
 
-    try:
-        # Run simulation
-        csv_path, run_dir = run_osw_and_get_csv_path(osw_path, run_logs_dir)
+    # Run simulation once its projected memory fits the node (SIM_MEMORY_BUDGET_MB)
+    scheduler = get_memory_scheduler()
+    with memory_slot(scheduler, config):
+        result = run_osw_and_organize_logs(osw_path, run_logs_dir)
+    if scheduler is not None and result["success"]:
+        scheduler.record(config, result["resource_usage"])
 
-        # clean directory AFTER parsing context
-        clean_output_dir(run_dir)
+    try:
+        csv_path, run_dir = csv_path_from_run_result(result)
 
     except RuntimeError as e:
-        if "EnergyPlus Terminated with a Fatal Error" in str(e):
+        if is_fatal_energyplus_error(e):
             print("❌ OpenStudio simulation failed due to E+ fatal error. Skipping...")
-            return {
-                "osw_path": os.path.abspath(osw_path),
-                "csv_path": None,
-                "total_emissions_kg": float("inf"),
-                "total_ec_kg": float("inf"),
-                "berdo_fine_usd": float("inf"),
-                "material_cost_usd": float("inf"),
-            }
+            return {**fatal_error_kpis(osw_path), "resource_usage": result["resource_usage"]}
         else:
             raise
 
-    return evaluate_kpis_from_osw_and_csv(
-        osw_path=osw_path,
-        csv_path=csv_path,
-        ec_input_path=df_embodied,
-        oc_input_path=df_factors,
-        threshold_input_path=df_thresholds,
-        mat_cost_input_path=df_material,
-        utility_rate_input_path=df_rates,
+    except FileNotFoundError:
+        discard_failed_run(result)
+        raise
+
+    kpis = evaluate_osw_run_outputs(
+        osw_path,
+        csv_path,
+        run_dir,
+        selections,
+        kpi_backend,
+        sim_key,
+        persist_path=result["persist_path"],
+        scratch_dir=result["scratch_dir"],
+        fidelity=fidelity,
+        **input_paths,
     )
+    return {**kpis, "resource_usage": result["resource_usage"]}
+
+
+def evaluate_osw_run_outputs(
+    osw_path: str,
+    csv_path: str,
+    run_dir: str,
+    selections: dict,
+    kpi_backend: str,
+    sim_key: str | None,
+    persist_path: str | None = None,
+    scratch_dir: str | None = None,
+    fidelity: str = FULL_FIDELITY,
+    **input_paths,
+) -> dict:
+    """
+    Post-processes a completed OpenStudio run: captures its translated IDF (when the IDF cache
+    is enabled), evaluates KPIs and cleans the run directory (or, for a scratch run, copies
+    its whitelisted artifacts to `persist_path` and drops the scratch tree).
+
+    Parameters:
+        osw_path (str): Path to the .osw that was run
+        csv_path (str): Path to the run's eplustbl.csv
+        run_dir (str): Directory holding the run outputs
+        selections (dict): Selected ECM arguments (measure.argument: value)
+        kpi_backend (str): "csv" (eplustbl.csv) or "sql" (eplusout.sql) result extraction.
+        sim_key (str | None): IDF cache key the IDF is captured under
+        persist_path (str | None): Persistent destination of a scratch run's artifacts
+        scratch_dir (str | None): Scratch tree holding `run_dir`
+        fidelity (str): Fidelity profile the run was simulated at
+        **input_paths: ec/oc/threshold/mat_cost/utility_rate input CSV paths
+
+    Returns:
+        dict: Output of `evaluate_kpis_from_osw_and_csv`
+    """
+    try:
+        # Capture the translated IDF so repeats can skip the OpenStudio workflow
+        idf_cache = get_idf_cache() if sim_key else None
+        if idf_cache is not None:
+            idf_cache.store(sim_key, run_dir)
+
+        kpis = evaluate_kpis_from_osw_and_csv(
+            osw_path=osw_path,
+            csv_path=csv_path,
+            kpi_backend=kpi_backend,
+            selections=selections,
+            fidelity=fidelity,
+            seed_file=SEED_FILE,
+            **input_paths,
+        )
+    finally:
+        # clean directory AFTER parsing context (the SQL backend still needs eplusout.sql)
+        clean_output_dir(run_dir, persist_path, scratch_dir)
+
+    return {**kpis, "csv_path": persisted_path(csv_path, persist_path)}
+
+
+def persisted_path(path: str, persist_path: str | None) -> str:
+    """Absolute path of a run artifact after its (scratch) run directory was cleaned up."""
+    if persist_path is None:
+        return os.path.abspath(path)
+    return os.path.abspath(os.path.join(persist_path, os.path.basename(path)))
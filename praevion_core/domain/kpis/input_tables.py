@@ -0,0 +1,123 @@
+import os
+from dataclasses import dataclass
+
+import pandas as pd
+
+from praevion_core.domain.carbon.calc_embodied import EC_VALUE_COLUMN
+from praevion_core.domain.cost.calc_cost_material import MATERIAL_VALUE_COLUMN
+from praevion_core.domain.cost.lifecycle_finance import LifecycleFinanceModel
+from praevion_core.domain.ecm_coefficients import EcmCoefficientTable
+from praevion_core.pipelines.cache_utils import hash_file
+
+
+@dataclass(frozen=True)
+class KpiInputs:
+    """Loaded and compiled KPI input tables shared by every evaluation in a worker."""
+
+    df_factors: pd.DataFrame  # operational carbon factors by year
+    df_thresholds: pd.DataFrame  # BERDO CEI thresholds by year
+    df_rates: pd.DataFrame  # utility rates by year
+    ec_table: EcmCoefficientTable
+    mat_cost_table: EcmCoefficientTable
+    finance: LifecycleFinanceModel
+
+
+def _load_ec_table(path) -> EcmCoefficientTable:
+    return EcmCoefficientTable.from_csv(path, EC_VALUE_COLUMN)
+
+
+def _load_mat_cost_table(path) -> EcmCoefficientTable:
+    return EcmCoefficientTable.from_csv(path, MATERIAL_VALUE_COLUMN)
+
+
+class InputTableRegistry:
+    """
+    Process-wide registry of the CSV inputs under data/inputs.
+
+    Each file is loaded (and compiled, for EC and material costs) once per worker process.
+    On every request the file is stat'ed; if its mtime or size changed, it is re-hashed and
+    only reloaded when the content hash differs, so edits to the inputs are picked up without
+    paying for pandas parsing on every evaluation.
+    """
+
+    def __init__(self):
+        # (path, loader) → (stat signature, content hash, loaded value)
+        self._files = {}
+        # tuple of (path, content hash) → KpiInputs
+        self._bundles = {}
+
+    def _signature(self, path):
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _load(self, path, loader):
+        path = os.path.abspath(path)
+        signature = self._signature(path)
+        # Keyed by loader too: the same file parsed differently must not share an entry
+        key = (path, loader)
+        cached = self._files.get(key)
+
+        if cached is not None:
+            cached_signature, cached_hash, value = cached
+            if cached_signature == signature:
+                return cached_hash, value
+
+            # mtime changed — only reload if the content actually changed
+            content_hash = hash_file(path)
+            if content_hash == cached_hash:
+                self._files[key] = (signature, content_hash, value)
+                return content_hash, value
+
+        content_hash = hash_file(path)
+        value = loader(path)
+        self._files[key] = (signature, content_hash, value)
+        return content_hash, value
+
+    def table(self, path) -> pd.DataFrame:
+        """
+        Returns the parsed CSV at `path` as a shallow copy, so callers cannot replace
+        columns of the registry's shared DataFrame.
+        """
+        return self._load(path, pd.read_csv)[1].copy(deep=False)
+
+    def kpi_inputs(
+        self,
+        ec_input_path: str,
+        oc_input_path: str,
+        threshold_input_path: str,
+        mat_cost_input_path: str,
+        utility_rate_input_path: str,
+    ) -> KpiInputs:
+        """
+        Returns the loaded and compiled KPI inputs, rebuilding only the parts whose files
+        changed since the last call.
+        """
+        ec_hash, ec_table = self._load(ec_input_path, _load_ec_table)
+        mat_hash, mat_cost_table = self._load(mat_cost_input_path, _load_mat_cost_table)
+        oc_hash, df_factors = self._load(oc_input_path, pd.read_csv)
+        threshold_hash, df_thresholds = self._load(threshold_input_path, pd.read_csv)
+        rates_hash, df_rates = self._load(utility_rate_input_path, pd.read_csv)
+
+        key = (ec_hash, mat_hash, oc_hash, threshold_hash, rates_hash)
+        if key not in self._bundles:
+            # Drop bundles built from stale inputs; only the current one is ever reused
+            self._bundles = {
+                key: KpiInputs(
+                    df_factors=df_factors.copy(deep=False),
+                    df_thresholds=df_thresholds.copy(deep=False),
+                    df_rates=df_rates.copy(deep=False),
+                    ec_table=ec_table,
+                    mat_cost_table=mat_cost_table,
+                    finance=LifecycleFinanceModel(df_factors, df_thresholds, df_rates),
+                )
+            }
+
+        return self._bundles[key]
+
+
+_input_registry = InputTableRegistry()
+
+
+def get_input_registry() -> InputTableRegistry:
+    """Returns this worker process's InputTableRegistry."""
+    return _input_registry
@@ -0,0 +1,75 @@
+import argparse
+import os
+from datetime import UTC, datetime
+
+from praevion_core.config.fidelity import FIDELITY_PROFILES, FULL_FIDELITY
+from praevion_core.config.paths import RESULTS_DIR
+from praevion_core.config.problem import problem
+from praevion_core.pipelines.fidelity_calibration import (
+    calibration_error_report,
+    run_fidelity_calibration,
+)
+from praevion_core.pipelines.sobol_sampler import generate_filtered_sobol_samples
+
+
+def parse_args(argv=None):
+    reduced_profiles = [name for name in FIDELITY_PROFILES if name != FULL_FIDELITY]
+    parser = argparse.ArgumentParser(
+        description="Run a sample of configs at each fidelity profile and report the KPI "
+        "error against full-fidelity simulations."
+    )
+    parser.add_argument(
+        "--profiles",
+        nargs="+",
+        choices=reduced_profiles,
+        default=reduced_profiles,
+        help="Reduced fidelity profiles to calibrate (default: all)",
+    )
+    parser.add_argument(
+        "--samples", type=int, default=16, help="Number of Sobol points to draw (default: 16)"
+    )
+    parser.add_argument("--seed", type=int, default=7, help="Sobol seed (default: 7)")
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=int(os.getenv("NUM_WORKERS", "8")),
+        help="Simulation worker processes (default: NUM_WORKERS or 8)",
+    )
+    parser.add_argument(
+        "--output-dir", default=str(RESULTS_DIR), help="Directory for the calibration CSVs"
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+
+    configs = generate_filtered_sobol_samples(
+        problem=problem, n_samples=args.samples, seed=args.seed, verbose=True
+    )
+    print(
+        f"🎯 Calibrating {', '.join(args.profiles)} on {len(configs)} configs "
+        f"({len(configs) * (len(args.profiles) + 1)} simulations)"
+    )
+
+    runs = run_fidelity_calibration(
+        configs,
+        args.profiles,
+        kpi_backend=os.getenv("KPI_BACKEND", "csv"),
+        num_workers=args.workers,
+    )
+    report = calibration_error_report(runs)
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    runs_path = os.path.join(args.output_dir, f"fidelity_calibration_runs_{timestamp}.csv")
+    report_path = os.path.join(args.output_dir, f"fidelity_calibration_{timestamp}.csv")
+    runs.to_csv(runs_path, index=False)
+    report.to_csv(report_path, index=False)
+
+    print(report.to_string(index=False, float_format=lambda x: f"{x:,.3f}"))
+    print(f"💾 Calibration report saved to: {report_path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import argparse
 import os
 from datetime import UTC, datetime
 
@@ -10,22 +11,40 @@ from praevion_core.config.paths import (
     LOG_DIR,
     OSW_DIR,
     RESULTS_ARCHIVE,
-    RESULTS_DIR,
     RUN_LOGS_DIR,
     SUMMARY_DIR,
 )
 from praevion_core.config.problem import problem
+from praevion_core.pipelines.convergence import get_hypervolume_tracker
+from praevion_core.pipelines.design_space import ExhaustiveCBO
+from praevion_core.pipelines.kpi_log import compact_kpi_log, kpi_log_files
 from praevion_core.pipelines.logging_utils import (
     archive_logs,
     archive_osws,
     archive_run_logs,
     clean_batch_folders,
-    expand_objectives_column,
-    log_optimization_summary_to_csv,
+    log_optimization_summary,
     save_best_log,
-    save_results_csv,
+    save_results,
+)
+from praevion_core.pipelines.multi_fidelity import (
+    fidelity_counts,
+    front_fidelity,
+    get_multi_fidelity_policy,
+)
+from praevion_core.pipelines.pareto import get_pareto_archive
+from praevion_core.pipelines.results_store import RESULTS_FORMAT
+from praevion_core.pipelines.resume import (
+    kpi_log_path_for,
+    remaining_seeds,
+    replay_frame,
+    replayed_objectives,
+)
+from praevion_core.pipelines.run_function_async import (
+    best_log,
+    run_function_coroutine_deduplicated,
+    run_function_deduplicated,
 )
-from praevion_core.pipelines.run_function_async import best_log, run_function_deduplicated
 from praevion_core.pipelines.sobol_sampler import generate_filtered_sobol_samples
 
 # Select which acquisition function is to be used in simulation (supports EI and UCB)
@@ -41,19 +60,54 @@ else:
     raise ValueError(f"Unsupported acquisition function: {ACQUISITION_FUNCTION}")
 
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Run the retrofit optimization search.")
+    parser.add_argument(
+        "--resume",
+        metavar="RUN_LABEL",
+        help="Continue an interrupted run: replay the evaluations in kpi_log_<RUN_LABEL>.jsonl "
+        "into the surrogate and spend only the remaining budget",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
     timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
-    run_label = f"{ACQUISITION_FUNCTION}_function_search_{timestamp}"
+    run_label = args.resume or f"{ACQUISITION_FUNCTION}_function_search_{timestamp}"
     os.environ["RUN_LABEL"] = run_label
-    os.environ["KPI_LOG_PATH"] = os.path.join(LOG_DIR, f"kpi_log_{run_label}.jsonl")
+    os.environ["KPI_LOG_PATH"] = kpi_log_path_for(run_label)
 
-    print(f"🚀 Starting async optimization run: {run_label}")
+    # Multi-fidelity: screen every candidate cheaply, re-simulate only those near the front
+    mf_policy = get_multi_fidelity_policy()
+    if mf_policy is not None:
+        print(
+            f"🔭 Multi-fidelity search: screening at {mf_policy.low_fidelity}, promoting configs "
+            f"within {mf_policy.margin} of the front to {mf_policy.high_fidelity}"
+        )
+    # Only evaluations at this fidelity are comparable enough to form the reported front
+    result_fidelity = front_fidelity(mf_policy)
+    if RESULTS_FORMAT != "parquet":
+        print("⚠️ pyarrow is not installed; the results store will be written as CSV")
+
+    replayed = pd.DataFrame()
+    if args.resume:
+        if not kpi_log_files(os.environ["KPI_LOG_PATH"]):
+            raise FileNotFoundError(f"No KPI log to resume at {os.environ['KPI_LOG_PATH']}")
+        replayed = replay_frame(
+            os.environ["KPI_LOG_PATH"], problem.hyperparameter_names, policy=mf_policy
+        )
+        print(f"♻️ Resuming run {run_label}: replaying {len(replayed)} completed evaluations")
+    else:
+        print(f"🚀 Starting async optimization run: {run_label}")
 
-    # 🗂 Archive previous results, logs, and kpi outputs before this run
-    archive_logs(run_label)
+    # A resumed run keeps its logs and working directories where the crash left them
+    if not args.resume:
+        # 🗂 Archive previous results, logs, and kpi outputs before this run
+        archive_logs(run_label)
 
-    # 🧼 Clean up working directories to prepare for this run
-    clean_batch_folders(project_root=".")
+        # 🧼 Clean up working directories to prepare for this run
+        clean_batch_folders(project_root=".")
 
     # ✅ Generate filtered Sobol seed configs
     seed_configs = generate_filtered_sobol_samples(
@@ -61,15 +115,52 @@ def main():
     )
     print(f"📦 Loaded {len(seed_configs)} valid Sobol seeds for initial_points.")
 
+    # Track the front's hypervolume; HV_EARLY_STOPPING=on ends the search once it stalls
+    hv_tracker = get_hypervolume_tracker(min_evals=len(seed_configs), fidelity=result_fidelity)
+    if not replayed.empty:
+        seed_configs = remaining_seeds(seed_configs, replayed)
+        print(f"📦 {len(seed_configs)} Sobol seeds left to evaluate")
+        for objectives in replayed_objectives(replayed, result_fidelity):
+            hv_tracker.record(objectives)
+    if hv_tracker.stop_on_stall:
+        print(
+            f"🛑 Stopping early if hypervolume gains less than {hv_tracker.min_gain:.2%} "
+            f"over {hv_tracker.window} evaluations"
+        )
+
     # ⚙️ Launch DeepHyper evaluation context
-    num_cpu_workers = 8
-    with Evaluator.create(
-        run_function=run_function_deduplicated,
-        method="process",
-        method_kwargs={"num_workers": num_cpu_workers},
-    ) as evaluator:
+    # With SIM_MEMORY_BUDGET_MB set, simulations are admitted by projected memory, so large
+    # nodes can raise NUM_WORKERS well beyond the point where peak-memory collisions would OOM
+    num_cpu_workers = int(os.getenv("NUM_WORKERS", "8"))
+    if os.getenv("EVALUATOR", "process") == "async":
+        # One asyncio coordinator drives the OpenStudio subprocesses; DeepHyper keeps up to
+        # ASYNC_MAX_PENDING jobs in flight while at most ASYNC_MAX_SIMULATIONS are simulating
+        max_simulations = int(os.getenv("ASYNC_MAX_SIMULATIONS", str(num_cpu_workers)))
+        os.environ["ASYNC_MAX_SIMULATIONS"] = str(max_simulations)
+        evaluator_kwargs = {
+            "run_function": run_function_coroutine_deduplicated,
+            "method": "serial",
+            "method_kwargs": {
+                "num_workers": int(os.getenv("ASYNC_MAX_PENDING", str(2 * max_simulations))),
+                "callbacks": [hv_tracker],
+            },
+        }
+    else:
+        evaluator_kwargs = {
+            "run_function": run_function_deduplicated,
+            "method": "process",
+            "method_kwargs": {"num_workers": num_cpu_workers, "callbacks": [hv_tracker]},
+        }
+
+    # ACQ_OPTIMIZER=exhaustive scores every valid config with the surrogate instead of mixedga
+    search_cls = CBO
+    if os.getenv("ACQ_OPTIMIZER", CONFIG["acq_optimizer"]) == "exhaustive":
+        search_cls = ExhaustiveCBO
+        print("🧮 Acquisition maximized exactly over the enumerated design space")
+
+    with Evaluator.create(**evaluator_kwargs) as evaluator:
         # 🧠 Instantiate search strategy (CBO)
-        search = CBO(
+        search = search_cls(
             problem=problem,
             evaluator=evaluator,
             initial_points=seed_configs,
@@ -88,10 +179,33 @@ def main():
         if hasattr(search, "save_results"):
             search.save_results = False
 
+        # Fit the surrogate on the replayed evaluations instead of re-simulating them
+        if not replayed.empty:
+            search.fit_surrogate(replayed)
+
         # 🔍 Start the search
         MAX_EVALS = 640
-        print(f"🔍 Starting search with max_evals = {MAX_EVALS}")
-        search.search(max_evals=MAX_EVALS)
+        remaining_evals = MAX_EVALS - len(replayed)
+        print(f"🔍 Starting search with max_evals = {remaining_evals}")
+        if remaining_evals > 0:
+            search.search(max_evals=remaining_evals)
+        num_evals = len(hv_tracker.history)
+        print(f"📐 Hypervolume {hv_tracker.hypervolume:.6f} after {num_evals} evaluations")
+
+        if mf_policy is not None:
+            counts = fidelity_counts(os.environ["KPI_LOG_PATH"])
+            print(
+                f"🔭 Evaluations by fidelity: {dict(counts)} "
+                f"({counts[mf_policy.high_fidelity]} promoted of {counts[mf_policy.low_fidelity]})"
+            )
+
+        # Live front of the front-fidelity evaluations, caught up from the workers' KPI log
+        archive = get_pareto_archive(result_fidelity)
+        archive.sync(os.environ["KPI_LOG_PATH"])
+        print(
+            f"🏅 Pareto front: {len(archive.front())} of {len(archive)} "
+            f"{result_fidelity}-fidelity evaluations"
+        )
 
         # 📊 Log search ask history if available
         if hasattr(search, "ask_log"):
@@ -99,18 +213,20 @@ def main():
             pd.DataFrame(search.ask_log).to_csv(ask_log_path, index=False)
 
         # 💾 Save search results and best log
-        save_results_csv(search, run_label)
-        expand_objectives_column(os.path.join(RESULTS_DIR, f"results_{run_label}.csv"))
+        results = save_results(search, run_label, replayed=replayed, fidelity=result_fidelity)
         save_best_log(best_log, acq_func=ACQUISITION_FUNCTION)
 
         # Save summary stats log
         summary_log_path = os.path.join(SUMMARY_DIR, "optimization_runs_summary.csv")
-        log_optimization_summary_to_csv(
-            csv_path=os.path.join(RESULTS_DIR, f"results_{run_label}.csv"),
+        log_optimization_summary(
+            results,
             run_label=run_label,
-            max_evals=MAX_EVALS,
+            max_evals=num_evals,
             output_csv_path=summary_log_path,
+            hypervolume=hv_tracker.hypervolume,
+            fidelity=result_fidelity,
         )
+        hv_tracker.save_history(os.path.join(SUMMARY_DIR, f"hypervolume_{run_label}.csv"))
 
         # 📦 Archive old OSWs + run folders
         archive_osws(OSW_DIR, os.path.join(RESULTS_ARCHIVE, "old_osw_files"))
@@ -124,9 +240,13 @@ def main():
             os.remove(internal_csv)
             print("🧹 Removed internal DeepHyper results.csv file to avoid clutter.")
 
-        print("\n🎉 Optimization run completed successfully!")
-        print("📈 Results saved, logs archived, and OSW/result files compressed.")
-        print("🚀 Ready for next mission — onwards to smarter retrofits with Praevion!")
+    # Workers have exited: merge their KPI log segments into one compressed file
+    if os.getenv("KPI_LOG_COMPACT", "off").lower() in ("on", "1", "true"):
+        compact_kpi_log(os.environ["KPI_LOG_PATH"])
+
+    print("\n🎉 Optimization run completed successfully!")
+    print("📈 Results saved, logs archived, and OSW/result files compressed.")
+    print("🚀 Ready for next mission — onwards to smarter retrofits with Praevion!")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,340 @@
+import asyncio
+import contextlib
+import os
+import time
+import uuid
+from datetime import UTC, datetime
+
+from praevion_core.adapters.energyplus.run_energyplus import (
+    csv_path_from_energyplus_result,
+    energyplus_command,
+    energyplus_result,
+    get_idf_cache,
+    idf_cache_key,
+    prepare_energyplus_run,
+)
+from praevion_core.adapters.openstudio.generate_osw import (
+    generate_osw_from_config,
+    lean_output_enabled,
+)
+from praevion_core.adapters.openstudio.model_cache import get_model_cache
+from praevion_core.adapters.openstudio.run_osw import (
+    openstudio_command,
+    organize_run_outputs,
+    prepare_osw_run,
+)
+from praevion_core.adapters.openstudio.run_simulation import csv_path_from_run_result
+from praevion_core.config.fidelity import FULL_FIDELITY
+from praevion_core.config.paths import OSW_DIR, RUN_LOGS_DIR
+from praevion_core.domain.kpis.evaluate_kpis import (
+    ECM_OPTIONS_PATH,
+    SEED_FILE,
+    WEATHER_FILE,
+    evaluate_energyplus_run_outputs,
+    evaluate_osw_run_outputs,
+    fatal_error_kpis,
+    is_fatal_energyplus_error,
+    kpis_from_cached_results,
+    prepare_config_evaluation,
+)
+from praevion_core.pipelines.resource_scheduler import (
+    get_memory_scheduler,
+    memory_slot_async,
+)
+from praevion_core.pipelines.resource_usage import empty_usage, read_process_tree_rss_mb
+from praevion_core.pipelines.scratch_dirs import discard_failed_run
+
+
+class AsyncSimulationRunner:
+    """
+    Launches OpenStudio and EnergyPlus subprocesses from a single asyncio coordinator.
+
+    Simulations are external processes, so one event loop can drive many of them without a
+    Python interpreter (plus pandas/deephyper) per concurrent run.
+
+    Parameters:
+        max_concurrency (int): Maximum number of simulation subprocesses running at once
+        max_pending (int | None): Maximum number of evaluations admitted (running or queued
+            for a subprocess slot); further callers wait in `admit()`. Defaults to
+            2 * max_concurrency.
+        timeout (float | None): Per-subprocess timeout in seconds (None = no limit)
+        rss_sample_interval (float): Seconds between peak-memory samples of each subprocess
+    """
+
+    def __init__(self, max_concurrency=8, max_pending=None, timeout=None, rss_sample_interval=0.5):
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending or 2 * max_concurrency
+        self.timeout = timeout
+        self.rss_sample_interval = rss_sample_interval
+        self._slots = None
+        self._admission = None
+
+    def _semaphores(self):
+        # Created lazily so they bind to the event loop that actually runs the evaluations
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_concurrency)
+            self._admission = asyncio.Semaphore(self.max_pending)
+        return self._slots, self._admission
+
+    @contextlib.asynccontextmanager
+    async def admit(self):
+        """Bounded queue: waits until fewer than `max_pending` evaluations are in flight."""
+        _, admission = self._semaphores()
+        async with admission:
+            yield
+
+    async def run_command(self, command, cwd, timeout=None):
+        """
+        Runs one subprocess in a concurrency slot.
+
+        On timeout the process is killed and reported as failed; on cancellation it is
+        killed and the CancelledError propagates.
+
+        The peak RSS of the process tree is sampled from /proc while it runs (CPU times are
+        not available here, see `run_with_resource_usage` for the blocking runners).
+
+        Returns:
+            tuple: (success (bool), stdout (bytes), stderr (bytes), resource_usage (dict))
+        """
+        slots, _ = self._semaphores()
+        timeout = timeout if timeout is not None else self.timeout
+
+        async with slots:
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *command,
+                    cwd=cwd,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE,
+                )
+            except OSError as e:
+                return False, b"(no stdout captured)", str(e).encode(), empty_usage()
+
+            start = time.perf_counter()
+            peak = {"max_rss_mb": None}
+            sampler = asyncio.create_task(self._sample_peak_rss(process.pid, peak))
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+                success = process.returncode == 0
+            except TimeoutError:
+                await _kill(process)
+                success, stdout = False, b""
+                stderr = f"Timed out after {timeout} s: {command[0]}".encode()
+            except asyncio.CancelledError:
+                await _kill(process)
+                raise
+            finally:
+                sampler.cancel()
+
+        usage = {**empty_usage(time.perf_counter() - start), **peak}
+        return success, stdout, stderr, usage
+
+    async def _sample_peak_rss(self, pid, peak):
+        while True:
+            rss_mb = read_process_tree_rss_mb(pid)
+            if rss_mb is not None and (peak["max_rss_mb"] is None or rss_mb > peak["max_rss_mb"]):
+                peak["max_rss_mb"] = rss_mb
+            await asyncio.sleep(self.rss_sample_interval)
+
+    async def run_osw(self, osw_path, run_logs_dir, measures_only=False):
+        """Async counterpart of `run_osw_and_organize_logs` (same result summary)."""
+        test_name, osw_dir, new_osw_path = prepare_osw_run(osw_path)
+        success, stdout, stderr, usage = await self.run_command(
+            openstudio_command(new_osw_path, measures_only), cwd=osw_dir
+        )
+        return organize_run_outputs(
+            test_name, osw_dir, run_logs_dir, success, stdout, stderr, resource_usage=usage
+        )
+
+    async def run_energyplus(self, idf_path, weather_file, run_dir):
+        """Async counterpart of `run_energyplus` (same result summary)."""
+        work_dir = prepare_energyplus_run(run_dir)
+        success, stdout, stderr, usage = await self.run_command(
+            energyplus_command(idf_path, weather_file, work_dir), cwd=work_dir
+        )
+        return energyplus_result(run_dir, work_dir, success, stdout, stderr, usage)
+
+
+async def _kill(process):
+    with contextlib.suppress(ProcessLookupError):
+        process.kill()
+    await process.wait()
+
+
+class AsyncKpiEvaluator:
+    """
+    Asyncio version of `evaluate_kpis_from_config`: the same caches, canonical OSWs and KPI
+    parsing, with the simulation subprocesses awaited instead of blocking a worker.
+
+    KPI parsing runs in a worker thread (`asyncio.to_thread`) so report parsing never stalls
+    the subprocesses' completion handling. Envelope prefixes of the model cache are built by
+    measures-only runs on the same runner, within its concurrency and timeout limits.
+
+    Parameters:
+        runner (AsyncSimulationRunner): Subprocess coordinator
+        input_paths (dict): ec/oc/threshold/mat_cost/utility_rate input CSV paths, keyed as
+            in `evaluate_kpis_from_results`
+        kpi_backend (str): "csv" (eplustbl.csv) or "sql" (eplusout.sql) result extraction.
+        result_cache (SimulationResultCache | None): Persistent cache of raw simulation results
+        poll_interval (float): Seconds between result checks while another worker simulates
+    """
+
+    def __init__(
+        self, runner, input_paths, kpi_backend="csv", result_cache=None, poll_interval=1.0
+    ):
+        self.runner = runner
+        self.input_paths = dict(input_paths)
+        self.kpi_backend = kpi_backend
+        self.result_cache = result_cache
+        self.poll_interval = poll_interval
+
+    async def evaluate(self, config: dict, fidelity: str = FULL_FIDELITY) -> dict:
+        """Evaluates one ECM config at `fidelity` (see `evaluate_kpis_from_config`)."""
+        async with self.runner.admit():
+            selections, sim_key = prepare_config_evaluation(config, fidelity)
+
+            if self.result_cache is not None:
+                cached_results = await self._acquire(sim_key)
+                if cached_results is not None:
+                    return kpis_from_cached_results(selections, cached_results, **self.input_paths)
+
+            # This coroutine now owns the simulation for sim_key
+            try:
+                # A cached IDF shares the result cache's key, so it can only hit without one
+                idf_key = (
+                    idf_cache_key(sim_key, lean_output_enabled())
+                    if self.result_cache is None
+                    else None
+                )
+                kpis = await self.simulate(config, selections, idf_key, fidelity)
+                if self.result_cache is not None and "simulation_results" in kpis:
+                    self.result_cache.put(sim_key, config, kpis["simulation_results"])
+                return kpis
+
+            finally:
+                if self.result_cache is not None:
+                    self.result_cache.release(sim_key)
+
+    async def _acquire(self, sim_key):
+        # Same protocol as SimulationResultCache.acquire, but sleeping without blocking the loop
+        while True:
+            results = self.result_cache.get(sim_key)
+            if results is not None:
+                return results
+
+            if self.result_cache.claim(sim_key):
+                results = self.result_cache.get(sim_key)
+                if results is not None:
+                    self.result_cache.release(sim_key)
+                return results
+
+            await asyncio.sleep(self.poll_interval)
+
+    async def resolve_prefix(self, model_cache, config, run_id):
+        """
+        Async counterpart of `MeasurePrefixCache.resolve`: a prefix worth materializing is
+        built by a measures-only OpenStudio run on this evaluator's runner, so it counts
+        against the same concurrency slots, timeout and memory budget as the simulations.
+        """
+        plan = await asyncio.to_thread(model_cache.plan, config, ECM_OPTIONS_PATH, SEED_FILE)
+        if plan.build_key is None:
+            return plan.seed_file, plan.start_step
+
+        prefix_osw = model_cache.prefix_osw(
+            plan, config, ECM_OPTIONS_PATH, WEATHER_FILE, OSW_DIR, run_id
+        )
+        async with memory_slot_async(get_memory_scheduler(), config):
+            result = await self.runner.run_osw(
+                prefix_osw, os.path.join(OSW_DIR, "prefix_runs"), measures_only=True
+            )
+        return await asyncio.to_thread(model_cache.finish, plan, result, run_id)
+
+    async def simulate(self, config, selections, sim_key, fidelity=FULL_FIDELITY):
+        """Async counterpart of `simulate_and_evaluate_config`."""
+        timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
+        run_id = f"deephyper_{timestamp}_{uuid.uuid4().hex[:8]}"
+
+        osw_path = os.path.join(OSW_DIR, f"{run_id}.osw")
+        run_logs_dir = os.path.join(RUN_LOGS_DIR, run_id)
+
+        # Simulations wait for room in the node's memory budget (SIM_MEMORY_BUDGET_MB)
+        scheduler = get_memory_scheduler()
+
+        # Re-run a previously translated model directly with EnergyPlus when its IDF is cached
+        idf_cache = get_idf_cache() if sim_key else None
+        cached_idf = idf_cache.get(sim_key) if idf_cache is not None else None
+        if cached_idf is not None:
+            run_dir = os.path.join(run_logs_dir, run_id)
+            async with memory_slot_async(scheduler, config, runner="energyplus"):
+                result = await self.runner.run_energyplus(cached_idf, WEATHER_FILE, run_dir)
+            if scheduler is not None and result["success"]:
+                scheduler.record(config, result["resource_usage"], runner="energyplus")
+            try:
+                csv_path = csv_path_from_energyplus_result(result)
+            except (RuntimeError, FileNotFoundError) as e:
+                discard_failed_run(result)
+                print(
+                    f"⚠️ Direct EnergyPlus run failed for {run_id} — falling back to OpenStudio: {e}"
+                )
+                idf_cache.invalidate(sim_key)
+            else:
+                kpis = await asyncio.to_thread(
+                    evaluate_energyplus_run_outputs,
+                    csv_path,
+                    result["log_path"],
+                    selections,
+                    self.kpi_backend,
+                    result["persist_path"],
+                    result["scratch_dir"],
+                    fidelity,
+                    **self.input_paths,
+                )
+                return {**kpis, "resource_usage": result["resource_usage"]}
+
+        # Start from the deepest cached measure-prefix model (e.g. an already-insulated envelope)
+        seed_file, start_step = SEED_FILE, 0
+        model_cache = get_model_cache()
+        if model_cache is not None:
+            seed_file, start_step = await self.resolve_prefix(model_cache, config, run_id)
+
+        generate_osw_from_config(
+            config=config,
+            ecm_options_path=ECM_OPTIONS_PATH,
+            output_path=osw_path,
+            seed_file=seed_file,
+            weather_file=WEATHER_FILE,
+            start_step=start_step,
+            lean_output=lean_output_enabled(),
+            fidelity=fidelity,
+        )
+
+        async with memory_slot_async(scheduler, config):
+            result = await self.runner.run_osw(osw_path, run_logs_dir)
+        if scheduler is not None and result["success"]:
+            scheduler.record(config, result["resource_usage"])
+
+        try:
+            csv_path, run_dir = csv_path_from_run_result(result)
+        except RuntimeError as e:
+            if is_fatal_energyplus_error(e):
+                print("❌ OpenStudio simulation failed due to E+ fatal error. Skipping...")
+                return {**fatal_error_kpis(osw_path), "resource_usage": result["resource_usage"]}
+            raise
+        except FileNotFoundError:
+            discard_failed_run(result)
+            raise
+
+        kpis = await asyncio.to_thread(
+            evaluate_osw_run_outputs,
+            osw_path,
+            csv_path,
+            run_dir,
+            selections,
+            self.kpi_backend,
+            sim_key,
+            result["persist_path"],
+            result["scratch_dir"],
+            fidelity,
+            **self.input_paths,
+        )
+        return {**kpis, "resource_usage": result["resource_usage"]}
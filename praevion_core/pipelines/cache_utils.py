@@ -0,0 +1,94 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+
+# (path, size, mtime_ns) → sha256 hex digest, so unchanged files are only hashed once per process
+_file_hashes = {}
+
+
+def hash_file(path) -> str:
+    """
+    Returns the SHA-256 content hash of a file, memoized on (path, size, mtime).
+
+    Parameters:
+        path (str): Path to the file to hash
+
+    Returns:
+        str: Hex digest of the file contents
+    """
+    path = os.path.abspath(path)
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime_ns)
+
+    if key not in _file_hashes:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        _file_hashes[key] = digest.hexdigest()
+
+    return _file_hashes[key]
+
+
+def hash_directory(path) -> str:
+    """
+    Returns a SHA-256 hash over every file below `path` (relative paths and contents), so
+    any edit, addition or removal of a file changes the digest.
+
+    Parameters:
+        path (str): Directory to hash
+
+    Returns:
+        str: Hex digest of the directory tree
+    """
+    root = os.path.abspath(path)
+    digest = hashlib.sha256()
+
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for name in sorted(filenames):
+            file_path = os.path.join(dirpath, name)
+            rel_path = os.path.relpath(file_path, root).replace("\\", "/")
+            digest.update(f"{rel_path}\0{hash_file(file_path)}\n".encode())
+
+    return digest.hexdigest()
+
+
+def atomic_write_json(path, data):
+    """
+    Writes JSON to `path` via a temporary file and `os.replace`, so concurrent readers in
+    other worker processes never observe a partially written file.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def atomic_copy(src, dst):
+    """
+    Copies `src` to `dst` via a temporary file and `os.replace`, so concurrent readers in
+    other worker processes never observe a partially copied file.
+    """
+    directory = os.path.dirname(os.path.abspath(dst))
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copyfile(src, tmp_path)
+        os.replace(tmp_path, dst)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
@@ -0,0 +1,125 @@
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+from deephyper.evaluator.callback import Callback
+
+from praevion_core.config.fidelity import FULL_FIDELITY
+from praevion_core.pipelines.pareto import ParetoArchive, hypervolume
+
+
+class HypervolumeTracker(Callback):
+    """
+    DeepHyper evaluator callback that tracks the hypervolume of the normalized front as jobs
+    complete, and optionally stops the search once it stalls.
+
+    Each completed job's objectives go into a ParetoArchive; the hypervolume is recomputed
+    only when the front changes. With a `fidelity`, jobs simulated at another fidelity (e.g.
+    configs only screened in a multi-fidelity run) count as evaluations but never join the
+    front. With `stop_on_stall`, `search_stopped` is set (DeepHyper
+    checks it after every gathered batch) once the relative hypervolume gain over the last
+    `window` evaluations drops below `min_gain`, but never before `min_evals` evaluations.
+
+    Parameters:
+        reference (list[float]): Hypervolume reference point (worst normalized objectives)
+        window (int): Number of evaluations the gain is measured over
+        min_gain (float): Relative gain below which the search counts as stalled
+        min_evals (int): Evaluations before stopping is considered (e.g. the initial design)
+        stop_on_stall (bool): Whether to stop the search, or only track the hypervolume
+        fidelity (str | None): Fidelity of the jobs that make up the front (None = all)
+    """
+
+    def __init__(
+        self,
+        reference=(-1.0, -1.0, -1.0, -1.0),
+        window: int = 64,
+        min_gain: float = 0.001,
+        min_evals: int = 0,
+        stop_on_stall: bool = False,
+        fidelity: str | None = None,
+    ):
+        self.reference = np.asarray(reference, dtype=float)
+        self.fidelity = fidelity
+        self.window = int(window)
+        self.min_gain = float(min_gain)
+        self.min_evals = int(min_evals)
+        self.stop_on_stall = stop_on_stall
+        self.archive = ParetoArchive()
+        self.history = []  # (evaluations done, hypervolume) after each completed job
+        self.search_stopped = False
+
+    @property
+    def hypervolume(self) -> float:
+        return self.history[-1][1] if self.history else 0.0
+
+    def on_done_other(self, job):
+        self.on_done(job)
+
+    def on_done(self, job):
+        fidelity = job.metadata.get("fidelity", FULL_FIDELITY)
+        if self.fidelity is not None and fidelity != self.fidelity:
+            self.record(None)
+        else:
+            self.record(_job_objectives(job))
+
+    def record(self, objectives):
+        """Records one completed evaluation (None for a failure), e.g. replayed on resume."""
+        if objectives is not None and self.archive.add(objectives):
+            current = hypervolume(self.archive.front(), self.reference)
+        else:
+            current = self.hypervolume
+        self.history.append((len(self.history) + 1, current))
+
+        if self.stop_on_stall and not self.search_stopped and self.stalled():
+            print(
+                f"🛑 Stopping search: hypervolume gained less than {self.min_gain:.2%} over the "
+                f"last {self.window} evaluations ({self.hypervolume:.6f} after {len(self.history)})"
+            )
+            self.search_stopped = True
+
+    def relative_gain(self) -> float:
+        """Relative hypervolume gain over the last `window` evaluations (inf until available)."""
+        if len(self.history) <= self.window:
+            return np.inf
+        current = self.history[-1][1]
+        before = self.history[-1 - self.window][1]
+        if current <= 0:
+            return np.inf
+        return (current - before) / current
+
+    def stalled(self) -> bool:
+        """Whether the stopping rule is met."""
+        return len(self.history) >= self.min_evals and self.relative_gain() < self.min_gain
+
+    def save_history(self, path: str):
+        """Writes the hypervolume after each evaluation to a CSV."""
+        pd.DataFrame(self.history, columns=["evaluations", "hypervolume"]).to_csv(path, index=False)
+        print(f"📈 Hypervolume history saved → {path}")
+
+
+def _job_objectives(job):
+    # Failed evaluations come back as strings or as sys.float_info.max placeholders
+    objectives = job.objective
+    if isinstance(objectives, str) or objectives is None:
+        return None
+    objectives = np.atleast_1d(np.asarray(objectives, dtype=float))
+    if not np.all(np.isfinite(objectives)) or np.any(np.abs(objectives) >= sys.float_info.max):
+        return None
+    return objectives
+
+
+def get_hypervolume_tracker(min_evals: int = 0, fidelity: str | None = None) -> HypervolumeTracker:
+    """
+    Returns a HypervolumeTracker of the front at `fidelity`, configured from the environment.
+    HV_EARLY_STOPPING=on stops the search once the hypervolume gain over the last HV_WINDOW
+    evaluations (default 64) falls below HV_MIN_GAIN (relative, default 0.001); otherwise
+    the hypervolume is only tracked and logged.
+    """
+    return HypervolumeTracker(
+        window=int(os.getenv("HV_WINDOW", "64")),
+        min_gain=float(os.getenv("HV_MIN_GAIN", "0.001")),
+        min_evals=min_evals,
+        stop_on_stall=os.getenv("HV_EARLY_STOPPING", "off").lower() in ("on", "1", "true"),
+        fidelity=fidelity,
+    )
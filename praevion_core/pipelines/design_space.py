@@ -0,0 +1,166 @@
+import numpy as np
+from deephyper.hpo import CBO
+from deephyper.skopt.acquisition import _gaussian_acquisition
+
+from praevion_core.pipelines.search_utils import (
+    hyperparameter_choices,
+    space_forbidden_mask,
+    valid_config_mask,
+)
+
+
+class DesignSpace:
+    """
+    Every valid config of a discrete search space, enumerated once.
+
+    Configs are stored as an integer matrix of choice indices (one row per config, one
+    column per hyperparameter, in ConfigSpace order). Forbidden clauses are evaluated on the
+    full grid with vectorized comparisons; the ECM constraint bitmap then filters the rows.
+
+    Parameters:
+        space (ConfigurationSpace): Search space with categorical/ordinal hyperparameters
+        constrained (bool): Whether to apply the ECM constraints (see `valid_config_mask`)
+    """
+
+    def __init__(self, space, constrained=True):
+        hyperparameters = space.get_hyperparameters()
+        self.names = [hp.name for hp in hyperparameters]
+        self.choices = [_hyperparameter_choices(hp) for hp in hyperparameters]
+
+        sizes = [len(choices) for choices in self.choices]
+        grid = np.indices(sizes).reshape(len(sizes), -1).T
+
+        grid = grid[~space_forbidden_mask(space, self.names, self.choices, grid)]
+
+        if constrained:
+            grid = grid[valid_config_mask(self.names, self.choices, grid)]
+
+        self.matrix = grid
+        # Mixed-radix row codes, for matching configs back to rows
+        self._radix = np.cumprod([1] + sizes[:0:-1])[::-1]
+        self._codes = self.matrix @ self._radix
+        self._row_of_code = {code: row for row, code in enumerate(self._codes.tolist())}
+
+    def __len__(self):
+        return len(self.matrix)
+
+    def _decode(self, matrix):
+        return [
+            {
+                name: self.choices[j][i]
+                for j, (name, i) in enumerate(zip(self.names, row, strict=True))
+            }
+            for row in matrix.tolist()
+        ]
+
+    def configs(self, rows=None) -> list[dict]:
+        """Decodes the given rows (default: all) to config dictionaries."""
+        return self._decode(self.matrix if rows is None else self.matrix[rows])
+
+    def values(self, names: list[str], rows=None) -> list[list]:
+        """Rows as value lists ordered by `names` (e.g. an optimizer's dimension order)."""
+        columns = [self.names.index(name) for name in names]
+        matrix = self.matrix if rows is None else self.matrix[rows]
+        return [[self.choices[j][row[j]] for j in columns] for row in matrix.tolist()]
+
+    def rows_of(self, configs) -> np.ndarray:
+        """Row indices of the given configs; configs outside the valid space are skipped."""
+        rows = []
+        for config in configs:
+            try:
+                indices = [self.choices[j].index(config[name]) for j, name in enumerate(self.names)]
+            except (KeyError, ValueError):
+                continue
+            row = self._row_of_code.get(int(np.dot(indices, self._radix)))
+            if row is not None:
+                rows.append(row)
+        return np.asarray(rows, dtype=int)
+
+
+def _hyperparameter_choices(hp) -> list:
+    choices = hyperparameter_choices(hp)
+    if choices is None:
+        raise NotImplementedError(f"Design space enumeration needs discrete hyperparameters: {hp}")
+    return choices
+
+
+def top_k_rows(values: np.ndarray, k: int, exclude=None) -> np.ndarray:
+    """
+    Indices of the `k` smallest acquisition values (best first), skipping `exclude`.
+
+    Uses a partial sort, so picking a batch from the whole design space stays linear.
+    """
+    values = np.asarray(values, dtype=float).copy()
+    if exclude is not None and len(exclude):
+        values[exclude] = np.inf
+
+    candidates = np.flatnonzero(np.isfinite(values))
+    k = min(k, len(candidates))
+    if k == 0:
+        return candidates[:0]
+
+    best = candidates[np.argpartition(values[candidates], k - 1)[:k]]
+    return best[np.argsort(values[best], kind="stable")]
+
+
+class ExhaustiveCBO(CBO):
+    """
+    CBO that maximizes the acquisition function exactly over the enumerated design space.
+
+    Once the surrogate is fitted, every valid config not yet asked is scored in one batched
+    surrogate call and the best `n` are returned (argmax for a single point, top-k for a
+    batch). Initial points and the surrogate fit are left to CBO; its own acquisition
+    optimizer is switched to cheap sampling since its proposals are never used.
+
+    Parameters:
+        problem (HpProblem): Search problem with a discrete space
+        *args, **kwargs: Passed to CBO
+    """
+
+    def __init__(self, problem, *args, **kwargs):
+        kwargs["acq_optimizer"] = "sampling"
+        kwargs["acq_optimizer_kwargs"] = {
+            **(kwargs.get("acq_optimizer_kwargs") or {}),
+            "n_points": 16,
+            "acq_optimizer_freq": 1,
+        }
+        super().__init__(problem, *args, **kwargs)
+        self.design_space = DesignSpace(self._problem.space)
+        self._design_X = None
+        self._asked_rows = set()
+
+    def _ask(self, n: int = 1) -> list[dict]:
+        if self._opt is None:
+            self._setup_optimizer()
+
+        opt = self._opt
+        if opt._n_initial_points > 0 or not opt.models:
+            configs = super()._ask(n)
+            self._asked_rows.update(self.design_space.rows_of(configs).tolist())
+            return configs
+
+        names = self._problem.hyperparameter_names
+        if self._design_X is None:
+            # Transform once; the encoding of the fixed design space never changes
+            self._design_X = np.asarray(opt.space.transform(self.design_space.values(names)))
+
+        model = opt.models[-1]
+        y_opt = np.min(model.predict(np.asarray(opt.space.transform(opt.Xi))))
+        values = _gaussian_acquisition(
+            X=self._design_X,
+            model=model,
+            y_opt=y_opt,
+            acq_func=opt.cand_acq_funcs_[0],
+            acq_func_kwargs=opt.acq_func_kwargs,
+        )
+
+        told = self.design_space.rows_of([dict(zip(names, x, strict=True)) for x in opt.Xi])
+        exclude = np.union1d(told, np.fromiter(self._asked_rows, dtype=int))
+        rows = top_k_rows(values, n, exclude=exclude)
+        if len(rows) == 0:
+            # Design space exhausted: fall back to CBO's own proposals
+            return super()._ask(n)
+
+        self._asked_rows.update(rows.tolist())
+        self._num_asked += len(rows)
+        return self.design_space.configs(rows)
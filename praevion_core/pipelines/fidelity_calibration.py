@@ -0,0 +1,138 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from praevion_core.config.fidelity import FULL_FIDELITY
+from praevion_core.domain.kpis.evaluate_kpis import simulate_and_evaluate_config
+from praevion_core.pipelines.run_function_async import kpi_input_paths
+
+# KPIs whose reduced-fidelity error is reported (all driven by simulated energy)
+CALIBRATION_KPIS = ("total_emissions_kg", "discounted_utility_cost_usd", "berdo_fine_usd")
+
+
+def evaluate_at_fidelity(sample: int, config: dict, fidelity: str, kpi_backend: str = "csv"):
+    """
+    Evaluates one config at one fidelity profile for calibration. Always simulates (no
+    result or IDF cache), so every row carries a measured wall time for the speedup.
+
+    Returns:
+        dict: sample, fidelity, wall_time_s (None if it could not be measured) and the
+            CALIBRATION_KPIS
+    """
+    input_paths = kpi_input_paths()
+    kpis = simulate_and_evaluate_config(
+        config,
+        df_factors=input_paths["oc_input_path"],
+        df_embodied=input_paths["ec_input_path"],
+        df_thresholds=input_paths["threshold_input_path"],
+        df_material=input_paths["mat_cost_input_path"],
+        df_rates=input_paths["utility_rate_input_path"],
+        kpi_backend=kpi_backend,
+        fidelity=fidelity,
+    )
+    usage = kpis.get("resource_usage") or {}
+    return {
+        "sample": sample,
+        "fidelity": fidelity,
+        "wall_time_s": usage.get("wall_time_s"),
+        **{kpi: kpis.get(kpi) for kpi in CALIBRATION_KPIS},
+        "error": None,
+    }
+
+
+def calibration_row(future, sample: int, fidelity: str) -> dict:
+    """
+    Result row of one calibration job. A job that raised gets NaN KPIs and its error, so
+    `calibration_error_report` leaves it out instead of the whole calibration failing.
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        print(f"⚠️ Calibration sample {sample} failed at fidelity {fidelity}: {e}")
+        return {
+            "sample": sample,
+            "fidelity": fidelity,
+            "wall_time_s": np.nan,
+            **dict.fromkeys(CALIBRATION_KPIS, np.nan),
+            "error": str(e),
+        }
+
+
+def run_fidelity_calibration(
+    configs: list[dict], profiles: list[str], kpi_backend: str = "csv", num_workers: int = 8
+) -> pd.DataFrame:
+    """
+    Simulates every config at full fidelity and at each of `profiles`.
+
+    Parameters:
+        configs (list[dict]): ECM configs to calibrate on (e.g. a Sobol sample)
+        profiles (list[str]): Reduced fidelity profiles to compare against full fidelity
+        kpi_backend (str): "csv" (eplustbl.csv) or "sql" (eplusout.sql) result extraction
+        num_workers (int): Number of simulation worker processes
+
+    Returns:
+        pd.DataFrame: One row per (sample, fidelity), as returned by `evaluate_at_fidelity`
+            (failed jobs have NaN KPIs and their error message)
+    """
+    fidelities = [FULL_FIDELITY] + [p for p in profiles if p != FULL_FIDELITY]
+    jobs = [(i, config, fidelity) for i, config in enumerate(configs) for fidelity in fidelities]
+
+    with ProcessPoolExecutor(max_workers=num_workers) as executor:
+        futures = [
+            executor.submit(evaluate_at_fidelity, i, config, fidelity, kpi_backend)
+            for i, config, fidelity in jobs
+        ]
+        rows = [
+            calibration_row(future, i, fidelity)
+            for future, (i, _, fidelity) in zip(futures, jobs, strict=True)
+        ]
+
+    return pd.DataFrame(rows)
+
+
+def calibration_error_report(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Summarizes each reduced profile's KPI error against full fidelity.
+
+    Samples that failed at either fidelity (missing or infinite KPIs) are left out of the
+    comparison for that KPI.
+
+    Parameters:
+        df (pd.DataFrame): Output of `run_fidelity_calibration`
+
+    Returns:
+        pd.DataFrame: One row per (fidelity, kpi) with n_samples, mean_abs_error,
+            max_abs_error, mean_abs_pct_error, bias, rank_correlation (Spearman; how well
+            the profile preserves the ordering of configs) and speedup (median full-fidelity
+            wall time over the profile's)
+    """
+    df = df.astype(dict.fromkeys(("wall_time_s", *CALIBRATION_KPIS), float))
+    df = df.replace([np.inf, -np.inf], np.nan)
+    full = df[df["fidelity"] == FULL_FIDELITY].set_index("sample")
+    full_time = full["wall_time_s"].median()
+
+    rows = []
+    for fidelity, group in df[df["fidelity"] != FULL_FIDELITY].groupby("fidelity", sort=False):
+        group = group.set_index("sample")
+        speedup = full_time / group["wall_time_s"].median()
+        for kpi in CALIBRATION_KPIS:
+            pair = pd.DataFrame({"full": full[kpi], "reduced": group[kpi]}).dropna()
+            error = pair["reduced"] - pair["full"]
+            nonzero = pair["full"] != 0
+            pct_error = (error[nonzero] / pair["full"][nonzero]).abs() * 100
+            rows.append(
+                {
+                    "fidelity": fidelity,
+                    "kpi": kpi,
+                    "n_samples": len(pair),
+                    "mean_abs_error": error.abs().mean(),
+                    "max_abs_error": error.abs().max(),
+                    "mean_abs_pct_error": pct_error.mean(),
+                    "bias": error.mean(),
+                    "rank_correlation": pair["reduced"].corr(pair["full"], method="spearman"),
+                    "speedup": speedup,
+                }
+            )
+
+    return pd.DataFrame(rows)
@@ -0,0 +1,199 @@
+import atexit
+import glob
+import gzip
+import json
+import multiprocessing.util
+import os
+import threading
+
+
+def segment_path(kpi_log_path: str, worker_id) -> str:
+    """Path of one worker's segment of a KPI log (kpi_log_x.jsonl -> kpi_log_x.w<id>.jsonl)."""
+    root, ext = os.path.splitext(kpi_log_path)
+    return f"{root}.w{worker_id}{ext}"
+
+
+def compacted_path(kpi_log_path: str) -> str:
+    """Path of a KPI log's compacted, gzip-compressed form."""
+    return f"{kpi_log_path}.gz"
+
+
+def kpi_log_files(kpi_log_path: str) -> list[str]:
+    """
+    Existing files holding a KPI log's entries: its compacted form, the file itself (single
+    writer logs) and the per-worker segments.
+    """
+    root, ext = os.path.splitext(kpi_log_path)
+    candidates = [compacted_path(kpi_log_path), kpi_log_path]
+    return [path for path in candidates if os.path.exists(path)] + sorted(
+        glob.glob(f"{glob.escape(root)}.w*{ext}")
+    )
+
+
+def _open_log_file(path: str, mode: str = "rt"):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode, encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def read_kpi_log(kpi_log_path: str) -> list[dict]:
+    """
+    Parses a KPI log, merging its worker segments in timestamp order and skipping partially
+    written lines.
+    """
+    entries = []
+    for path in kpi_log_files(kpi_log_path):
+        with _open_log_file(path) as f:
+            for line in f:
+                try:
+                    entries.append(json.loads(line))
+                except json.JSONDecodeError:
+                    continue
+
+    # Stable sort, so entries sharing a timestamp keep their per-segment order
+    return sorted(entries, key=lambda entry: entry.get("timestamp", ""))
+
+
+class KpiLogWriter:
+    """
+    Appends KPI log entries to one worker's own segment file.
+
+    The segment is opened once and written through a buffer; with one file per process and a
+    lock per file, lines from concurrent evaluations never interleave. Entries are flushed to
+    the OS every `flush_every` writes, and a background thread flushes and fsyncs the segment
+    every `fsync_interval` seconds, so evaluations never wait on the disk and a killed worker
+    loses at most that many seconds of entries.
+
+    Parameters:
+        kpi_log_path (str): The run's KPI log path (segments are placed next to it)
+        worker_id: Segment suffix, unique per writing process (defaults to the PID)
+        flush_every (int): Number of entries buffered before flushing to the OS
+        fsync_interval (float): Seconds between background fsyncs
+    """
+
+    def __init__(self, kpi_log_path: str, worker_id=None, flush_every=32, fsync_interval=5.0):
+        self.path = segment_path(kpi_log_path, worker_id or os.getpid())
+        self.flush_every = max(1, int(flush_every))
+        self.fsync_interval = float(fsync_interval)
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        # Kept open for the writer's lifetime and closed by close() (atexit/finalizer)
+        self._file = open(self.path, "a", buffering=1 << 16, encoding="utf-8")  # noqa: SIM115
+        self._lock = threading.Lock()
+        self._buffered = 0
+        self._unsynced = False
+        self._stop = threading.Event()
+        self._fsync_thread = threading.Thread(target=self._fsync_loop, daemon=True)
+        self._fsync_thread.start()
+
+    def write(self, entry: dict):
+        """Appends one entry (serialized outside the lock)."""
+        line = json.dumps(entry) + "\n"
+        with self._lock:
+            self._file.write(line)
+            self._buffered += 1
+            if self._buffered >= self.flush_every:
+                self._flush_locked()
+
+    def flush(self):
+        """Flushes buffered entries to the OS."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self):
+        if self._buffered:
+            self._file.flush()
+            self._buffered = 0
+            self._unsynced = True
+
+    def _fsync_loop(self):
+        while not self._stop.wait(self.fsync_interval):
+            with self._lock:
+                self._flush_locked()
+                unsynced, self._unsynced = self._unsynced, False
+                fd = self._file.fileno()
+            if unsynced:
+                # Outside the lock: writers keep appending while the disk catches up
+                os.fsync(fd)
+
+    def close(self):
+        """Stops the fsync thread, then flushes, fsyncs and closes the segment."""
+        self._stop.set()
+        self._fsync_thread.join()
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+
+_kpi_log_writers = {}
+
+
+def default_flush_every() -> str:
+    """
+    KPI_LOG_FLUSH_EVERY default: flush every entry when MULTI_FIDELITY is on (promotion
+    decisions read the other workers' screened results from the log), else buffer 32.
+    """
+    return "1" if os.getenv("MULTI_FIDELITY", "off").lower() in ("on", "1", "true") else "32"
+
+
+def get_kpi_log_writer(kpi_log_path: str) -> KpiLogWriter:
+    """
+    Returns this process's KpiLogWriter for a KPI log. Writers are keyed by PID, so forked
+    workers open their own segment instead of sharing the parent's. KPI_LOG_FLUSH_EVERY
+    sets how many entries are buffered (see `default_flush_every`), KPI_LOG_FSYNC_S
+    (default 5) the seconds between background flush + fsync passes.
+    """
+    key = (os.getpid(), kpi_log_path)
+    if key not in _kpi_log_writers:
+        _kpi_log_writers[key] = KpiLogWriter(
+            kpi_log_path,
+            flush_every=int(os.getenv("KPI_LOG_FLUSH_EVERY", default_flush_every())),
+            fsync_interval=float(os.getenv("KPI_LOG_FSYNC_S", "5")),
+        )
+    return _kpi_log_writers[key]
+
+
+def close_kpi_log_writers(kpi_log_path: str | None = None):
+    """Closes this process's writers (all of them, or those of one KPI log)."""
+    for key in list(_kpi_log_writers):
+        pid, path = key
+        if pid == os.getpid() and kpi_log_path in (None, path):
+            _kpi_log_writers.pop(key).close()
+
+
+# multiprocessing children skip atexit but run these finalizers on a clean exit; pool workers
+# that are terminated do not, so they lose what the fsync thread has not flushed yet
+atexit.register(close_kpi_log_writers)
+multiprocessing.util.Finalize(None, close_kpi_log_writers, exitpriority=10)
+
+
+def compact_kpi_log(kpi_log_path: str) -> str | None:
+    """
+    Merges a KPI log's segments (in timestamp order) into one gzip-compressed JSONL file and
+    removes the segments. Meant for the end of a run, once the workers have exited.
+
+    Returns:
+        str | None: The compacted file's path (None if there was nothing to compact)
+    """
+    close_kpi_log_writers(kpi_log_path)
+    sources = kpi_log_files(kpi_log_path)
+    if not sources:
+        return None
+
+    entries = read_kpi_log(kpi_log_path)
+    target = compacted_path(kpi_log_path)
+    tmp_path = f"{target}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+        for entry in entries:
+            f.write(json.dumps(entry) + "\n")
+    os.replace(tmp_path, target)
+
+    for path in sources:
+        if path != target:
+            os.remove(path)
+
+    print(f"🗜️ Compacted {len(sources)} KPI log file(s) ({len(entries)} entries) → {target}")
+    return target
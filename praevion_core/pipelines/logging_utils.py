@@ -1,19 +1,34 @@
-import ast
 import json
 import os
 import shutil
 import zipfile
 from datetime import UTC, datetime
 
-import numpy as np
 import pandas as pd
 
-from praevion_core.config.paths import LOG_DIR, RESULTS_ARCHIVE, RESULTS_DIR, RUN_LOGS_DIR
+from praevion_core.config.fidelity import FULL_FIDELITY
+from praevion_core.config.paths import (
+    LOG_DIR,
+    RESULTS_ARCHIVE,
+    RESULTS_DIR,
+    RUN_LOGS_DIR,
+)
+from praevion_core.pipelines.pareto import crowding_distance
+from praevion_core.pipelines.results_store import (
+    append_summary,
+    deduplicate_results,
+    pareto_efficient_mask,
+    results_frame,
+    results_path,
+    summarize_results,
+    write_results,
+)
+from praevion_core.pipelines.scratch_dirs import persist_scratch_outputs
 
 
 def archive_logs(run_label: str):
     """
-    Archives KPI logs and result CSVs into a timestamped subdirectory under archive/.
+    Archives KPI logs and result stores into a timestamped subdirectory under archive/.
 
     Run logs are now compressed and archived at the end of the simulation run,
     so this function no longer moves the run_logs directory.
@@ -33,10 +48,12 @@ def archive_logs(run_label: str):
             except Exception as e:
                 print(f"⚠️ Failed to archive {name}: {e}")
 
-    # Archive latest results_*.csv file if it exists
+    # Archive latest results_*.parquet (or legacy .csv) files if they exist
     if os.path.exists(RESULTS_DIR):
         result_files = [
-            f for f in os.listdir(RESULTS_DIR) if f.startswith("results_") and f.endswith(".csv")
+            f
+            for f in os.listdir(RESULTS_DIR)
+            if f.startswith("results_") and f.endswith((".parquet", ".csv"))
         ]
         for f in result_files:
             full_path = os.path.join(RESULTS_DIR, f)
@@ -238,14 +255,23 @@ def delete_heavy_outputs(run_dir: str):
             os.remove(path)
 
 
-def clean_output_dir(run_dir: str):
+def clean_output_dir(run_dir: str, persist_path: str | None = None, scratch_dir: str | None = None):
     """
     Deletes large or unnecessary files in the OpenStudio run output directory,
     preserving only essentials like eplustbl.csv and model.osm.
 
+    For runs executed in scratch space (RUN_SCRATCH_ROOT), the whitelisted artifacts are
+    copied to `persist_path` and the scratch tree is removed in one operation instead.
+
     Parameters:
         run_dir (str): Path to the OpenStudio run folder (e.g., 7-run_logs/test001)
+        persist_path (str | None): Persistent destination of a scratch run's artifacts
+        scratch_dir (str | None): Scratch tree holding `run_dir`
     """
+    if scratch_dir is not None:
+        persist_scratch_outputs(run_dir, persist_path, scratch_dir)
+        return
+
     delete_heavy_outputs(run_dir)
 
 
@@ -283,7 +309,7 @@ def clean_batch_folders(project_root: str):
             item_path = os.path.join(path, item)
 
             # Skip archived KPI logs and results
-            if path == LOG_DIR and item.startswith("kpi_log_") and item.endswith(".jsonl"):
+            if path == LOG_DIR and item.startswith("kpi_log_") and item.endswith((".jsonl", ".gz")):
                 continue
             if path == LOG_DIR and item.startswith("results") and item.endswith(".csv"):
                 continue
@@ -323,149 +349,67 @@ def clean_and_prepare_osw_paths(osw_path: str, run_dir: str):
     return osw_path, run_dir
 
 
-def save_results_csv(search, run_label: str):
-    """
-    Saves all search history (configs + objective values) to a CSV file.
-    """
-    if hasattr(search, "history"):
-        df = search.history.to_dataframe()
-        os.makedirs(RESULTS_DIR, exist_ok=True)
-        path = os.path.join(RESULTS_DIR, f"results_{run_label}.csv")
-        df.to_csv(path, index=False)
-        print(f"📊 Results written to {path}")
-
-
-def expand_objectives_column(csv_path: str):
+def save_results(
+    search,
+    run_label: str,
+    replayed: pd.DataFrame | None = None,
+    fidelity: str | None = FULL_FIDELITY,
+):
     """
-    Loads a results CSV, expands the 'm:objectives' dictionary column into separate columns,
-    and saves the updated CSV in-place.
+    Writes the search history (configs, objective values, fidelity and KPI columns),
+    deduplicated by objective values, to the run's results store (see `results_path`) in one
+    pass.
 
     Parameters:
-        csv_path (str): Path to the results_*.csv file.
-    """
-    # Ensure results file exists
-    if not os.path.exists(csv_path):
-        print(f"⚠️ Could not find results file at {csv_path}")
-        return
-    # Load to csv and check column exists
-    df = pd.read_csv(csv_path)
-    if "m:objectives" not in df.columns:
-        print(f"⚠️ Column 'm:objectives' not found in {csv_path}")
-        return
-
-    try:
-        # Unpack KPI values from the dict
-        objectives_expanded = df["m:objectives"].apply(ast.literal_eval).apply(pd.Series)
-        kpi_cols = [
-            "operational_carbon_kg",
-            "embodied_carbon_kg",
-            "berdo_fine_usd",
-            "utility_cost_usd",
-            "longrun_cost_usd",
-            "material_cost_usd",
-        ]
-        for col in kpi_cols:
-            df[col] = objectives_expanded.get(col, float("nan"))
-
-        # Dedup based on objective_* values, preferring pareto_efficient=True if present
-        obj_cols = ["objective_0", "objective_1", "objective_2", "objective_3"]
-        if all(col in df.columns for col in obj_cols):
-            original_len = len(df)
-
-            # Mark duplicates
-            df["_dup_key"] = df[obj_cols].apply(lambda row: tuple(row), axis=1)
-            grouped = df.groupby("_dup_key", sort=False)
-
-            to_keep = []
-            for _, group in grouped:
-                if len(group) == 1:
-                    to_keep.append(group.index[0])
-                else:
-                    pareto = group[group["pareto_efficient"]]
-                    if not pareto.empty:
-                        to_keep.append(pareto.index[0])  # Keep any one Pareto-efficient entry
-                    else:
-                        to_keep.append(group.index[0])  # Fallback to first
-
-            df = df.loc[to_keep].drop(columns=["_dup_key"]).reset_index(drop=True)
-            removed = original_len - len(df)
-            if removed > 0:
-                print(f"🧹 Removed {removed} duplicate rows based on objective_* values.")
-
-        # Save the cleaned and expanded CSV
-        df.to_csv(csv_path, index=False)
-        print(f"📂 Cleaned and unpacked results saved → {csv_path}")
-
-    except Exception as e:
-        print(f"❌ Failed to unpack KPIs from 'm:objectives': {e}")
-
+        search (CBO): Finished search
+        run_label (str): Label for the current run
+        replayed (pd.DataFrame | None): Evaluations a resumed run replayed from its KPI log
+            (see `replay_frame`); they are stored alongside the new ones
+        fidelity (str | None): Fidelity of the reported front; Pareto efficiency is
+            recomputed over the rows at this fidelity only, so configs that were only
+            screened in a multi-fidelity run never land on the front
 
-def log_optimization_summary_to_csv(
-    csv_path: str, run_label: str, max_evals: int, output_csv_path: str
+    Returns:
+        pd.DataFrame | None: The stored results table (None if the search has no history)
+    """
+    if not hasattr(search, "history"):
+        return None
+
+    df = results_frame(search.history.to_dataframe())
+    if replayed is not None and not replayed.empty:
+        df = pd.concat([replayed, df], ignore_index=True)
+    df["pareto_efficient"] = pareto_efficient_mask(df, fidelity)
+
+    df = deduplicate_results(df)
+    write_results(df, results_path(run_label))
+    return df
+
+
+def log_optimization_summary(
+    df: pd.DataFrame,
+    run_label: str,
+    max_evals: int,
+    output_csv_path: str,
+    hypervolume: float | None = None,
+    fidelity: str | None = FULL_FIDELITY,
 ):
     """
     Logs a summary of optimization performance to a CSV file.
 
     Parameters:
-        csv_path (str): Path to the results CSV after expansion and deduplication.
+        df (pd.DataFrame): Results table after deduplication (see `save_results`).
         run_label (str): Label for the current run (e.g. 'run_300e').
         max_evals (int): The number of total evaluations performed in the search.
         output_csv_path (str): Path to the summary log CSV (e.g., 'optimization_runs_summary.csv').
+        hypervolume (float | None): Final hypervolume of the normalized front, if tracked.
+        fidelity (str | None): Fidelity of the reported front (see `summarize_results`).
     """
-    if not os.path.exists(csv_path):
-        print(f"⚠️ Results file not found at {csv_path}")
+    if df is None or df.empty:
+        print(f"⚠️ No results to summarize for {run_label}")
         return
 
-    df = pd.read_csv(csv_path)
-    if df.empty:
-        print(f"⚠️ Results file is empty: {csv_path}")
-        return
-
-    # Extract non-dominated points (Pareto front)
-    pareto_df = df[df["pareto_efficient"]]
-    num_pareto = len(pareto_df)
-
-    # Define objective columns
-    obj_cols = ["objective_0", "objective_1", "objective_2", "objective_3"]
-
-    # Compute number of rows and deduplicates
-    num_final = len(df)
-    num_duplicates = max_evals - num_final
-
-    # Compute objective ranges
-    obj_ranges = {col: (df[col].min(), df[col].max()) for col in obj_cols if col in df.columns}
-
-    # Compute crowding distance stats (only if pareto front exists)
-    crowding_mean = np.nan
-    crowding_std = np.nan
-    if not pareto_df.empty:
-        crowding = compute_crowding_distance(pareto_df, obj_cols)
-        crowding_mean = round(crowding.replace(np.inf, np.nan).mean(), 4)
-        crowding_std = round(crowding.replace(np.inf, np.nan).std(), 4)
-
-    # Prepare summary row
-    summary_row = {
-        "timestamp": datetime.now().isoformat(),
-        "run_label": run_label,
-        "max_evals": max_evals,
-        "final_configs": num_final,
-        "duplicates_removed": num_duplicates,
-        "pareto_size": num_pareto,
-        "crowding_mean": crowding_mean,
-        "crowding_std": crowding_std,
-    }
-    for col, (obj_min, obj_max) in obj_ranges.items():
-        summary_row[f"{col}_min"] = round(obj_min, 4)
-        summary_row[f"{col}_max"] = round(obj_max, 4)
-
-    # Append to summary log
-    summary_df = pd.DataFrame([summary_row])
-    if os.path.exists(output_csv_path):
-        summary_df.to_csv(output_csv_path, mode="a", header=False, index=False)
-    else:
-        summary_df.to_csv(output_csv_path, index=False)
-
-    print(f"📈 Logged optimization summary → {output_csv_path}")
+    summary_row = summarize_results(df, run_label, max_evals, hypervolume, fidelity)
+    append_summary(summary_row, output_csv_path)
 
 
 def compute_crowding_distance(df: pd.DataFrame, objective_cols: list) -> pd.Series:
@@ -480,25 +424,6 @@ def compute_crowding_distance(df: pd.DataFrame, objective_cols: list) -> pd.Seri
     Returns:
         pd.Series: Crowding distance values (same index as df).
     """
-    n = len(df)
-    if n == 0:
+    if len(df) == 0:
         return pd.Series(dtype=float)
-    if n == 1:
-        return pd.Series([np.inf], index=df.index)
-
-    distances = np.zeros(n)
-
-    for col in objective_cols:
-        sorted_idx = df[col].argsort()
-        sorted_df = df.iloc[sorted_idx]
-
-        # Assign infinite distance to boundary points
-        distances[sorted_idx[0]] = distances[sorted_idx[-1]] = np.inf
-
-        # Add crowding distance for interior points (objectives already scaled)
-        for i in range(1, n - 1):
-            prev_val = sorted_df.iloc[i + 1][col]
-            next_val = sorted_df.iloc[i - 1][col]
-            distances[sorted_idx[i]] += abs(prev_val - next_val)
-
-    return pd.Series(distances, index=df.index)
+    return pd.Series(crowding_distance(df[objective_cols].to_numpy(dtype=float)), index=df.index)
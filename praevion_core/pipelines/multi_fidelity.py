@@ -0,0 +1,162 @@
+import os
+from collections import Counter
+
+import numpy as np
+
+from praevion_core.config.fidelity import FULL_FIDELITY, active_fidelity, get_fidelity_profile
+from praevion_core.pipelines.kpi_log import read_kpi_log
+from praevion_core.pipelines.pareto import get_pareto_archive
+
+
+class MultiFidelityPolicy:
+    """
+    Decides which configs are worth a full-fidelity simulation.
+
+    Every candidate is first simulated at `low_fidelity`. Its normalized objectives (larger is
+    better, as fed to DeepHyper) are compared with the low-fidelity objectives of all configs
+    evaluated so far; it is promoted to `high_fidelity` unless some earlier config beats it
+    by more than `margin` in every objective. Comparing low-fidelity results with each other
+    keeps a profile's systematic bias out of the decision.
+
+    The reference set is the low-fidelity front of the process's ParetoArchive, synced from
+    the KPI log that every worker process appends to, so promotion decisions see the whole
+    search and not just one worker's share. Each sync only reads the bytes appended since
+    the previous one.
+
+    Configs that are not promoted return their screened objectives to the optimizer, shifted
+    by the profile's bias (see `objective_bias`) so the surrogate sees values comparable to
+    full-fidelity ones. They never count towards the reported front.
+
+    Parameters:
+        low_fidelity (str): Screening profile every candidate is simulated at
+        high_fidelity (str): Profile promoted configs are re-simulated at
+        margin (float): Normalized-objective slack around the current front
+        min_bias_pairs (int): Promoted configs needed before screened objectives are
+            bias-corrected (0 disables the correction)
+    """
+
+    def __init__(
+        self,
+        low_fidelity="screening",
+        high_fidelity=FULL_FIDELITY,
+        margin=0.02,
+        min_bias_pairs=5,
+    ):
+        get_fidelity_profile(low_fidelity)
+        get_fidelity_profile(high_fidelity)
+        self.low_fidelity = low_fidelity
+        self.high_fidelity = high_fidelity
+        self.margin = float(margin)
+        self.min_bias_pairs = int(min_bias_pairs)
+
+    def reference_objectives(self, kpi_log_path: str) -> np.ndarray:
+        """
+        Normalized objectives of the non-dominated successful low-fidelity evaluations in
+        the KPI log (enough for `is_near_front`).
+        """
+        archive = get_pareto_archive(self.low_fidelity)
+        archive.sync(kpi_log_path)
+        return archive.front()
+
+    def objective_bias(self, kpi_log_path: str) -> np.ndarray | None:
+        """
+        Mean full-minus-screened normalized objectives over the promoted configs in the KPI
+        log (each was evaluated at both fidelities), or None until `min_bias_pairs` exist.
+        """
+        if self.min_bias_pairs <= 0:
+            return None
+
+        low, high = (get_pareto_archive(f) for f in (self.low_fidelity, self.high_fidelity))
+        low.sync(kpi_log_path)
+        high.sync(kpi_log_path)
+        return fidelity_bias(
+            low.objectives_by_run_id(), high.objectives_by_run_id(), self.min_bias_pairs
+        )
+
+    def bias_from_entries(self, entries: list[dict]) -> np.ndarray | None:
+        """`objective_bias` computed from already parsed KPI log entries (e.g. on resume)."""
+        if self.min_bias_pairs <= 0:
+            return None
+
+        by_fidelity = {self.low_fidelity: {}, self.high_fidelity: {}}
+        for entry in entries:
+            objectives = by_fidelity.get(entry.get("fidelity", FULL_FIDELITY))
+            if objectives is not None and entry.get("success"):
+                objectives[entry.get("run_id")] = entry["objectives"]["normalized_objective_values"]
+        return fidelity_bias(
+            by_fidelity[self.low_fidelity], by_fidelity[self.high_fidelity], self.min_bias_pairs
+        )
+
+    def corrected(self, screened: dict, bias: np.ndarray | None) -> dict:
+        """
+        A non-promoted screening result with its objectives shifted by `bias`; the KPI log
+        keeps the raw screened values, the metadata records the applied bias.
+        """
+        if bias is None or not screened["metadata"].get("success"):
+            return screened
+        return {
+            "objective": (np.asarray(screened["objective"], dtype=float) + bias).tolist(),
+            "metadata": {**screened["metadata"], "objective_bias": bias.tolist()},
+        }
+
+    def should_promote(self, result: dict, reference: np.ndarray) -> bool:
+        """
+        Whether a low-fidelity evaluation (as returned by `record_success`/`record_failure`)
+        lands within `margin` of the Pareto front of `reference`.
+        """
+        if not result["metadata"].get("success"):
+            return False
+        return is_near_front(result["objective"], reference, self.margin)
+
+
+def is_near_front(objectives, reference: np.ndarray, margin: float) -> bool:
+    """
+    True unless a reference point beats `objectives` by more than `margin` in every
+    objective (maximization). Checking every reference point is equivalent to checking
+    only the non-dominated ones.
+    """
+    if len(reference) == 0:
+        return True
+    candidate = np.asarray(objectives, dtype=float) + margin
+    return not bool(np.any(np.all(reference > candidate, axis=1)))
+
+
+def fidelity_bias(low: dict, high: dict, min_pairs: int = 1) -> np.ndarray | None:
+    """
+    Mean high-minus-low objective difference over the run_ids present in both `low` and
+    `high` (run_id -> objective vector), or None with fewer than `min_pairs` of them.
+    """
+    pairs = [run_id for run_id in high if run_id in low]
+    if not pairs or len(pairs) < min_pairs:
+        return None
+    return np.mean([np.subtract(high[run_id], low[run_id]) for run_id in pairs], axis=0)
+
+
+def fidelity_counts(kpi_log_path: str) -> Counter:
+    """Number of logged evaluations per fidelity (entries without a fidelity count as full)."""
+    return Counter(entry.get("fidelity", FULL_FIDELITY) for entry in read_kpi_log(kpi_log_path))
+
+
+def get_multi_fidelity_policy():
+    """
+    Returns the MultiFidelityPolicy, or None unless MULTI_FIDELITY is on (default off).
+    MF_LOW_FIDELITY picks the screening profile (default screening), MF_PROMOTION_MARGIN
+    the normalized-objective slack around the front (default 0.02) and MF_BIAS_MIN_PAIRS
+    the promotions needed before screened objectives are bias-corrected (default 5, 0 = off).
+    """
+    if os.getenv("MULTI_FIDELITY", "off").lower() not in ("on", "1", "true"):
+        return None
+
+    return MultiFidelityPolicy(
+        low_fidelity=os.getenv("MF_LOW_FIDELITY", "screening"),
+        margin=float(os.getenv("MF_PROMOTION_MARGIN", "0.02")),
+        min_bias_pairs=int(os.getenv("MF_BIAS_MIN_PAIRS", "5")),
+    )
+
+
+def front_fidelity(policy: MultiFidelityPolicy | None = None) -> str:
+    """
+    Fidelity whose evaluations make up a run's reported front and hypervolume: the promoted
+    fidelity in multi-fidelity mode, else the one every config is simulated at.
+    """
+    return policy.high_fidelity if policy is not None else active_fidelity()
@@ -0,0 +1,258 @@
+import gzip
+import json
+import threading
+
+import numpy as np
+
+from praevion_core.config.fidelity import FULL_FIDELITY
+from praevion_core.pipelines.kpi_log import kpi_log_files
+
+
+def dominated_mask(points: np.ndarray, candidate) -> np.ndarray:
+    """True for each row of `points` that `candidate` dominates (maximization)."""
+    candidate = np.asarray(candidate, dtype=float)
+    return np.all(candidate >= points, axis=1) & np.any(candidate > points, axis=1)
+
+
+def is_dominated(candidate, points: np.ndarray) -> bool:
+    """Whether some row of `points` dominates `candidate` (maximization)."""
+    candidate = np.asarray(candidate, dtype=float)
+    return bool(np.any(np.all(points >= candidate, axis=1) & np.any(points > candidate, axis=1)))
+
+
+def non_dominated_ranks(points: np.ndarray) -> np.ndarray:
+    """
+    Non-dominated sorting rank of every point (0 = Pareto front, 1 = front once rank 0 is
+    removed, ...), for maximized objectives. The pairwise dominance matrix is built once;
+    fronts are then peeled off by counting remaining dominators per point.
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    ranks = np.full(n, -1, dtype=int)
+    if n == 0:
+        return ranks
+
+    # dominates[i, j]: point i dominates point j
+    geq = np.all(points[:, None, :] >= points[None, :, :], axis=2)
+    gt = np.any(points[:, None, :] > points[None, :, :], axis=2)
+    dominates = geq & gt
+
+    dominator_counts = dominates.sum(axis=0)
+    current = np.flatnonzero(dominator_counts == 0)
+    rank = 0
+    while len(current):
+        ranks[current] = rank
+        dominator_counts = dominator_counts - dominates[current].sum(axis=0)
+        dominator_counts[ranks >= 0] = -1
+        current = np.flatnonzero(dominator_counts == 0)
+        rank += 1
+    return ranks
+
+
+def crowding_distance(points: np.ndarray) -> np.ndarray:
+    """
+    Crowding distance of each point of a front with already scaled objectives: the sum over
+    objectives of the gap between its two neighbours, infinite at the boundaries.
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    if n <= 2:
+        return np.full(n, np.inf)
+
+    order = np.argsort(points, axis=0, kind="stable")
+    ordered = np.take_along_axis(points, order, axis=0)
+
+    distances = np.zeros(n)
+    np.add.at(distances, order[1:-1].ravel(), np.abs(ordered[2:] - ordered[:-2]).ravel())
+    distances[order[0]] = np.inf
+    distances[order[-1]] = np.inf
+    return distances
+
+
+class ParetoArchive:
+    """
+    In-memory non-dominated set of evaluated objective vectors (maximized, as fed to
+    DeepHyper), updated incrementally as evaluations complete.
+
+    Each `add` is one vectorized dominance check against the current front; a new point that
+    survives evicts the front members it dominates. All points are kept so that ranks can be
+    computed at any time. Entries are keyed by run_id, so re-adding an evaluation (e.g. when
+    `sync` reads back one this process logged itself) is a no-op.
+
+    Parameters:
+        fidelity (str): Fidelity of the evaluations this archive holds (see `sync`)
+    """
+
+    def __init__(self, fidelity: str = FULL_FIDELITY):
+        self.fidelity = fidelity
+        self._points = np.empty((0, 0))
+        self._size = 0
+        self._entries = []
+        self._run_ids = set()
+        self._front = np.empty(0, dtype=int)
+        self._log_offsets = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return self._size
+
+    def add(self, objectives, entry: dict | None = None) -> bool:
+        """
+        Adds an evaluation's objective vector (with optional metadata, e.g. its KPI log
+        entry). Returns whether it joined the front.
+        """
+        entry = entry or {}
+        point = np.asarray(objectives, dtype=float)
+
+        with self._lock:
+            run_id = entry.get("run_id")
+            if run_id is not None:
+                if run_id in self._run_ids:
+                    return False
+                self._run_ids.add(run_id)
+
+            index = self._append(point, entry)
+            front_points = self._points[self._front]
+            if is_dominated(point, front_points):
+                return False
+
+            self._front = np.append(self._front[~dominated_mask(front_points, point)], index)
+            return True
+
+    def _append(self, point: np.ndarray, entry: dict) -> int:
+        if self._size == 0:
+            self._points = np.empty((16, len(point)))
+        elif self._size == len(self._points):
+            # Grow geometrically so appends stay amortized O(1)
+            self._points = np.concatenate([self._points, np.empty_like(self._points)])
+
+        self._points[self._size] = point
+        self._entries.append(entry)
+        self._size += 1
+        return self._size - 1
+
+    def sync(self, kpi_log_path: str) -> int:
+        """
+        Adds the successful evaluations at this archive's fidelity that were appended to a
+        KPI log (any of its worker segments) since the last sync. Only new bytes are read.
+
+        Returns:
+            int: Number of new log lines consumed
+        """
+        consumed = 0
+        for path in kpi_log_files(kpi_log_path):
+            consumed += self._sync_file(path)
+        return consumed
+
+    def _sync_file(self, path: str) -> int:
+        if path.endswith(".gz"):
+            # A compacted log is complete: read it once
+            if path in self._log_offsets:
+                return 0
+            with gzip.open(path, "rb") as f:
+                complete = f.read()
+            self._log_offsets[path] = len(complete)
+        else:
+            with open(path, "rb") as f:
+                f.seek(self._log_offsets.get(path, 0))
+                data = f.read()
+
+            # Leave a partially written last line for the next sync
+            complete = data[: data.rfind(b"\n") + 1]
+            self._log_offsets[path] = self._log_offsets.get(path, 0) + len(complete)
+
+        lines = complete.splitlines()
+        for line in lines:
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if entry.get("success") and entry.get("fidelity", FULL_FIDELITY) == self.fidelity:
+                self.add(entry["objectives"]["normalized_objective_values"], entry)
+        return len(lines)
+
+    @property
+    def objectives(self) -> np.ndarray:
+        """Objective vectors of every archived evaluation, in insertion order."""
+        return self._points[: self._size].copy()
+
+    def objectives_by_run_id(self) -> dict:
+        """Objective vector of each archived evaluation that has a run_id."""
+        with self._lock:
+            return {
+                entry["run_id"]: self._points[i].copy()
+                for i, entry in enumerate(self._entries)
+                if entry.get("run_id") is not None
+            }
+
+    def front(self) -> np.ndarray:
+        """Objective vectors of the current non-dominated set."""
+        return self._points[self._front].copy()
+
+    def front_entries(self) -> list[dict]:
+        """Metadata of the current non-dominated set, aligned with `front()`."""
+        return [self._entries[i] for i in self._front]
+
+    def ranks(self) -> np.ndarray:
+        """Non-dominated sorting rank of every archived evaluation (0 = on the front)."""
+        return non_dominated_ranks(self.objectives)
+
+    def crowding_distance(self) -> np.ndarray:
+        """Crowding distance of each front member, aligned with `front()`."""
+        return crowding_distance(self.front())
+
+
+_pareto_archives = {}
+
+
+def get_pareto_archive(fidelity: str = FULL_FIDELITY) -> ParetoArchive:
+    """
+    Returns this process's ParetoArchive for a fidelity. Fidelities get separate archives
+    since their objectives are not directly comparable.
+    """
+    if fidelity not in _pareto_archives:
+        _pareto_archives[fidelity] = ParetoArchive(fidelity)
+    return _pareto_archives[fidelity]
+
+
+def hypervolume(points: np.ndarray, reference) -> float:
+    """
+    Exact hypervolume dominated by `points` (maximized objectives) and bounded below by
+    `reference`. Points not strictly better than the reference in every objective add
+    nothing.
+
+    Computed by slicing along the last objective: each slab between consecutive values is
+    the (d-1)-dimensional hypervolume of the points reaching it, times its depth; the 2-D
+    base case is a vectorized staircase sum.
+    """
+    points = np.asarray(points, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+    if len(points) == 0:
+        return 0.0
+
+    points = points[np.all(points > reference, axis=1)] - reference
+    if len(points) == 0:
+        return 0.0
+    return _hypervolume_from_origin(points[non_dominated_ranks(points) == 0])
+
+
+def _hypervolume_from_origin(points: np.ndarray) -> float:
+    # Dominated points only add overlapping volume, so slices are not re-filtered
+    if points.shape[1] == 1:
+        return float(points.max())
+
+    if points.shape[1] == 2:
+        # Sorted by x descending, the running max of y traces a staircase of rectangles
+        order = np.argsort(-points[:, 0], kind="stable")
+        y = np.maximum.accumulate(points[order, 1])
+        return float(np.sum(points[order, 0] * np.diff(y, prepend=0.0)))
+
+    points = points[np.argsort(-points[:, -1], kind="stable")]
+    depths = points[:, -1] - np.append(points[1:, -1], 0.0)
+    return float(
+        sum(
+            _hypervolume_from_origin(points[: k + 1, :-1]) * depth
+            for k, depth in enumerate(depths)
+            if depth > 0
+        )
+    )
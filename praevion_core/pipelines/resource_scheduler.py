@@ -0,0 +1,254 @@
+import asyncio
+import contextlib
+import os
+import socket
+import sqlite3
+import time
+import uuid
+
+from praevion_core.config.paths import RESOURCE_USAGE_DB
+from praevion_core.pipelines.result_cache import INFLIGHT_STALE_AFTER_S, is_abandoned_claim
+
+# Config entries whose choice dominates a simulation's memory footprint (system sizing,
+# plant loops and the number of EnergyPlus components scale with them)
+MEMORY_GROUP_MEASURES = ("upgrade_hvac_system_choice", "upgrade_dhw_to_hpwh")
+
+
+def memory_group(config: dict) -> str:
+    """Returns the resource-usage group of a config (its HVAC and DHW choices)."""
+    return "|".join(str(config.get(measure, "")).strip() for measure in MEMORY_GROUP_MEASURES)
+
+
+class MemoryAwareScheduler:
+    """
+    Admits simulations only while their projected peak memory fits a node-wide budget.
+
+    Every completed simulation's peak RSS is recorded per memory group (HVAC/DHW choice) and
+    runner ("openstudio" or "energyplus"); a new simulation is projected at the largest of
+    the group's recent measurements (falling back to all groups, then `default_mb`). Running
+    simulations hold reservations in a shared SQLite database, so the budget is enforced
+    across DeepHyper worker processes as well as within the asyncio evaluator, and the
+    measurements carry over between runs.
+
+    A simulation is always admitted when nothing else is running, so a single run larger
+    than the budget still makes progress.
+
+    Parameters:
+        budget_mb (float): Memory available to concurrent simulations on this node
+        db_path (str): Path to the SQLite database file
+        default_mb (float): Projection for groups without any measurement yet
+        history (int): Number of recent measurements per group used for the projection
+        headroom (float): Multiplier applied to measured peaks
+        poll_interval (float): Seconds between admission attempts while the node is full
+        stale_after (float): Age in seconds after which a reservation is reclaimed
+    """
+
+    def __init__(
+        self,
+        budget_mb,
+        db_path=RESOURCE_USAGE_DB,
+        default_mb=2048.0,
+        history=20,
+        headroom=1.1,
+        poll_interval=1.0,
+        stale_after=INFLIGHT_STALE_AFTER_S,
+    ):
+        self.budget_mb = float(budget_mb)
+        self.db_path = str(db_path)
+        self.default_mb = float(default_mb)
+        self.history = history
+        self.headroom = headroom
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self._hostname = socket.gethostname()
+        self._conn = None
+        self._pid = None
+
+    def _connect(self):
+        # Connections must not cross a fork, so reconnect in each worker process
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            # Autocommit mode: admission runs its own BEGIN IMMEDIATE transaction
+            conn = sqlite3.connect(self.db_path, timeout=30.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS resource_usage (
+                    memory_group TEXT NOT NULL,
+                    runner TEXT NOT NULL,
+                    max_rss_mb REAL NOT NULL,
+                    wall_time_s REAL,
+                    recorded_at REAL NOT NULL
+                )
+                """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS resource_usage_group
+                ON resource_usage (memory_group, runner, recorded_at)
+                """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS reservations (
+                    id TEXT PRIMARY KEY,
+                    hostname TEXT NOT NULL,
+                    pid INTEGER NOT NULL,
+                    memory_mb REAL NOT NULL,
+                    reserved_at REAL NOT NULL
+                )
+                """)
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def record(self, config: dict, usage: dict, runner="openstudio"):
+        """Stores a completed simulation's resource usage (ignored when peak RSS is unknown)."""
+        if not usage or usage.get("max_rss_mb") is None:
+            return
+        self._connect().execute(
+            "INSERT INTO resource_usage VALUES (?, ?, ?, ?, ?)",
+            (
+                memory_group(config),
+                runner,
+                usage["max_rss_mb"],
+                usage.get("wall_time_s"),
+                time.time(),
+            ),
+        )
+
+    def projected_mb(self, config: dict, runner="openstudio") -> float:
+        """Projected peak memory of a config's simulation, in MB."""
+        conn = self._connect()
+        row = conn.execute(
+            """
+            SELECT MAX(max_rss_mb) FROM (
+                SELECT max_rss_mb FROM resource_usage
+                WHERE memory_group = ? AND runner = ?
+                ORDER BY recorded_at DESC LIMIT ?
+            )
+            """,
+            (memory_group(config), runner, self.history),
+        ).fetchone()
+        if row[0] is None:
+            row = conn.execute(
+                "SELECT MAX(max_rss_mb) FROM resource_usage WHERE runner = ?", (runner,)
+            ).fetchone()
+        if row[0] is None:
+            return self.default_mb
+        return row[0] * self.headroom
+
+    def try_reserve(self, config: dict, runner="openstudio"):
+        """
+        Reserves memory for one simulation if it fits the budget.
+
+        Returns:
+            str | None: Reservation id to pass to `release`, or None if the node is full
+        """
+        projected = self.projected_mb(config, runner)
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            reservations = conn.execute(
+                "SELECT id, hostname, pid, memory_mb, reserved_at FROM reservations"
+            ).fetchall()
+            reserved_mb = 0.0
+            for reservation_id, hostname, pid, memory_mb, reserved_at in reservations:
+                if is_abandoned_claim(hostname, pid, reserved_at, self.stale_after, self._hostname):
+                    conn.execute("DELETE FROM reservations WHERE id = ?", (reservation_id,))
+                else:
+                    reserved_mb += memory_mb
+
+            if reserved_mb > 0 and reserved_mb + projected > self.budget_mb:
+                conn.execute("COMMIT")
+                return None
+
+            reservation_id = uuid.uuid4().hex
+            conn.execute(
+                "INSERT INTO reservations VALUES (?, ?, ?, ?, ?)",
+                (reservation_id, self._hostname, os.getpid(), projected, time.time()),
+            )
+            conn.execute("COMMIT")
+            return reservation_id
+
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def release(self, reservation_id):
+        self._connect().execute("DELETE FROM reservations WHERE id = ?", (reservation_id,))
+
+    @contextlib.contextmanager
+    def slot(self, config: dict, runner="openstudio"):
+        """Blocks until the simulation fits the memory budget and holds its reservation."""
+        announced = False
+        while (reservation_id := self.try_reserve(config, runner)) is None:
+            if not announced:
+                print(f"⏳ Memory budget ({self.budget_mb:.0f} MB) in use — waiting to simulate...")
+                announced = True
+            time.sleep(self.poll_interval)
+        try:
+            yield
+        finally:
+            self.release(reservation_id)
+
+    @contextlib.asynccontextmanager
+    async def slot_async(self, config: dict, runner="openstudio"):
+        """Asyncio counterpart of `slot` (waits without blocking the event loop)."""
+        while (reservation_id := self.try_reserve(config, runner)) is None:
+            await asyncio.sleep(self.poll_interval)
+        try:
+            yield
+        finally:
+            self.release(reservation_id)
+
+    def close(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+
+def memory_budget_mb():
+    """
+    Parses SIM_MEMORY_BUDGET_MB: a number of MB, "auto" (80% of physical memory) or unset /
+    "off" (no memory-aware scheduling).
+    """
+    budget = os.getenv("SIM_MEMORY_BUDGET_MB", "off").strip().lower()
+    if budget in ("", "off", "0", "false"):
+        return None
+    if budget == "auto":
+        try:
+            total_bytes = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+        except (AttributeError, ValueError, OSError):
+            print("⚠️ SIM_MEMORY_BUDGET_MB=auto is not supported on this platform — disabled.")
+            return None
+        return 0.8 * total_bytes / (1024 * 1024)
+    return float(budget)
+
+
+_scheduler = None
+
+
+def get_memory_scheduler():
+    """
+    Returns the process-wide MemoryAwareScheduler, or None unless SIM_MEMORY_BUDGET_MB is
+    set. SIM_DEFAULT_MEMORY_MB sets the projection for configs without measurements.
+    """
+    global _scheduler
+
+    budget_mb = memory_budget_mb()
+    if budget_mb is None:
+        return None
+
+    if _scheduler is None or _scheduler.budget_mb != budget_mb:
+        _scheduler = MemoryAwareScheduler(
+            budget_mb, default_mb=float(os.getenv("SIM_DEFAULT_MEMORY_MB", "2048"))
+        )
+    return _scheduler
+
+
+def memory_slot(scheduler, config: dict, runner="openstudio"):
+    """`scheduler.slot(...)`, or a no-op context when memory-aware scheduling is disabled."""
+    return scheduler.slot(config, runner) if scheduler is not None else contextlib.nullcontext()
+
+
+def memory_slot_async(scheduler, config: dict, runner="openstudio"):
+    """Asyncio counterpart of `memory_slot`."""
+    if scheduler is None:
+        return contextlib.nullcontext()
+    return scheduler.slot_async(config, runner)
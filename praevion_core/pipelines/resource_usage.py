@@ -0,0 +1,129 @@
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+# ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+_MAXRSS_TO_MB = 1 / (1024 * 1024) if sys.platform == "darwin" else 1 / 1024
+
+
+def run_with_resource_usage(command, cwd, timeout=None):
+    """
+    Runs a subprocess to completion and measures what it cost.
+
+    On POSIX the child is reaped with `os.wait4`, which returns its own rusage (including any
+    processes it waited for), so the numbers stay exact even when other simulations run
+    concurrently. Elsewhere only the wall time is recorded.
+
+    Parameters:
+        command (list[str]): Command to execute
+        cwd (str): Working directory for the subprocess
+        timeout (float | None): Seconds before the process is killed (None = no limit)
+
+    Returns:
+        tuple:
+            - returncode (int): Exit status (negative signal number if killed)
+            - stdout (bytes): Captured stdout
+            - stderr (bytes): Captured stderr
+            - usage (dict): wall_time_s, user_cpu_s, sys_cpu_s, max_rss_mb (None if unknown)
+    """
+    if not hasattr(os, "wait4"):
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=cwd, capture_output=True, timeout=timeout, check=False)
+        usage = empty_usage(time.perf_counter() - start)
+        return result.returncode, result.stdout, result.stderr, usage
+
+    # Spool output to files: reading pipes would need communicate(), which reaps the child
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        start = time.perf_counter()
+        process = subprocess.Popen(command, cwd=cwd, stdout=out, stderr=err)
+
+        deadline = start + timeout if timeout is not None else None
+        while True:
+            pid, status, rusage = os.wait4(process.pid, os.WNOHANG if deadline is not None else 0)
+            if pid != 0:
+                break
+            if time.perf_counter() > deadline:
+                process.kill()
+                pid, status, rusage = os.wait4(process.pid, 0)
+                break
+            time.sleep(0.1)
+
+        wall_time_s = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+
+        out.seek(0)
+        err.seek(0)
+        stdout, stderr = out.read(), err.read()
+
+    usage = {
+        "wall_time_s": round(wall_time_s, 3),
+        "user_cpu_s": round(rusage.ru_utime, 3),
+        "sys_cpu_s": round(rusage.ru_stime, 3),
+        "max_rss_mb": round(rusage.ru_maxrss * _MAXRSS_TO_MB, 1),
+    }
+    return process.returncode, stdout, stderr, usage
+
+
+def empty_usage(wall_time_s=None):
+    """Usage record for runs whose rusage is not available (only wall time, if known)."""
+    return {
+        "wall_time_s": round(wall_time_s, 3) if wall_time_s is not None else None,
+        "user_cpu_s": None,
+        "sys_cpu_s": None,
+        "max_rss_mb": None,
+    }
+
+
+def read_process_tree_rss_mb(pid):
+    """
+    Returns the current resident set size (VmRSS) of a process and all its descendants in MB,
+    or None where /proc is unavailable.
+
+    Used by the asyncio runner, whose children are reaped by the event loop's child watcher
+    rather than `os.wait4`: sampling this while the simulation runs approximates its peak
+    (OpenStudio launches EnergyPlus as a child process, so the whole tree is counted).
+    """
+    total_kb, found = 0, False
+    pending, seen = [pid], set()
+    while pending:
+        current = pending.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+
+        rss_kb = _proc_status_kb(current, "VmRSS:")
+        if rss_kb is None:
+            continue
+        total_kb += rss_kb
+        found = True
+        pending.extend(_proc_children(current))
+
+    return round(total_kb / 1024, 1) if found else None
+
+
+def _proc_status_kb(pid, field):
+    try:
+        with open(f"/proc/{pid}/status") as f:
+            for line in f:
+                if line.startswith(field):
+                    return int(line.split()[1])
+    except (OSError, ValueError, IndexError):
+        return None
+    return None
+
+
+def _proc_children(pid):
+    children = []
+    try:
+        task_ids = os.listdir(f"/proc/{pid}/task")
+    except OSError:
+        return children
+    for task_id in task_ids:
+        try:
+            with open(f"/proc/{pid}/task/{task_id}/children") as f:
+                children.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            continue
+    return children
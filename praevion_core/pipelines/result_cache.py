@@ -0,0 +1,292 @@
+import hashlib
+import json
+import os
+import socket
+import sqlite3
+import subprocess
+import time
+
+from praevion_core.adapters.openstudio.generate_osw import canonical_steps_hash
+from praevion_core.config.fidelity import FULL_FIDELITY, get_fidelity_profile
+from praevion_core.config.paths import MEASURES_DIR, RESULT_CACHE_DB
+from praevion_core.pipelines.cache_utils import hash_directory, hash_file
+
+# Bump when the stored payload or the key recipe changes, so old entries are never reused
+RESULT_CACHE_SCHEMA = 2
+
+# In-flight claims older than this are treated as abandoned even if the owner looks alive
+INFLIGHT_STALE_AFTER_S = 4 * 60 * 60
+
+_openstudio_version = None
+
+
+def openstudio_version() -> str:
+    """
+    Returns the OpenStudio version used for simulations.
+
+    OPENSTUDIO_VERSION takes precedence; otherwise `OPENSTUDIO_EXE --version` is run once per
+    process. Falls back to "unknown" when the CLI is not reachable.
+    """
+    global _openstudio_version
+
+    env_version = os.getenv("OPENSTUDIO_VERSION")
+    if env_version:
+        return env_version.strip()
+
+    if _openstudio_version is None:
+        openstudio_exe = os.getenv("OPENSTUDIO_EXE", "C:/openstudio-3.9.0/bin/openstudio.exe")
+        try:
+            result = subprocess.run(
+                [openstudio_exe, "--version"],
+                capture_output=True,
+                text=True,
+                check=True,
+                timeout=60,
+            )
+            _openstudio_version = result.stdout.strip() or "unknown"
+        except (OSError, subprocess.SubprocessError):
+            _openstudio_version = "unknown"
+
+    return _openstudio_version
+
+
+def simulation_key(
+    steps,
+    seed_file,
+    weather_file,
+    measures_dir=MEASURES_DIR,
+    version=None,
+    fidelity=FULL_FIDELITY,
+):
+    """
+    Builds the content-addressed key for one simulation.
+
+    Two runs share a key only if they apply the same canonical OSW steps to byte-identical
+    seed model, weather file and measure sources with the same OpenStudio version. Configs
+    that differ only by no-op selections therefore share one EnergyPlus run.
+
+    Parameters:
+        steps (list): Canonical (measure_name, step) pairs from `canonical_measure_steps`
+        seed_file (str): Path to the baseline .osm model
+        weather_file (str): Path to the .epw weather file
+        measures_dir (str): Root of the OpenStudio measures applied by the workflow
+        version (str | None): OpenStudio version (defaults to `openstudio_version()`)
+        fidelity (str): Simulation fidelity profile; reduced profiles add their settings to
+            the key, so they never share results with full-fidelity runs
+
+    Returns:
+        str: SHA-256 hex digest
+    """
+    payload = {
+        "schema": RESULT_CACHE_SCHEMA,
+        "steps": canonical_steps_hash(steps),
+        "seed_file": hash_file(seed_file),
+        "weather_file": hash_file(weather_file),
+        "measures": hash_directory(measures_dir),
+        "openstudio_version": version if version is not None else openstudio_version(),
+    }
+    if fidelity != FULL_FIDELITY:
+        payload["fidelity"] = get_fidelity_profile(fidelity)
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode()).hexdigest()
+
+
+class SimulationResultCache:
+    """
+    On-disk cache of raw simulation results (energy by fuel, zone and construction areas).
+
+    Entries live in a single SQLite database under CACHE_DIR, which survives `archive_logs`
+    and `clean_batch_folders`, and is shared safely by concurrent worker processes (WAL mode).
+    KPIs are always recomputed from the stored results, so changes to the carbon, cost or
+    threshold inputs never serve stale objectives.
+
+    The same database holds in-flight claims, so a config that one worker is simulating is
+    never launched again by another: duplicates block in `acquire` until the owner stores its
+    results (or gives up, in which case one waiter takes over the claim).
+
+    Parameters:
+        db_path (str): Path to the SQLite database file
+        timeout (float): Seconds to wait on a locked database before giving up
+        poll_interval (float): Seconds between checks while waiting on another worker
+        stale_after (float): Age in seconds after which an in-flight claim is reclaimed
+    """
+
+    def __init__(
+        self,
+        db_path=RESULT_CACHE_DB,
+        timeout=30.0,
+        poll_interval=1.0,
+        stale_after=INFLIGHT_STALE_AFTER_S,
+    ):
+        self.db_path = str(db_path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self._hostname = socket.gethostname()
+        self._conn = None
+        self._pid = None
+
+    def _connect(self):
+        # Connections must not cross a fork, so reconnect in each worker process
+        if self._conn is None or self._pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+            conn = sqlite3.connect(self.db_path, timeout=self.timeout)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS simulation_results (
+                    key TEXT PRIMARY KEY,
+                    config TEXT NOT NULL,
+                    results TEXT NOT NULL,
+                    created_at REAL NOT NULL
+                )
+                """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS inflight (
+                    key TEXT PRIMARY KEY,
+                    hostname TEXT NOT NULL,
+                    pid INTEGER NOT NULL,
+                    claimed_at REAL NOT NULL
+                )
+                """)
+            conn.commit()
+            self._conn, self._pid = conn, os.getpid()
+        return self._conn
+
+    def get(self, key):
+        """Returns cached results for `key`, or None on a miss."""
+        row = (
+            self._connect()
+            .execute("SELECT results FROM simulation_results WHERE key = ?", (key,))
+            .fetchone()
+        )
+        return json.loads(row[0]) if row else None
+
+    def put(self, key, config, results):
+        """
+        Stores raw simulation results under `key`.
+
+        Parameters:
+            key (str): Key from `simulation_key`
+            config (dict): ECM configuration (kept for inspection only)
+            results (dict): {"energy": dict, "zone_data": dict, "surface_areas": dict}
+        """
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO simulation_results VALUES (?, ?, ?, ?)",
+                (
+                    key,
+                    json.dumps(config, sort_keys=True, default=str),
+                    json.dumps(_to_builtin(results)),
+                    time.time(),
+                ),
+            )
+            conn.execute("DELETE FROM inflight WHERE key = ?", (key,))
+
+    def claim(self, key) -> bool:
+        """
+        Atomically claims `key` for this process. Returns False if another live worker already
+        holds it; abandoned claims (dead owner process or older than `stale_after`) are taken over.
+        """
+        conn = self._connect()
+        with conn:
+            row = conn.execute(
+                "SELECT hostname, pid, claimed_at FROM inflight WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self._is_stale(*row):
+                conn.execute(
+                    "DELETE FROM inflight WHERE key = ? AND pid = ? AND claimed_at = ?",
+                    (key, row[1], row[2]),
+                )
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO inflight VALUES (?, ?, ?, ?)",
+                (key, self._hostname, os.getpid(), time.time()),
+            )
+        return cursor.rowcount == 1
+
+    def release(self, key):
+        """Drops this process's claim on `key` (no-op if it holds none)."""
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "DELETE FROM inflight WHERE key = ? AND hostname = ? AND pid = ?",
+                (key, self._hostname, os.getpid()),
+            )
+
+    def acquire(self, key):
+        """
+        Returns cached results for `key`, waiting while another worker simulates it.
+
+        Returns None once this process holds the claim; the caller must then simulate and
+        call `put` (on success) and `release` (always).
+        """
+        announced = False
+        while True:
+            results = self.get(key)
+            if results is not None:
+                return results
+
+            if self.claim(key):
+                # The owner may have finished between get() and claim()
+                results = self.get(key)
+                if results is not None:
+                    self.release(key)
+                return results
+
+            if not announced:
+                print(f"⏳ Config {key[:12]} is already simulating in another worker — waiting...")
+                announced = True
+            time.sleep(self.poll_interval)
+
+    def _is_stale(self, hostname, pid, claimed_at):
+        return is_abandoned_claim(hostname, pid, claimed_at, self.stale_after, self._hostname)
+
+    def __len__(self):
+        return self._connect().execute("SELECT COUNT(*) FROM simulation_results").fetchone()[0]
+
+    def close(self):
+        if self._conn is not None and self._pid == os.getpid():
+            self._conn.close()
+        self._conn = None
+
+
+def is_abandoned_claim(hostname, pid, claimed_at, stale_after, local_hostname=None):
+    """
+    Whether a claim held by (hostname, pid) since `claimed_at` can be taken over: it is older
+    than `stale_after` seconds, or its owner is a process on this host that no longer exists.
+    """
+    if time.time() - claimed_at > stale_after:
+        return True
+    # Liveness can only be probed for local owners (os.kill(pid, 0) signals on Windows)
+    if hostname != (local_hostname or socket.gethostname()) or os.name == "nt":
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except PermissionError:
+        return False
+    return False
+
+
+def _to_builtin(results):
+    # numpy scalars → plain Python numbers so the payload stays valid JSON
+    return {
+        group: {key: val.item() if hasattr(val, "item") else val for key, val in values.items()}
+        for group, values in results.items()
+    }
+
+
+_result_cache = None
+
+
+def get_result_cache():
+    """Returns the process-wide SimulationResultCache, or None if disabled with RESULT_CACHE=off."""
+    global _result_cache
+
+    if os.getenv("RESULT_CACHE", "on").lower() in ("off", "0", "false"):
+        return None
+
+    if _result_cache is None:
+        _result_cache = SimulationResultCache()
+    return _result_cache
@@ -0,0 +1,200 @@
+import ast
+import importlib.util
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from praevion_core.config.paths import RESULTS_DIR
+from praevion_core.pipelines.pareto import crowding_distance, non_dominated_ranks
+
+# KPI fields of record_success's "objectives" metadata, stored as real columns
+KPI_COLUMNS = [
+    "operational_carbon_kg",
+    "embodied_carbon_kg",
+    "berdo_fine_usd",
+    "utility_cost_usd",
+    "longrun_cost_usd",
+    "material_cost_usd",
+]
+OBJECTIVE_COLUMNS = ["objective_0", "objective_1", "objective_2", "objective_3"]
+# Fidelity each row was simulated at (record_success's "fidelity" metadata)
+FIDELITY_COLUMN = "fidelity"
+# Parquet needs pyarrow, which is optional; without it the store is written as CSV
+RESULTS_FORMAT = "parquet" if importlib.util.find_spec("pyarrow") else "csv"
+
+
+def results_path(run_label: str, fmt: str = RESULTS_FORMAT) -> str:
+    """Path of a run's results store (Parquet, or CSV without pyarrow)."""
+    return os.path.join(RESULTS_DIR, f"results_{run_label}.{fmt}")
+
+
+def results_frame(history: pd.DataFrame) -> pd.DataFrame:
+    """
+    Turns DeepHyper's search history (`search.history.to_dataframe()`) into the typed results
+    table: the KPI dicts of 'm:objectives' become float columns in one pass, 'm:fidelity'
+    becomes the FIDELITY_COLUMN, and any other nested metadata (config, resource usage) is
+    kept as JSON strings.
+
+    Parameters:
+        history (pd.DataFrame): Search history, one row per evaluation
+
+    Returns:
+        pd.DataFrame: Results with KPI_COLUMNS as float columns
+    """
+    df = history.reset_index(drop=True)
+
+    if "m:objectives" in df.columns:
+        # CSV round-trips store the dicts as their repr
+        kpis = [
+            ast.literal_eval(value) if isinstance(value, str) else value
+            for value in df["m:objectives"]
+        ]
+        kpis = pd.DataFrame.from_records(
+            [value if isinstance(value, dict) else {} for value in kpis], columns=KPI_COLUMNS
+        )
+        df = pd.concat([df.drop(columns="m:objectives"), kpis.astype(float)], axis=1)
+
+    if f"m:{FIDELITY_COLUMN}" in df.columns:
+        df = df.rename(columns={f"m:{FIDELITY_COLUMN}": FIDELITY_COLUMN})
+
+    for col in df.select_dtypes(include="object").columns:
+        if df[col].map(lambda value: isinstance(value, dict | list)).any():
+            df[col] = df[col].map(json.dumps)
+
+    return df
+
+
+def deduplicate_results(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Drops rows with identical objective values, keeping a Pareto-efficient row of each group
+    when there is one and otherwise its first row. Vectorized: a stable sort puts efficient
+    rows first, `drop_duplicates` keeps one per group, and the original order is restored.
+    """
+    obj_cols = [col for col in OBJECTIVE_COLUMNS if col in df.columns]
+    if not obj_cols:
+        return df
+
+    original_len = len(df)
+    ordered = df
+    if "pareto_efficient" in df.columns:
+        ordered = df.sort_values("pareto_efficient", ascending=False, kind="stable")
+    df = ordered.drop_duplicates(subset=obj_cols, keep="first").sort_index()
+
+    removed = original_len - len(df)
+    if removed > 0:
+        print(f"🧹 Removed {removed} duplicate rows based on objective_* values.")
+    return df.reset_index(drop=True)
+
+
+def comparable_mask(df: pd.DataFrame, fidelity: str | None = None) -> np.ndarray:
+    """
+    Rows simulated at `fidelity` (all rows when it is None or the table has no
+    FIDELITY_COLUMN). Only these are comparable enough to form a front.
+    """
+    if fidelity is None or FIDELITY_COLUMN not in df.columns:
+        return np.ones(len(df), dtype=bool)
+    return (df[FIDELITY_COLUMN] == fidelity).to_numpy(dtype=bool)
+
+
+def pareto_efficient_mask(df: pd.DataFrame, fidelity: str | None = None) -> np.ndarray:
+    """
+    Non-dominated rows by objective_* columns (maximized) among the rows at `fidelity` (see
+    `comparable_mask`); failed rows and rows at other fidelities are never efficient.
+    """
+    obj_cols = [col for col in OBJECTIVE_COLUMNS if col in df.columns]
+    objectives = df[obj_cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+    valid = ~np.isnan(objectives).any(axis=1) & comparable_mask(df, fidelity)
+
+    mask = np.zeros(len(df), dtype=bool)
+    mask[valid] = non_dominated_ranks(objectives[valid]) == 0
+    return mask
+
+
+def write_results(df: pd.DataFrame, path: str):
+    """Writes the results table to a Parquet file, or a CSV file for a .csv path."""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    if path.endswith(".csv"):
+        df.to_csv(path, index=False)
+    else:
+        df.to_parquet(path, index=False)
+    print(f"📊 Results written to {path}")
+
+
+def read_results(path: str) -> pd.DataFrame:
+    """Reads a Parquet (or .csv) results store."""
+    if path.endswith(".csv"):
+        return pd.read_csv(path)
+    return pd.read_parquet(path)
+
+
+def summarize_results(
+    df: pd.DataFrame,
+    run_label: str,
+    max_evals: int,
+    hypervolume: float | None = None,
+    fidelity: str | None = None,
+) -> dict:
+    """
+    Summary row of a deduplicated results table (front size, crowding, objective ranges),
+    computed with column-wise reductions. Front and objective ranges only cover the rows at
+    `fidelity`; the other rows (e.g. configs only screened in a multi-fidelity run) are
+    counted separately.
+
+    Parameters:
+        df (pd.DataFrame): Deduplicated results table
+        run_label (str): Label for the current run
+        max_evals (int): The number of total evaluations performed in the search
+        hypervolume (float | None): Final hypervolume of the normalized front, if tracked
+        fidelity (str | None): Fidelity of the reported front (None = all rows)
+
+    Returns:
+        dict: One row of the optimization summary log
+    """
+    obj_cols = [col for col in OBJECTIVE_COLUMNS if col in df.columns]
+    comparable = df[comparable_mask(df, fidelity)]
+    pareto = (
+        comparable[comparable["pareto_efficient"].astype(bool)]
+        if "pareto_efficient" in comparable.columns
+        else comparable
+    )
+
+    crowding_mean = np.nan
+    crowding_std = np.nan
+    if not pareto.empty:
+        crowding = crowding_distance(pareto[obj_cols].to_numpy(dtype=float))
+        finite = crowding[np.isfinite(crowding)]
+        if len(finite):
+            crowding_mean = round(float(finite.mean()), 4)
+            crowding_std = round(float(finite.std(ddof=1)), 4) if len(finite) > 1 else np.nan
+
+    summary_row = {
+        "timestamp": pd.Timestamp.now().isoformat(),
+        "run_label": run_label,
+        "max_evals": max_evals,
+        "final_configs": len(df),
+        "duplicates_removed": max_evals - len(df),
+        "other_fidelity_configs": len(df) - len(comparable),
+        "pareto_size": len(pareto),
+        "crowding_mean": crowding_mean,
+        "crowding_std": crowding_std,
+        "hypervolume": round(hypervolume, 6) if hypervolume is not None else np.nan,
+    }
+    mins = comparable[obj_cols].min()
+    maxs = comparable[obj_cols].max()
+    for col in obj_cols:
+        summary_row[f"{col}_min"] = round(mins[col], 4)
+        summary_row[f"{col}_max"] = round(maxs[col], 4)
+    return summary_row
+
+
+def append_summary(summary_row: dict, output_csv_path: str):
+    """Appends a summary row to the optimization summary log CSV."""
+    summary_df = pd.DataFrame([summary_row])
+    if os.path.exists(output_csv_path):
+        summary_df.to_csv(output_csv_path, mode="a", header=False, index=False)
+    else:
+        os.makedirs(os.path.dirname(output_csv_path) or ".", exist_ok=True)
+        summary_df.to_csv(output_csv_path, index=False)
+    print(f"📈 Logged optimization summary → {output_csv_path}")
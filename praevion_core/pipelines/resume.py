@@ -0,0 +1,107 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from praevion_core.config.fidelity import FULL_FIDELITY
+from praevion_core.config.paths import LOG_DIR
+from praevion_core.pipelines.kpi_log import read_kpi_log
+from praevion_core.pipelines.multi_fidelity import MultiFidelityPolicy
+from praevion_core.pipelines.results_store import FIDELITY_COLUMN, KPI_COLUMNS, comparable_mask
+
+
+def kpi_log_path_for(run_label: str) -> str:
+    """KPI log path of a run, as set by main()."""
+    return os.path.join(LOG_DIR, f"kpi_log_{run_label}.jsonl")
+
+
+def completed_evaluations(entries: list[dict]) -> list[dict]:
+    """
+    The KPI log entry that stands for each evaluation (one per run_id), i.e. the result
+    run_function returned: a successful promotion, else the screened or single-fidelity
+    result, else the failure.
+    """
+    chosen = {}
+    for entry in entries:
+        run_id = entry.get("run_id")
+        current = chosen.get(run_id)
+        if current is None or _preference(entry) >= _preference(current):
+            chosen[run_id] = entry
+    return list(chosen.values())
+
+
+def _preference(entry: dict) -> int:
+    if not entry.get("success"):
+        return 0
+    return 2 if entry.get("promoted") else 1
+
+
+def replay_frame(
+    kpi_log_path: str, hyperparameter_names: list[str], policy: MultiFidelityPolicy | None = None
+) -> pd.DataFrame:
+    """
+    Completed evaluations of a KPI log as a DeepHyper results frame ('p:' parameter columns
+    and maximized 'objective_<i>' columns, "F" for failures) for `CBO.fit_surrogate`, with
+    the logged KPIs and fidelity as results-store columns. Entries whose config does not
+    cover every hyperparameter are skipped.
+
+    With a multi-fidelity `policy`, screened-only evaluations are bias-corrected as the live
+    search returns them (see `MultiFidelityPolicy.corrected`), using the bias of the whole
+    log.
+    """
+    entries = read_kpi_log(kpi_log_path)
+    bias = policy.bias_from_entries(entries) if policy is not None else None
+
+    rows = []
+    for entry in completed_evaluations(entries):
+        config = entry.get("config") or {}
+        if not all(name in config for name in hyperparameter_names):
+            continue
+
+        row = {f"p:{name}": config[name] for name in hyperparameter_names}
+        row[FIDELITY_COLUMN] = entry.get("fidelity", FULL_FIDELITY)
+        if entry.get("success"):
+            objectives = entry["objectives"]["normalized_objective_values"]
+            if bias is not None and row[FIDELITY_COLUMN] == policy.low_fidelity:
+                objectives = (np.asarray(objectives, dtype=float) + bias).tolist()
+            row.update({f"objective_{i}": value for i, value in enumerate(objectives)})
+            row.update({col: entry["objectives"].get(col) for col in KPI_COLUMNS})
+        else:
+            row["failed"] = True
+        row["run_id"] = entry.get("run_id")
+        rows.append(row)
+
+    df = pd.DataFrame(rows)
+    if df.empty:
+        return df
+
+    objective_cols = [col for col in df.columns if col.startswith("objective_")]
+    failed = df.pop("failed").fillna(False).astype(bool) if "failed" in df else None
+    if failed is not None and failed.any():
+        df[objective_cols] = df[objective_cols].astype(object)
+        df.loc[failed, objective_cols] = "F"
+    return df
+
+
+def replayed_objectives(replayed: pd.DataFrame, fidelity: str | None = None) -> list:
+    """
+    Objective vector of each replayed evaluation, in log order: None for failures and, with
+    a `fidelity`, for evaluations simulated at another one.
+    """
+    objective_cols = [col for col in replayed.columns if col.startswith("objective_")]
+    comparable = comparable_mask(replayed, fidelity)
+    return [
+        None if "F" in values or not keep else [float(value) for value in values]
+        for values, keep in zip(
+            replayed[objective_cols].itertuples(index=False), comparable, strict=True
+        )
+    ]
+
+
+def remaining_seeds(seed_configs: list[dict], replayed: pd.DataFrame) -> list[dict]:
+    """Initial points not evaluated before the resumed run stopped."""
+    done = {
+        tuple(sorted(config.items()))
+        for config in replayed.filter(like="p:").rename(columns=lambda c: c[2:]).to_dict("records")
+    }
+    return [config for config in seed_configs if tuple(sorted(config.items())) not in done]
@@ -1,5 +1,5 @@
+import asyncio
 import hashlib
-import json
 import os
 import sys
 import uuid
@@ -7,8 +7,15 @@ from datetime import UTC, datetime
 
 from deephyper.evaluator import RunningJob
 
+from praevion_core.config.constraints import get_constraint_index
+from praevion_core.config.fidelity import FULL_FIDELITY, active_fidelity
 from praevion_core.config.paths import INPUT_DIR, LOG_DIR
 from praevion_core.domain.kpis.evaluate_kpis import evaluate_kpis_from_config
+from praevion_core.pipelines.async_evaluator import AsyncKpiEvaluator, AsyncSimulationRunner
+from praevion_core.pipelines.kpi_log import get_kpi_log_writer
+from praevion_core.pipelines.multi_fidelity import get_multi_fidelity_policy
+from praevion_core.pipelines.pareto import get_pareto_archive
+from praevion_core.pipelines.result_cache import get_result_cache
 
 # Directory for KPI logs and results
 os.makedirs(LOG_DIR, exist_ok=True)
@@ -19,12 +26,15 @@ __all__ = [
     "run_function",
     "best_log",
     "run_function_deduplicated",
+    "run_function_coroutine",
+    "run_function_coroutine_deduplicated",
 ]  # EXPOSES best_log TO ALL MODULES
 
 
 # 🔐 Shared set to store seen config hashes
 seen_config_hashes = set()
-seen_config_results = {}  # Maps hash → objective
+seen_config_results = {}  # Maps config key → objective
+pending_config_results = {}  # Maps config key → asyncio.Future of an in-flight coroutine evaluation
 
 
 def hash_config(config: dict) -> str:
@@ -32,20 +42,29 @@ def hash_config(config: dict) -> str:
     return hashlib.md5(str(sorted(config.items())).encode()).hexdigest()
 
 
-def run_function(config: dict):
+def config_key(config: dict):
     """
-    Evaluates a configuration during DeepHyper's async search process.
+    Dedup key of a config: its mixed-radix index in the ECM design space (see
+    `ConstraintIndex`), or its hash when it does not fit the index.
+    """
+    index = get_constraint_index().index_of(config)
+    return index if index is not None else hash_config(config)
 
-    Args:
-        config (dict): A dictionary of selected ECM options.
 
-    Returns:
-        list: Objective values [total_emissions_kg, total_ec_kg, berdo_fine_usd]
-    """
+def kpi_input_paths():
+    """Input CSV paths for KPI evaluation, keyed as in `evaluate_kpis_from_results`."""
+    return {
+        "oc_input_path": os.path.join(INPUT_DIR, "operational-carbon-inputs.csv"),
+        "ec_input_path": os.path.join(INPUT_DIR, "embodied-carbon-inputs.csv"),
+        "threshold_input_path": os.path.join(INPUT_DIR, "berdo-thresholds-multifamily.csv"),
+        "mat_cost_input_path": os.path.join(INPUT_DIR, "material-cost-inputs.csv"),
+        "utility_rate_input_path": os.path.join(INPUT_DIR, "utility-cost-inputs.csv"),
+    }
 
+
+def _start_run(config):
     timestamp = datetime.now(UTC).strftime("%Y%m%d-%H%M%S")
     run_id = f"opt_{timestamp}_{uuid.uuid4().hex[:8]}"
-    kpi_log_path = os.getenv("KPI_LOG_PATH", os.path.join(LOG_DIR, "kpi_log_fallback.jsonl"))
     os.makedirs(LOG_DIR, exist_ok=True)
 
     # Unpack RunningJob object
@@ -55,120 +74,199 @@ def run_function(config: dict):
         raise RuntimeError("❌ Config is not a dict after unwrapping!")
 
     print(f"🔁 Starting config {run_id}")
+    return config, run_id, timestamp
+
+
+def _kpi_log_path():
+    return os.getenv("KPI_LOG_PATH", os.path.join(LOG_DIR, "kpi_log_fallback.jsonl"))
+
+
+def run_function(config: dict):
+    """
+    Evaluates a configuration during DeepHyper's async search process.
+
+    Args:
+        config (dict): A dictionary of selected ECM options.
+
+    With MULTI_FIDELITY on, the config is screened at the policy's low fidelity and only
+    re-simulated at full fidelity when it lands near the current front (see
+    `MultiFidelityPolicy`); both evaluations are logged, tagged with their fidelity. A config
+    that is not promoted returns its bias-corrected screened objectives.
+
+    Returns:
+        list: Objective values [total_emissions_kg, total_ec_kg, berdo_fine_usd]
+    """
+    config, run_id, timestamp = _start_run(config)
+
+    policy = get_multi_fidelity_policy()
+    if policy is None:
+        return _run_at_fidelity(config, run_id, timestamp, active_fidelity())
+
+    reference = policy.reference_objectives(_kpi_log_path())
+    screened = _run_at_fidelity(config, run_id, timestamp, policy.low_fidelity)
+    if not policy.should_promote(screened, reference):
+        return policy.corrected(screened, policy.objective_bias(_kpi_log_path()))
+
+    print(f"⏫ Promoting config {run_id} to {policy.high_fidelity} fidelity")
+    promoted = _run_at_fidelity(config, run_id, timestamp, policy.high_fidelity, promoted=True)
+    return promoted if promoted["metadata"]["success"] else screened
+
+
+def _run_at_fidelity(config, run_id, timestamp, fidelity, promoted=False):
+    input_paths = kpi_input_paths()
 
     try:
         # Evaluate KPIs based on currently evaluated ECM configuration
         kpis = evaluate_kpis_from_config(
             config,
-            df_factors=os.path.join(INPUT_DIR, "operational-carbon-inputs.csv"),
-            df_embodied=os.path.join(INPUT_DIR, "embodied-carbon-inputs.csv"),
-            df_thresholds=os.path.join(INPUT_DIR, "berdo-thresholds-multifamily.csv"),
-            df_material=os.path.join(INPUT_DIR, "material-cost-inputs.csv"),
-            df_rates=os.path.join(INPUT_DIR, "utility-cost-inputs.csv"),
+            df_factors=input_paths["oc_input_path"],
+            df_embodied=input_paths["ec_input_path"],
+            df_thresholds=input_paths["threshold_input_path"],
+            df_material=input_paths["mat_cost_input_path"],
+            df_rates=input_paths["utility_rate_input_path"],
+            kpi_backend=os.getenv("KPI_BACKEND", "csv"),
+            result_cache=get_result_cache(),
+            fidelity=fidelity,
         )
+        return record_success(config, kpis, run_id, timestamp, fidelity, promoted)
 
-        # Combine total embodied and operational carbon for engineered total carbon metric
-        operational_carbon_kg = kpis["total_emissions_kg"]
-        embodied_carbon_kg = kpis["total_ec_kg"] if kpis["total_ec_kg"] > 0 else 1.0
-        berdo_fine_usd = kpis["berdo_fine_usd"]
-        material_cost_usd = kpis["material_cost_usd"] if kpis["material_cost_usd"] > 0 else 1.0
-        utility_cost_usd = (
-            kpis["discounted_utility_cost_usd"] if kpis["discounted_utility_cost_usd"] > 0 else 1.0
-        )
+    except Exception as e:
+        return record_failure(config, e, run_id, timestamp, fidelity)
 
-        # BERDO fine at net utility min
-        net_berdo_min = 74_620
-
-        # Utility cost metrics
-        utility_cost_baseline = 2_184_813
-        utility_cost_max = 3_693_027
-        utility_cost_min = 1_638_838
-
-        # Net utility cost metrics
-        net_utility_cost_max = utility_cost_max - utility_cost_baseline
-        net_utility_cost_min = utility_cost_min - utility_cost_baseline
-        net_utility_cost = utility_cost_usd - utility_cost_baseline
-
-        # Long run cost metrics
-        net_longrun_cost = net_utility_cost + berdo_fine_usd
-
-        # Theoretical maximums for normalization
-        max_oc = 5_515_869
-        max_ec = 476_657
-        max_mat_cost = 1_209_421
-        net_longrun_cost_max = net_utility_cost_max + 1
-
-        # Theoretical minimums for operational carbon emissions
-        min_oc = 1_355_578
-        net_longrun_cost_min = net_utility_cost_min + net_berdo_min
-
-        # Normalize objective values
-        oc_normalized = (operational_carbon_kg - min_oc) / (max_oc - min_oc)
-        ec_normalized = embodied_carbon_kg / max_ec
-        longrun_normalized = (net_longrun_cost - net_longrun_cost_min) / (
-            net_longrun_cost_max - net_longrun_cost_min
-        )
-        material_normalized = material_cost_usd / max_mat_cost
-
-        # Gather the objective values to be fed in the MOO engine
-        objective_values = [
-            -oc_normalized,
-            -ec_normalized,
-            -longrun_normalized,
-            -material_normalized,
-        ]
-
-        # Structure successful kpi_log entry
-        log_entry = {
+
+def record_success(
+    config: dict,
+    kpis: dict,
+    run_id: str,
+    timestamp: str,
+    fidelity: str = FULL_FIDELITY,
+    promoted: bool = False,
+) -> dict:
+    """
+    Normalizes a config's KPIs into the objective vector fed to the MOO engine, and logs the
+    evaluation to KPI_LOG_PATH and best_log (tagged with the fidelity it was simulated at,
+    and whether it is a multi-fidelity promotion). The objectives are also added to the
+    process's ParetoArchive for that fidelity.
+
+    Returns:
+        dict: {"objective": list, "metadata": dict} as expected by DeepHyper
+    """
+    kpi_log_path = _kpi_log_path()
+
+    # Combine total embodied and operational carbon for engineered total carbon metric
+    operational_carbon_kg = kpis["total_emissions_kg"]
+    embodied_carbon_kg = kpis["total_ec_kg"] if kpis["total_ec_kg"] > 0 else 1.0
+    berdo_fine_usd = kpis["berdo_fine_usd"]
+    material_cost_usd = kpis["material_cost_usd"] if kpis["material_cost_usd"] > 0 else 1.0
+    utility_cost_usd = (
+        kpis["discounted_utility_cost_usd"] if kpis["discounted_utility_cost_usd"] > 0 else 1.0
+    )
+
+    # BERDO fine at net utility min
+    net_berdo_min = 74_620
+
+    # Utility cost metrics
+    utility_cost_baseline = 2_184_813
+    utility_cost_max = 3_693_027
+    utility_cost_min = 1_638_838
+
+    # Net utility cost metrics
+    net_utility_cost_max = utility_cost_max - utility_cost_baseline
+    net_utility_cost_min = utility_cost_min - utility_cost_baseline
+    net_utility_cost = utility_cost_usd - utility_cost_baseline
+
+    # Long run cost metrics
+    net_longrun_cost = net_utility_cost + berdo_fine_usd
+
+    # Theoretical maximums for normalization
+    max_oc = 5_515_869
+    max_ec = 476_657
+    max_mat_cost = 1_209_421
+    net_longrun_cost_max = net_utility_cost_max + 1
+
+    # Theoretical minimums for operational carbon emissions
+    min_oc = 1_355_578
+    net_longrun_cost_min = net_utility_cost_min + net_berdo_min
+
+    # Normalize objective values
+    oc_normalized = (operational_carbon_kg - min_oc) / (max_oc - min_oc)
+    ec_normalized = embodied_carbon_kg / max_ec
+    longrun_normalized = (net_longrun_cost - net_longrun_cost_min) / (
+        net_longrun_cost_max - net_longrun_cost_min
+    )
+    material_normalized = material_cost_usd / max_mat_cost
+
+    # Gather the objective values to be fed in the MOO engine
+    objective_values = [
+        -oc_normalized,
+        -ec_normalized,
+        -longrun_normalized,
+        -material_normalized,
+    ]
+
+    # Structure successful kpi_log entry
+    log_entry = {
+        "timestamp": timestamp,
+        "run_id": run_id,
+        "config": config,
+        "success": True,
+        "fidelity": fidelity,
+        "promoted": promoted,
+        "cache_hit": kpis.get("cache_hit", False),
+        "resource_usage": kpis.get("resource_usage"),
+        "objectives": {
+            "operational_carbon_kg": operational_carbon_kg,
+            "embodied_carbon_kg": embodied_carbon_kg,
+            "berdo_fine_usd": berdo_fine_usd,
+            "utility_cost_usd": utility_cost_usd,
+            "longrun_cost_usd": net_longrun_cost,
+            "material_cost_usd": material_cost_usd,
+            "normalized_objective_values": objective_values,
+        },
+    }
+
+    # Append summary to best_log
+    best_log.append(
+        {
             "timestamp": timestamp,
             "run_id": run_id,
-            "config": config,
-            "success": True,
-            "objectives": {
-                "operational_carbon_kg": operational_carbon_kg,
-                "embodied_carbon_kg": embodied_carbon_kg,
-                "berdo_fine_usd": berdo_fine_usd,
-                "utility_cost_usd": utility_cost_usd,
-                "longrun_cost_usd": net_longrun_cost,
-                "material_cost_usd": material_cost_usd,
-                "normalized_objective_values": objective_values,
-            },
+            "fidelity": fidelity,
+            "oc_total": objective_values[0],
+            "ec_total": objective_values[1],
+            "longrun_cost_total": objective_values[2],
+            "mat_cost_total": objective_values[3],
         }
+    )
+    get_kpi_log_writer(kpi_log_path).write(log_entry)
 
-        # Append summary to best_log
-        best_log.append(
-            {
-                "timestamp": timestamp,
-                "run_id": run_id,
-                "oc_total": objective_values[0],
-                "ec_total": objective_values[1],
-                "longrun_cost_total": objective_values[2],
-                "mat_cost_total": objective_values[3],
-            }
-        )
-        with open(kpi_log_path, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
+    # Keep the live front of this fidelity current
+    get_pareto_archive(fidelity).add(objective_values, log_entry)
 
-        print(f"✅ Completed config {run_id} with objectives: {objective_values}")
-        return {"objective": objective_values, "metadata": log_entry}
+    print(f"✅ Completed config {run_id} with objectives: {objective_values}")
+    return {"objective": objective_values, "metadata": log_entry}
 
-    except Exception as e:
-        print(f"❌ Failed config {run_id}: {e}")
-        log_entry = {
-            "timestamp": timestamp,
-            "run_id": run_id,
-            "config": config,
-            "success": False,
-            "error": str(e),
-        }
-        with open(kpi_log_path, "a") as f:
-            f.write(json.dumps(log_entry) + "\n")
 
-        return {"objective": [sys.float_info.max] * 4, "metadata": log_entry}
+def record_failure(
+    config: dict, error: Exception, run_id: str, timestamp: str, fidelity: str = FULL_FIDELITY
+) -> dict:
+    """Logs a failed evaluation and returns worst-case objectives for it."""
+    kpi_log_path = _kpi_log_path()
+    print(f"❌ Failed config {run_id}: {error}")
+    log_entry = {
+        "timestamp": timestamp,
+        "run_id": run_id,
+        "config": config,
+        "success": False,
+        "fidelity": fidelity,
+        "error": str(error),
+    }
+    get_kpi_log_writer(kpi_log_path).write(log_entry)
+
+    return {"objective": [sys.float_info.max] * 4, "metadata": log_entry}
 
 
 def run_function_deduplicated(config):
-    config_hash = hash_config(config)
+    config_hash = config_key(config)
 
     if config_hash in seen_config_hashes:
         print(f"⚠️ Duplicate config — returning cached result for {config_hash}")
@@ -182,3 +280,97 @@ def run_function_deduplicated(config):
     seen_config_results[config_hash] = result
 
     return result
+
+
+_async_evaluator = None
+
+
+def get_async_evaluator():
+    """
+    Returns the process-wide AsyncKpiEvaluator. Its subprocess limits come from
+    ASYNC_MAX_SIMULATIONS (default 8), ASYNC_MAX_PENDING (default 2x simulations) and
+    SIM_TIMEOUT_S (per-subprocess timeout in seconds, default none).
+    """
+    global _async_evaluator
+
+    if _async_evaluator is None:
+        timeout = os.getenv("SIM_TIMEOUT_S")
+        runner = AsyncSimulationRunner(
+            max_concurrency=int(os.getenv("ASYNC_MAX_SIMULATIONS", "8")),
+            max_pending=int(os.getenv("ASYNC_MAX_PENDING", "0")) or None,
+            timeout=float(timeout) if timeout else None,
+        )
+        _async_evaluator = AsyncKpiEvaluator(
+            runner,
+            input_paths=kpi_input_paths(),
+            kpi_backend=os.getenv("KPI_BACKEND", "csv"),
+            result_cache=get_result_cache(),
+        )
+    return _async_evaluator
+
+
+async def run_function_coroutine(config: dict):
+    """
+    Coroutine counterpart of `run_function` for DeepHyper's asyncio ("serial") evaluator:
+    simulations are awaited subprocesses, so one process drives many concurrent runs.
+    """
+    config, run_id, timestamp = _start_run(config)
+
+    policy = get_multi_fidelity_policy()
+    if policy is None:
+        return await _run_at_fidelity_async(config, run_id, timestamp, active_fidelity())
+
+    # Syncing the reference front reads the KPI log: keep it off the event loop
+    reference = await asyncio.to_thread(policy.reference_objectives, _kpi_log_path())
+    screened = await _run_at_fidelity_async(config, run_id, timestamp, policy.low_fidelity)
+    if not policy.should_promote(screened, reference):
+        bias = await asyncio.to_thread(policy.objective_bias, _kpi_log_path())
+        return policy.corrected(screened, bias)
+
+    print(f"⏫ Promoting config {run_id} to {policy.high_fidelity} fidelity")
+    promoted = await _run_at_fidelity_async(
+        config, run_id, timestamp, policy.high_fidelity, promoted=True
+    )
+    return promoted if promoted["metadata"]["success"] else screened
+
+
+async def _run_at_fidelity_async(config, run_id, timestamp, fidelity, promoted=False):
+    try:
+        kpis = await get_async_evaluator().evaluate(config, fidelity)
+        return record_success(config, kpis, run_id, timestamp, fidelity, promoted)
+
+    except Exception as e:
+        return record_failure(config, e, run_id, timestamp, fidelity)
+
+
+async def run_function_coroutine_deduplicated(config):
+    if isinstance(config, RunningJob):
+        config = config.parameters
+    config_hash = config_key(config)
+
+    if config_hash in seen_config_hashes:
+        print(f"⚠️ Duplicate config — returning cached result for {config_hash}")
+        return seen_config_results[config_hash]
+
+    # Coalesce with an identical config that is still running in this event loop
+    if config_hash in pending_config_results:
+        print(f"⚠️ Duplicate config in flight — awaiting result for {config_hash}")
+        return await asyncio.shield(pending_config_results[config_hash])
+
+    future = asyncio.get_running_loop().create_future()
+    pending_config_results[config_hash] = future
+    try:
+        result = await run_function_coroutine(config)
+        seen_config_hashes.add(config_hash)
+        seen_config_results[config_hash] = result
+        future.set_result(result)
+        return result
+
+    except BaseException as e:
+        future.set_exception(e)
+        # Mark retrieved so an un-awaited failure does not log "exception never retrieved"
+        future.exception()
+        raise
+
+    finally:
+        pending_config_results.pop(config_hash, None)
@@ -0,0 +1,75 @@
+import os
+import shutil
+
+# Run artifacts copied back to persistent storage when a run executed in scratch space
+SCRATCH_KEEP_FILES = ("eplustbl.csv",)
+
+
+def scratch_root():
+    """
+    Returns the root for ephemeral run directories (RUN_SCRATCH_ROOT, e.g. /dev/shm/praevion),
+    or None to run in place under 05_osws/ and RUN_LOGS_DIR.
+    """
+    root = os.getenv("RUN_SCRATCH_ROOT", "").strip()
+    return root or None
+
+
+def scratch_keep_files():
+    """Whitelisted artifacts to persist (RUN_SCRATCH_KEEP, comma-separated file names)."""
+    keep = os.getenv("RUN_SCRATCH_KEEP", "").strip()
+    if not keep:
+        return SCRATCH_KEEP_FILES
+    return tuple(name.strip() for name in keep.split(",") if name.strip())
+
+
+def make_scratch_dir(name):
+    """Creates an empty scratch directory `name` under the scratch root and returns its path."""
+    path = os.path.join(scratch_root(), name)
+    if os.path.exists(path):
+        shutil.rmtree(path)
+    os.makedirs(path)
+    return path
+
+
+def persist_scratch_outputs(run_dir, persist_path, scratch_dir, keep=None):
+    """
+    Copies whitelisted artifacts from a scratch run into `persist_path`, then drops the whole
+    scratch tree in one operation (instead of deleting heavy outputs file by file).
+
+    Parameters:
+        run_dir (str): Scratch directory holding the run outputs
+        persist_path (str): Persistent destination for the whitelisted artifacts
+        scratch_dir (str): Scratch tree to remove (run_dir or one of its parents)
+        keep (tuple | None): File names to copy back (defaults to `scratch_keep_files()`)
+    """
+    try:
+        os.makedirs(persist_path, exist_ok=True)
+        for filename in keep if keep is not None else scratch_keep_files():
+            path = os.path.join(run_dir, filename)
+            if os.path.exists(path):
+                shutil.copy2(path, os.path.join(persist_path, filename))
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+
+
+def abandon_scratch_dir(scratch_dir, persist_path):
+    """Moves a failed run's scratch tree to persistent storage in full, for debugging."""
+    if os.path.exists(persist_path):
+        shutil.rmtree(persist_path)
+    os.makedirs(os.path.dirname(os.path.abspath(persist_path)), exist_ok=True)
+    shutil.move(scratch_dir, persist_path)
+
+
+def in_scratch(path):
+    """Whether `path` lies under the scratch root."""
+    root = scratch_root()
+    if root is None:
+        return False
+    root = os.path.abspath(root)
+    return os.path.commonpath([root, os.path.abspath(path)]) == root
+
+
+def discard_failed_run(result):
+    """Moves a scratch run whose outputs turned out unusable to its persistent location."""
+    if result.get("scratch_dir"):
+        abandon_scratch_dir(result["scratch_dir"], result["persist_path"])
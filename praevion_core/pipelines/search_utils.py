@@ -1,13 +1,16 @@
+import numpy as np
+from ConfigSpace import ForbiddenAndConjunction, ForbiddenEqualsClause, ForbiddenInClause
+
+from praevion_core.config.constraints import get_constraint_index
+
+
 def is_valid_config(config: dict) -> bool:
     """
     Check if a given ECM configuration satisfies domain-specific constraints.
 
-    Rules enforced:
-    1. If either window U-value or SHGC is specified, both must be.
-    2. Infiltration reduction options require corresponding envelope upgrades:
-       - 0.75 requires wall R-10 or greater
-       - 0.60 requires wall R-15 or greater and window upgrades
-       - 0.40 requires wall R-20 or greater and window upgrades
+    The rules are declared once in the "constraints" section of ecm_options.json (window
+    U-value and SHGC upgraded together; deeper infiltration reductions need wall and window
+    upgrades) and compiled into a valid-config bitmap, so this is a single lookup.
 
     Parameters:
         config (dict): A dictionary of ECM options (e.g. from DeepHyper search).
@@ -15,31 +18,59 @@ def is_valid_config(config: dict) -> bool:
     Returns:
         bool: True if the configuration is valid, False if it violates any constraints.
     """
+    return get_constraint_index().is_valid_config(config)
+
+
+def valid_config_mask(names: list[str], choices: list[list], matrix: np.ndarray) -> np.ndarray:
+    """
+    Vectorized `is_valid_config` for configs encoded as choice indices.
+
+    Parameters:
+        names (list[str]): Hyperparameter name of each matrix column
+        choices (list[list]): Choices of each column (matrix values index into them)
+        matrix (np.ndarray): Integer matrix, one config per row
+
+    Returns:
+        np.ndarray: Boolean mask, True where the config satisfies all domain rules
+    """
+    return get_constraint_index().valid_mask(names, choices, matrix)
+
+
+def hyperparameter_choices(hp) -> list | None:
+    """Choices of a discrete hyperparameter, in index order (None for numeric ranges)."""
+    if hp.__class__.__name__ == "CategoricalHyperparameter":
+        return list(hp.choices)
+    if hp.__class__.__name__ == "OrdinalHyperparameter":
+        return list(hp.sequence)
+    if hp.__class__.__name__ == "Constant":
+        return [hp.value]
+    return None
+
+
+def forbidden_mask(clause, names: list[str], choices: list[list], matrix: np.ndarray):
+    """
+    Evaluates a ConfigSpace forbidden clause on configs encoded as choice indices.
+
+    Returns:
+        np.ndarray: Boolean mask, True where the config is forbidden by `clause`
+    """
+    if isinstance(clause, ForbiddenAndConjunction):
+        mask = np.ones(len(matrix), dtype=bool)
+        for component in clause.components:
+            mask &= forbidden_mask(component, names, choices, matrix)
+        return mask
+
+    if isinstance(clause, ForbiddenEqualsClause | ForbiddenInClause):
+        j = names.index(clause.hyperparameter.name)
+        values = clause.values if isinstance(clause, ForbiddenInClause) else [clause.value]
+        return np.isin(matrix[:, j], [choices[j].index(value) for value in values])
+
+    raise NotImplementedError(f"Unsupported forbidden clause: {clause}")
+
 
-    # Rule 1: If one of U-value or SHGC is upgraded, the other must be too
-    u_value = config.get("upgrade_window_u_value", "None")
-    shgc = config.get("upgrade_window_shgc", "None")
-    if (u_value != "None" and shgc == "None") or (shgc != "None" and u_value == "None"):
-        return False
-
-    # Rule 2: Infiltration requires envelope support
-    wall = config.get("upgrade_wall_insulation", "None")
-    infiltration = config.get("adjust_infiltration_rates", "None")
-
-    # Convert R-value string to number (e.g., "R-20" -> 20.0)
-    def r_value_num(r_val):
-        return float(r_val.split("-")[1]) if r_val.startswith("R") else 0.0
-
-    wall_r = r_value_num(wall)
-
-    if infiltration == "0.75":
-        if wall_r < 10:
-            return False
-    if infiltration == "0.60":
-        if wall_r < 15 or u_value == "None" or shgc == "None":
-            return False
-    if infiltration == "0.40":
-        if wall_r < 20 or u_value == "None" or shgc == "None":
-            return False
-
-    return True
+def space_forbidden_mask(space, names: list[str], choices: list[list], matrix: np.ndarray):
+    """True where an encoded config violates any of the space's forbidden clauses."""
+    forbidden = np.zeros(len(matrix), dtype=bool)
+    for clause in space.get_forbiddens():
+        forbidden |= forbidden_mask(clause, names, choices, matrix)
+    return forbidden
@@ -2,7 +2,11 @@ import numpy as np
 from deephyper.hpo import HpProblem
 from scipy.stats import qmc
 
-from praevion_core.pipelines.search_utils import is_valid_config
+from praevion_core.pipelines.search_utils import (
+    hyperparameter_choices,
+    is_valid_config,
+    valid_config_mask,
+)
 
 
 def generate_filtered_sobol_samples(
@@ -16,6 +20,10 @@ def generate_filtered_sobol_samples(
     Generate Sobol samples from the full design space and filter out invalid configurations
     based on ConfigSpace constraints, preserving Sobol ordering
 
+    Discrete spaces are decoded and filtered as whole matrices (see `decode_sobol_matrix`);
+    dicts are only built for surviving samples. Spaces with numeric ranges fall back to
+    decoding and checking one sample at a time.
+
     Args:
         problem (HpProblem): The HpProblem object containing the search space.
         n_samples (int): Number of Sobol points to generate.
@@ -41,6 +49,45 @@ def generate_filtered_sobol_samples(
     sobol = qmc.Sobol(d=n_dims, scramble=True, seed=seed)
     sobol_vectors = sobol.random(n=n_samples)
 
+    if all(hyperparameter_choices(hp) is not None for hp in hyperparameters):
+        valid_configs = _filter_sobol_matrix(sobol_vectors, cs, debug)
+    else:
+        valid_configs = _filter_sobol_vectors(sobol_vectors, cs, debug)
+
+    if verbose:
+        print(f"🧪 Generated {n_samples} Sobol samples.")
+        print(f"✅ {len(valid_configs)} passed constraints ({len(valid_configs) / n_samples:.1%})")
+
+    return valid_configs
+
+
+def _filter_sobol_matrix(sobol_vectors: np.ndarray, cs, debug: bool) -> list[dict]:
+    names, choices, indices = decode_sobol_matrix(sobol_vectors, cs)
+
+    # The problem's forbidden clauses are compiled from the same constraints as the
+    # valid-config bitmap, so one lookup per sample covers both
+    valid = valid_config_mask(names, choices, indices)
+
+    if debug:
+        for i in np.flatnonzero(~valid):
+            config_dict = dict(zip(names, _decode_row(indices[i], choices), strict=True))
+            print(f"❌ Sample {i} rejected by ECM constraints:\n{config_dict}\n")
+
+    # Look up each column's values in one pass, then zip them into the surviving dicts
+    survivors = indices[valid]
+    columns = [
+        np.asarray(column_choices, dtype=object)[survivors[:, j]].tolist()
+        for j, column_choices in enumerate(choices)
+    ]
+    return [dict(zip(names, values, strict=True)) for values in zip(*columns, strict=True)]
+
+
+def _decode_row(row, choices):
+    return [column_choices[i] for column_choices, i in zip(choices, row, strict=True)]
+
+
+def _filter_sobol_vectors(sobol_vectors: np.ndarray, cs, debug: bool) -> list[dict]:
+    n_samples = len(sobol_vectors)
     valid_configs = []
     for i in range(n_samples):
         try:
@@ -57,13 +104,33 @@ def generate_filtered_sobol_samples(
             if debug:
                 print(f"⚠️ Sample {i} failed ConfigSpace decoding: {e}")
 
-    if verbose:
-        print(f"🧪 Generated {n_samples} Sobol samples.")
-        print(f"✅ {len(valid_configs)} passed constraints ({len(valid_configs) / n_samples:.1%})")
-
     return valid_configs
 
 
+def decode_sobol_matrix(matrix: np.ndarray, cs) -> tuple[list[str], list[list], np.ndarray]:
+    """
+    Decodes a Sobol matrix (one sample per row) column-wise into choice indices, with the
+    same binning as `decode_sobol_vector`.
+
+    Parameters:
+        matrix (np.ndarray): Samples in [0, 1), shape (n_samples, n_dims)
+        cs (ConfigurationSpace): Space with categorical, ordinal or constant hyperparameters
+
+    Returns:
+        tuple: (names, choices, indices), where indices[i, j] is the choice of names[j]
+            selected by sample i
+    """
+    hyperparameters = cs.get_hyperparameters()
+    names = [hp.name for hp in hyperparameters]
+    choices = [hyperparameter_choices(hp) for hp in hyperparameters]
+    if any(column_choices is None for column_choices in choices):
+        raise NotImplementedError("Matrix decoding needs discrete hyperparameters")
+
+    sizes = np.array([len(column_choices) for column_choices in choices])
+    indices = np.minimum((np.asarray(matrix) * sizes).astype(np.int64), sizes - 1)
+    return names, choices, indices
+
+
 def decode_sobol_vector(vector: np.ndarray, cs) -> dict:
     config_dict = {}
 
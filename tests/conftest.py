@@ -0,0 +1,184 @@
+import shutil
+import sqlite3
+
+import pytest
+
+from praevion_core.config.paths import INPUT_DIR
+
+EPLUSTBL_CSV = """Program Version:,EnergyPlus, Version 24.1.0
+Tabular Output Report in Format: ,Comma
+
+REPORT:,Annual Building Utility Performance Summary
+FOR:,Entire Facility
+
+End Uses
+
+,,Electricity [GJ],Natural Gas [GJ],Water [m3]
+,Heating,10.00,200.00,0.00
+,Cooling,5.00,0.00,0.00
+,Interior Lighting,20.00,0.00,0.00
+,,,,
+,Total End Uses,35.00,200.00,0.00
+
+End Uses By Subcategory
+
+,,Subcategory,Electricity [GJ]
+,Heating,General,10.00
+
+REPORT:,Input Verification and Results Summary
+FOR:,Entire Facility
+
+Skylight-Roof Ratio
+
+,,Total,North (315 to 45 deg)
+,Gross Roof Area [m2],150.00,150.00
+,Skylight Area [m2],0.00,0.00
+
+PERFORMANCE
+
+Zone Summary
+
+,,Area [m2],Above Ground Gross Wall Area [m2],Window Glass Area [m2]
+,APARTMENT 1,100.00,80.00,10.00
+,APARTMENT 2,100.00,80.00,10.00
+,CORRIDOR,50.00,40.00,0.00
+
+Space Summary
+
+,,Area [m2]
+,APARTMENT 1,100.00
+"""
+
+
+@pytest.fixture
+def eplustbl_path(tmp_path):
+    path = tmp_path / "eplustbl.csv"
+    path.write_text(EPLUSTBL_CSV, encoding="utf-8")
+    return str(path)
+
+
+# Same tables as EPLUSTBL_CSV, as stored in eplusout.sql: (report, table, row, column, units, value)
+EPLUSOUT_SQL_ROWS = [
+    (
+        "AnnualBuildingUtilityPerformanceSummary",
+        "End Uses",
+        "Heating",
+        "Electricity",
+        "GJ",
+        "10.00",
+    ),
+    (
+        "AnnualBuildingUtilityPerformanceSummary",
+        "End Uses",
+        "Heating",
+        "Natural Gas",
+        "GJ",
+        "200.00",
+    ),
+    ("AnnualBuildingUtilityPerformanceSummary", "End Uses", "Cooling", "Electricity", "GJ", "5.00"),
+    ("AnnualBuildingUtilityPerformanceSummary", "End Uses", "Cooling", "Natural Gas", "GJ", "0.00"),
+    (
+        "AnnualBuildingUtilityPerformanceSummary",
+        "End Uses",
+        "Interior Lighting",
+        "Electricity",
+        "GJ",
+        "20.00",
+    ),
+    (
+        "AnnualBuildingUtilityPerformanceSummary",
+        "End Uses",
+        "Interior Lighting",
+        "Natural Gas",
+        "GJ",
+        "0.00",
+    ),
+    ("AnnualBuildingUtilityPerformanceSummary", "End Uses", "", "Electricity", "GJ", ""),
+    ("AnnualBuildingUtilityPerformanceSummary", "End Uses", "", "Natural Gas", "GJ", ""),
+    (
+        "AnnualBuildingUtilityPerformanceSummary",
+        "End Uses",
+        "Total End Uses",
+        "Electricity",
+        "GJ",
+        "35.00",
+    ),
+    (
+        "AnnualBuildingUtilityPerformanceSummary",
+        "End Uses",
+        "Total End Uses",
+        "Natural Gas",
+        "GJ",
+        "200.00",
+    ),
+    (
+        "InputVerificationandResultsSummary",
+        "Skylight-Roof Ratio",
+        "Gross Roof Area",
+        "Total",
+        "m2",
+        "150.00",
+    ),
+]
+
+for _zone, _area, _wall, _window in [
+    ("APARTMENT 1", "100.00", "80.00", "10.00"),
+    ("APARTMENT 2", "100.00", "80.00", "10.00"),
+    ("CORRIDOR", "50.00", "40.00", "0.00"),
+]:
+    EPLUSOUT_SQL_ROWS += [
+        ("InputVerificationandResultsSummary", "Zone Summary", _zone, "Area", "m2", _area),
+        (
+            "InputVerificationandResultsSummary",
+            "Zone Summary",
+            _zone,
+            "Above Ground Gross Wall Area",
+            "m2",
+            _wall,
+        ),
+        (
+            "InputVerificationandResultsSummary",
+            "Zone Summary",
+            _zone,
+            "Window Glass Area",
+            "m2",
+            _window,
+        ),
+    ]
+
+
+@pytest.fixture
+def eplusout_sql_path(eplustbl_path):
+    """Minimal eplusout.sql written next to the eplustbl.csv fixture."""
+    sql_path = eplustbl_path.replace("eplustbl.csv", "eplusout.sql")
+    conn = sqlite3.connect(sql_path)
+    conn.execute(
+        "CREATE TABLE TabularDataWithStrings (ReportName TEXT, ReportForString TEXT, "
+        "TableName TEXT, RowName TEXT, ColumnName TEXT, Units TEXT, Value TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO TabularDataWithStrings VALUES (?, 'Entire Facility', ?, ?, ?, ?, ?)",
+        EPLUSOUT_SQL_ROWS,
+    )
+    conn.commit()
+    conn.close()
+    return sql_path
+
+
+INPUT_FILES = {
+    "ec_input_path": "embodied-carbon-inputs.csv",
+    "oc_input_path": "operational-carbon-inputs.csv",
+    "threshold_input_path": "berdo-thresholds-multifamily.csv",
+    "mat_cost_input_path": "material-cost-inputs.csv",
+    "utility_rate_input_path": "utility-cost-inputs.csv",
+}
+
+
+@pytest.fixture
+def input_paths(tmp_path):
+    """Copies of the KPI input CSVs, keyed by their evaluate_kpis_from_osw_and_csv argument."""
+    paths = {}
+    for arg, name in INPUT_FILES.items():
+        shutil.copy(INPUT_DIR / name, tmp_path / name)
+        paths[arg] = str(tmp_path / name)
+    return paths
@@ -0,0 +1,113 @@
+import asyncio
+import sys
+import time
+
+import pytest
+
+from praevion_core.adapters.openstudio.model_cache import PrefixPlan
+from praevion_core.pipelines.async_evaluator import AsyncKpiEvaluator, AsyncSimulationRunner
+
+
+def _python(code):
+    return [sys.executable, "-c", code]
+
+
+def test_run_command_captures_output_and_exit_status(tmp_path):
+    runner = AsyncSimulationRunner(max_concurrency=2)
+
+    async def main():
+        ok = await runner.run_command(_python("print('done')"), cwd=tmp_path)
+        failed = await runner.run_command(_python("import sys; sys.exit(3)"), cwd=tmp_path)
+        return ok, failed
+
+    (ok, stdout, _, usage), (failed, _, _, _) = asyncio.run(main())
+    assert ok and stdout.strip() == b"done"
+    assert usage["wall_time_s"] > 0
+    assert not failed
+
+
+def test_concurrency_is_bounded(tmp_path):
+    runner = AsyncSimulationRunner(max_concurrency=2)
+
+    async def main():
+        commands = [_python("import time; time.sleep(0.3)") for _ in range(4)]
+        start = time.perf_counter()
+        await asyncio.gather(*(runner.run_command(c, cwd=tmp_path) for c in commands))
+        return time.perf_counter() - start
+
+    # 4 jobs of 0.3 s with 2 slots need at least two rounds
+    assert asyncio.run(main()) >= 0.6
+
+
+def test_timeout_kills_the_subprocess(tmp_path):
+    runner = AsyncSimulationRunner(max_concurrency=1, timeout=0.2)
+
+    async def main():
+        return await runner.run_command(_python("import time; time.sleep(30)"), cwd=tmp_path)
+
+    start = time.perf_counter()
+    success, _, stderr, _ = asyncio.run(main())
+    assert not success
+    assert b"Timed out" in stderr
+    assert time.perf_counter() - start < 10
+
+
+def test_cancellation_propagates(tmp_path):
+    runner = AsyncSimulationRunner(max_concurrency=1)
+
+    async def main():
+        task = asyncio.create_task(
+            runner.run_command(_python("import time; time.sleep(30)"), cwd=tmp_path)
+        )
+        await asyncio.sleep(0.2)
+        task.cancel()
+        await task
+
+    with pytest.raises(asyncio.CancelledError):
+        asyncio.run(main())
+
+
+def test_admission_bounds_pending_evaluations():
+    runner = AsyncSimulationRunner(max_concurrency=1, max_pending=2)
+    in_flight, peak = 0, 0
+
+    async def evaluation():
+        nonlocal in_flight, peak
+        async with runner.admit():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+
+    async def main():
+        await asyncio.gather(*(evaluation() for _ in range(6)))
+
+    asyncio.run(main())
+    assert peak == 2
+
+
+def test_prefix_materialized_on_the_runner(tmp_path, monkeypatch):
+    monkeypatch.delenv("SIM_MEMORY_BUDGET_MB", raising=False)
+    plan = PrefixPlan(str(tmp_path / "seed.osm"), 0, build_depth=2, build_key="abc")
+    runs = []
+
+    class Runner(AsyncSimulationRunner):
+        async def run_osw(self, osw_path, run_logs_dir, measures_only=False):
+            runs.append((osw_path, measures_only))
+            return {"success": True, "log_path": None, "scratch_dir": None}
+
+    class ModelCache:
+        def plan(self, config, ecm_options_path, seed_file):
+            return plan
+
+        def prefix_osw(self, plan, config, ecm_options_path, weather_file, work_dir, run_id):
+            return str(tmp_path / f"{run_id}_prefix.osw")
+
+        def finish(self, plan, result, run_id):
+            return "prefix.osm", plan.build_depth
+
+    evaluator = AsyncKpiEvaluator(Runner(max_concurrency=1), input_paths={})
+    resolved = asyncio.run(evaluator.resolve_prefix(ModelCache(), {}, "run"))
+
+    assert resolved == ("prefix.osm", 2)
+    assert runs == [(str(tmp_path / "run_prefix.osw"), True)]
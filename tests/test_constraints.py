@@ -0,0 +1,94 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from praevion_core.config.constraints import (
+    ConstraintIndex,
+    get_constraint_index,
+    load_ecm_options,
+)
+from praevion_core.config.problem import problem
+from praevion_core.pipelines.run_function_async import config_key
+from praevion_core.pipelines.search_utils import space_forbidden_mask
+
+
+def legacy_is_valid(config):
+    """The hand-written rules the declarative constraints replaced."""
+    u_value = config["upgrade_window_u_value"]
+    shgc = config["upgrade_window_shgc"]
+    windows = u_value != "None" and shgc != "None"
+    wall = float(config["upgrade_wall_insulation"].split("-")[1])
+    infiltration = config["adjust_infiltration_rates"]
+
+    if (u_value == "None") != (shgc == "None"):
+        return False
+    if infiltration == "0.75" and wall < 10:
+        return False
+    if infiltration == "0.60" and (wall < 15 or not windows):
+        return False
+    return not (infiltration == "0.40" and (wall < 20 or not windows))
+
+
+def test_bitmap_matches_legacy_rules_and_compiled_clauses():
+    index = get_constraint_index()
+    configs = [
+        dict(zip(index.names, values, strict=True)) for values in itertools.product(*index.choices)
+    ]
+
+    # Enumeration order is the mixed-radix order
+    assert [index.index_of(config) for config in configs] == list(range(len(index)))
+    assert index.bitmap.tolist() == [legacy_is_valid(config) for config in configs]
+    assert int(index.bitmap.sum()) == 7744
+
+    names = [hp.name for hp in problem.space.get_hyperparameters()]
+    choices = [index.choices[index.names.index(name)] for name in names]
+    matrix = np.asarray(
+        [[choices[j].index(c[name]) for j, name in enumerate(names)] for c in configs]
+    )
+    forbidden = space_forbidden_mask(problem.space, names, choices, matrix)
+    assert (~forbidden).tolist() == index.bitmap.tolist()
+    assert index.valid_mask(names, choices, matrix).tolist() == index.bitmap.tolist()
+
+
+def test_partial_and_unlisted_configs():
+    index = get_constraint_index()
+
+    # Missing measures take their no-op option
+    assert index.index_of({}) == index.index_of(
+        {name: index.defaults[name] for name in index.names}
+    )
+    assert not index.is_valid_config({"adjust_infiltration_rates": "0.75"})
+    assert index.is_valid_config(
+        {"adjust_infiltration_rates": "0.75", "upgrade_wall_insulation": "R-10"}
+    )
+
+    # Values or keys outside the index are checked rule by rule
+    assert index.index_of({"upgrade_wall_insulation": "R-12"}) is None
+    assert not index.is_valid_config(
+        {"adjust_infiltration_rates": "0.75", "upgrade_wall_insulation": "R-7.5", "name": "x"}
+    )
+    assert index.is_valid_config({"upgrade_wall_insulation": "R-12"})
+
+
+def test_dedup_key_is_the_design_space_index():
+    config = {"upgrade_wall_insulation": "R-20", "upgrade_dhw_to_hpwh": "Upgrade"}
+    reordered = dict(reversed(list(config.items())))
+
+    assert config_key(config) == config_key(reordered) == get_constraint_index().index_of(config)
+    assert isinstance(config_key({"name": "good"}), str)
+
+
+def test_constraints_must_name_listed_measures_and_options():
+    ecm_options = load_ecm_options()
+
+    unknown_measure = {**ecm_options, "constraints": [{"forbid": {"upgrade_floor": ["R-5"]}}]}
+    with pytest.raises(ValueError, match="unknown measure 'upgrade_floor'"):
+        ConstraintIndex(unknown_measure)
+
+    unknown_option = {
+        **ecm_options,
+        "constraints": [{"forbid": {"upgrade_wall_insulation": ["R-12"]}}],
+    }
+    with pytest.raises(ValueError, match="unknown options"):
+        ConstraintIndex(unknown_option)
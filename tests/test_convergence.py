@@ -0,0 +1,72 @@
+import sys
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from praevion_core.pipelines.convergence import HypervolumeTracker
+from praevion_core.pipelines.pareto import hypervolume
+
+
+def test_hypervolume_of_known_fronts():
+    assert hypervolume([[1.0, 1.0], [2.0, 0.5]], [0.0, 0.0]) == pytest.approx(1.5)
+    assert hypervolume([[0.5, 0.5, 0.5, 0.5]], [0.0] * 4) == pytest.approx(0.0625)
+    assert hypervolume([[-2.0, 0.5]], [-1.0, -1.0]) == 0.0
+
+    # Dominated points add nothing
+    front = np.array([[0.8, 0.2, 0.5], [0.3, 0.9, 0.4], [0.5, 0.5, 0.9]])
+    assert hypervolume(np.vstack([front, front * 0.5]), [0, 0, 0]) == pytest.approx(
+        hypervolume(front, [0, 0, 0])
+    )
+
+
+def test_hypervolume_matches_monte_carlo_estimate():
+    rng = np.random.default_rng(3)
+    points = rng.random((12, 4))
+    samples = rng.random((200_000, 4))
+    covered = np.zeros(len(samples), dtype=bool)
+    for point in points:
+        covered |= np.all(samples <= point, axis=1)
+
+    assert hypervolume(points, [0.0] * 4) == pytest.approx(covered.mean(), abs=0.005)
+
+
+def test_tracker_stops_once_hypervolume_stalls():
+    tracker = HypervolumeTracker(
+        reference=[-1.0, -1.0], window=3, min_gain=0.01, min_evals=4, stop_on_stall=True
+    )
+
+    def complete(objective):
+        tracker.on_done(SimpleNamespace(objective=objective, metadata={}))
+
+    complete([-0.5, -0.5])
+    complete("F_failed")
+    complete([sys.float_info.max] * 2)
+    assert [hv for _, hv in tracker.history] == [0.25, 0.25, 0.25]
+    assert not tracker.search_stopped
+
+    complete([-0.2, -0.6])
+    assert tracker.hypervolume == pytest.approx(0.25 + 0.3 * 0.4)
+    assert not tracker.search_stopped
+
+    for _ in range(3):
+        complete([-0.9, -0.9])
+    assert tracker.search_stopped
+    assert len(tracker.history) == 7
+
+
+def test_tracking_alone_never_stops():
+    tracker = HypervolumeTracker(reference=[-1.0, -1.0], window=1, min_gain=1.0)
+    for _ in range(5):
+        tracker.on_done(SimpleNamespace(objective=[-0.5, -0.5], metadata={}))
+    assert tracker.stalled() and not tracker.search_stopped
+
+
+def test_other_fidelity_jobs_never_join_the_front():
+    tracker = HypervolumeTracker(reference=[-1.0, -1.0], fidelity="full")
+
+    tracker.on_done(SimpleNamespace(objective=[-0.5, -0.5], metadata={"fidelity": "full"}))
+    tracker.on_done(SimpleNamespace(objective=[-0.1, -0.1], metadata={"fidelity": "screening"}))
+
+    assert [hv for _, hv in tracker.history] == [0.25, 0.25]
+    assert len(tracker.archive) == 1
@@ -0,0 +1,62 @@
+import itertools
+
+import numpy as np
+from deephyper.evaluator import Evaluator
+
+from praevion_core.config.problem import problem
+from praevion_core.pipelines.design_space import DesignSpace, ExhaustiveCBO, top_k_rows
+from praevion_core.pipelines.search_utils import is_valid_config
+
+
+def test_enumeration_matches_brute_force():
+    space = DesignSpace(problem.space)
+    brute_force = [
+        dict(zip(space.names, values, strict=True))
+        for values in itertools.product(*space.choices)
+        if is_valid_config(dict(zip(space.names, values, strict=True)))
+    ]
+
+    assert len(list(itertools.product(*space.choices))) == 16_000
+    assert len(space) == len(brute_force)
+    assert sorted(map(str, space.configs())) == sorted(map(str, brute_force))
+
+    # The forbidden clauses compiled into the problem reject exactly what the bitmap rejects
+    assert len(DesignSpace(problem.space, constrained=False)) == len(space)
+
+
+def test_rows_round_trip_and_skip_invalid_configs():
+    space = DesignSpace(problem.space)
+    configs = space.configs([0, 5, len(space) - 1])
+    invalid = {
+        **configs[0],
+        "adjust_infiltration_rates": "0.40",
+        "upgrade_wall_insulation": "R-7.5",
+    }
+
+    assert space.rows_of(configs + [invalid]).tolist() == [0, 5, len(space) - 1]
+    assert space.values(["upgrade_dhw_to_hpwh"], [5]) == [[configs[1]["upgrade_dhw_to_hpwh"]]]
+
+
+def test_top_k_rows_orders_and_excludes():
+    values = np.array([3.0, -1.0, 2.0, -5.0, 0.0])
+
+    assert top_k_rows(values, 1).tolist() == [3]
+    assert top_k_rows(values, 3, exclude=[3]).tolist() == [1, 4, 2]
+    assert top_k_rows(values, 10, exclude=[0, 1, 2, 3, 4]).tolist() == []
+
+
+def test_exhaustive_search_proposes_unique_valid_configs(tmp_path):
+    def run(job):
+        config = job.parameters
+        wall = float(config["upgrade_wall_insulation"].split("-")[1])
+        return [-abs(wall - 15), -float(config["adjust_infiltration_rates"])]
+
+    with Evaluator.create(run, method="thread", method_kwargs={"num_workers": 4}) as evaluator:
+        search = ExhaustiveCBO(problem, n_initial_points=8, random_state=1, log_dir=str(tmp_path))
+        results = search.search(evaluator, max_evals=30)
+
+    params = results[[c for c in results.columns if c.startswith("p:")]]
+    configs = [{k[2:]: v for k, v in row.items()} for row in params.to_dict("records")]
+    assert search._design_X is not None
+    assert len(params.drop_duplicates()) == len(params)
+    assert all(is_valid_config(config) for config in configs)
@@ -0,0 +1,85 @@
+import pytest
+
+from praevion_core.config.paths import INPUT_DIR
+from praevion_core.domain.carbon.calc_embodied import EC_VALUE_COLUMN, calculate_embodied_carbon
+from praevion_core.domain.cost.calc_cost_material import (
+    MATERIAL_VALUE_COLUMN,
+    calculate_material_cost,
+)
+from praevion_core.domain.ecm_coefficients import EcmCoefficientTable
+
+SURFACE_AREAS = {"wall_area_m2": 1000.0, "roof_area_m2": 400.0, "window_area_m2": 200.0}
+
+
+@pytest.fixture(scope="module")
+def ec_table():
+    return EcmCoefficientTable.from_csv(INPUT_DIR / "embodied-carbon-inputs.csv", EC_VALUE_COLUMN)
+
+
+@pytest.fixture(scope="module")
+def cost_table():
+    return EcmCoefficientTable.from_csv(
+        INPUT_DIR / "material-cost-inputs.csv", MATERIAL_VALUE_COLUMN
+    )
+
+
+def test_lookup_normalizes_measure_and_option(ec_table):
+    assert ec_table.lookup("adjust_infiltration_rates", "0.90")
+    assert ec_table.lookup(" Adjust_Infiltration_Rates ", "0.9") == ec_table.lookup(
+        "adjust_infiltration_rates", "0.90"
+    )
+    assert ("upgrade_wall_insulation", "r-20") in ec_table
+    assert ec_table.lookup("upgrade_wall_insulation", "R-7.5") == ()
+
+    wall_items = ec_table.lookup("upgrade_wall_insulation", "R-20")
+    assert len(wall_items) == 3
+    assert {item.category for item in wall_items} == {"wall"}
+    assert sorted(item.thickness for item in wall_items if item.thickness) == [3.0]
+
+
+def test_embodied_carbon_per_selection(ec_table):
+    selections = {
+        "upgrade_wall_insulation.r_value_option": "R-20",
+        "upgrade_window_u_value.u_value_option": "0.22",
+        "upgrade_window_shgc.shgc_value_option": "0.25",
+        "upgrade_hvac_system_choice.hvac_option": "Mini-Split",
+        "upgrade_dhw_to_hpwh.dhw_hpwh_option": "Upgrade",
+    }
+    ec = calculate_embodied_carbon(
+        selections=selections,
+        surface_areas=SURFACE_AREAS,
+        total_floor_area=3000.0,
+        apartment_floor_area=2500.0,
+        apartment_count=40,
+        ec_table=ec_table,
+    )
+
+    assert ec["wall_ec_kg"] == pytest.approx((3.1 + 16 * 3 + 5.4) * 1000.0)
+    assert ec["window_ec_kg"] == pytest.approx(96.8 * 200.0)
+    assert ec["hvac_ec_kg"] == pytest.approx(5 * 2500.0 + 640 * 40)
+    assert ec["dhw_ec_kg"] == pytest.approx(158.0)
+    assert ec["total_ec_kg"] == pytest.approx(sum(v for k, v in ec.items() if k != "total_ec_kg"))
+
+
+def test_material_cost_per_selection(cost_table):
+    selections = {
+        "upgrade_roof_insulation.r_value_option": "R-30",
+        "adjust_infiltration_rates.infiltration_option": "0.60",
+        "upgrade_hvac_system_choice.hvac_option": "Condensing Boiler",
+    }
+    cost = calculate_material_cost(
+        selections=selections,
+        surface_areas=SURFACE_AREAS,
+        total_floor_area=3000.0,
+        apartment_floor_area=2500.0,
+        apartment_count=40,
+        cost_table=cost_table,
+    )
+
+    assert cost["roof_mat_cost"] == pytest.approx((76.85 + 19.27 + 9.69 * 5 + 17.55) * 400.0)
+    # Infiltration is not a wall/roof/window/... measure, so it lands in "other"
+    assert cost["other_mat_cost"] == pytest.approx(10.66 * 1000.0)
+    assert cost["hvac_mat_cost"] == pytest.approx(30000.0)
+    assert cost["material_cost_usd"] == pytest.approx(
+        cost["roof_mat_cost"] + cost["other_mat_cost"] + cost["hvac_mat_cost"]
+    )
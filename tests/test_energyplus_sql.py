@@ -0,0 +1,35 @@
+import pytest
+
+from praevion_core.adapters.energyplus.energyplus_sql import (
+    EplusSqlReport,
+    extract_construction_areas_sql,
+    extract_total_energy_sql,
+    extract_zone_area_sql,
+)
+from praevion_core.domain.kpis.evaluate_kpis import extract_simulation_results
+
+
+def test_sql_backend_matches_csv_backend(eplustbl_path, eplusout_sql_path):
+    csv_results = extract_simulation_results(eplustbl_path, kpi_backend="csv")
+    sql_results = extract_simulation_results(eplustbl_path, kpi_backend="sql")
+
+    for key in ("energy", "zone_data", "surface_areas"):
+        assert sql_results[key] == pytest.approx(csv_results[key]), key
+
+
+def test_sql_report_memoizes_tables(eplusout_sql_path):
+    with EplusSqlReport(eplusout_sql_path) as report:
+        assert report.table("Zone Summary") is report.table("Zone Summary")
+
+        energy = extract_total_energy_sql(report)
+        zones = extract_zone_area_sql(report)
+        areas = extract_construction_areas_sql(report)
+
+    assert energy["natural_gas_mmbtu"] == pytest.approx(400.0 * 0.947817)
+    assert zones["apartment_count"] == 2
+    assert areas["roof_area_m2"] == pytest.approx(150.0)
+
+
+def test_unknown_backend_raises(eplustbl_path):
+    with pytest.raises(ValueError):
+        extract_simulation_results(eplustbl_path, kpi_backend="htm")
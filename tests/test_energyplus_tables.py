@@ -0,0 +1,55 @@
+import pytest
+
+from praevion_core.adapters.energyplus.energyplus_kpis import (
+    extract_construction_areas,
+    extract_total_energy,
+    extract_zone_area,
+)
+from praevion_core.adapters.energyplus.energyplus_tables import (
+    EplusTableReport,
+    extract_named_table,
+)
+
+
+def test_report_indexes_headings_once(eplustbl_path):
+    report = EplusTableReport(eplustbl_path)
+
+    assert "end uses" in report.headings
+    assert "zone summary" in report.headings
+
+    first = report.table("Zone Summary", "Space Summary")
+    second = report.table("zone summary", "space summary")
+    assert first is second, "Tables should be memoized per report"
+
+
+def test_report_matches_legacy_extraction(eplustbl_path):
+    report = EplusTableReport(eplustbl_path)
+    table = report.table("End Uses", "End Uses By Subcategory")
+    legacy = extract_named_table(eplustbl_path, "End Uses", "End Uses By Subcategory")
+
+    assert table.equals(legacy)
+    assert len(table) == 6  # header row + 5 data rows
+
+
+def test_missing_section_raises(eplustbl_path):
+    report = EplusTableReport(eplustbl_path)
+    with pytest.raises(ValueError):
+        report.table("Not A Table", "Space Summary")
+
+
+def test_extractors_share_report(eplustbl_path):
+    report = EplusTableReport(eplustbl_path)
+
+    energy = extract_total_energy(report)
+    zones = extract_zone_area(report)
+    areas = extract_construction_areas(report)
+
+    assert energy["electricity_mmbtu"] == pytest.approx(70.0 * 0.947817)
+    assert zones["apartment_count"] == 2
+    assert zones["total_floor_area_m2"] == pytest.approx(250.0)
+    assert areas == pytest.approx(
+        {"wall_area_m2": 200.0, "window_area_m2": 20.0, "roof_area_m2": 150.0}
+    )
+
+    # Extractors still accept a plain path
+    assert extract_zone_area(eplustbl_path) == zones
@@ -0,0 +1,162 @@
+import json
+from concurrent.futures import Future
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from praevion_core.adapters.openstudio.generate_osw import (
+    canonical_measure_steps,
+    fidelity_step,
+    generate_osw_from_config,
+)
+from praevion_core.config.fidelity import (
+    active_fidelity,
+    annualization_factor,
+    fidelity_run_periods,
+)
+from praevion_core.config.paths import ECM_DIR
+from praevion_core.domain.kpis.evaluate_kpis import extract_simulation_results
+from praevion_core.pipelines.fidelity_calibration import (
+    CALIBRATION_KPIS,
+    calibration_error_report,
+    calibration_row,
+)
+from praevion_core.pipelines.result_cache import simulation_key
+
+with open(ECM_DIR / "ecm_options.json") as f:
+    ECM_OPTIONS = json.load(f)
+
+
+def test_profiles_resolve_to_run_periods_and_scale():
+    assert fidelity_run_periods("full") == []
+    assert fidelity_run_periods("seasonal_weeks") == [
+        "01/15-01/21",
+        "04/15-04/21",
+        "07/15-07/21",
+        "10/15-10/21",
+    ]
+    assert annualization_factor("full") == 1.0
+    assert annualization_factor("timestep_2") == 1.0
+    assert annualization_factor("seasonal_weeks") == pytest.approx(365 / 28)
+
+
+def test_unknown_profile_is_rejected(monkeypatch):
+    monkeypatch.setenv("SIM_FIDELITY", "hourly")
+    with pytest.raises(ValueError, match="Unknown fidelity profile"):
+        active_fidelity()
+
+
+def test_fidelity_step_only_for_complete_reduced_workflows(tmp_path):
+    seed = tmp_path / "seed.osm"
+    seed.write_text("OS:Version,3.9.0;")
+    weather = tmp_path / "weather.epw"
+    weather.write_text("LOCATION,Boston")
+    config = {"upgrade_wall_insulation": "R-20"}
+
+    def generate(**kwargs):
+        path = generate_osw_from_config(
+            config, ECM_DIR / "ecm_options.json", tmp_path / "run.osw", seed, weather, **kwargs
+        )
+        with open(path) as f:
+            return json.load(f)
+
+    assert fidelity_step("full") is None
+    osw = generate(fidelity="screening", lean_output=True)
+    assert [step["measure_dir_name"] for step in osw["steps"][-2:]] == [
+        "set_simulation_fidelity",
+        "set_lean_output_reports",
+    ]
+    assert osw["steps"][-2]["arguments"] == {
+        "timesteps_per_hour": 2,
+        "shadow_calculation_frequency": 30,
+        "run_periods": "01/15-01/21,04/15-04/21,07/15-07/21,10/15-10/21",
+    }
+    assert generate(fidelity="shadow_30d")["steps"][-1]["arguments"]["run_periods"] == ""
+    assert len(generate(fidelity="screening", stop_step=1)["steps"]) == 1
+    assert generate()["steps"] == osw["steps"][:-2]
+
+
+def test_reduced_fidelity_runs_get_their_own_simulation_key(tmp_path):
+    seed = tmp_path / "seed.osm"
+    seed.write_text("OS:Version,3.9.0;")
+    weather = tmp_path / "weather.epw"
+    weather.write_text("LOCATION,Boston")
+    (tmp_path / "measures").mkdir()
+    steps = canonical_measure_steps({"upgrade_wall_insulation": "R-20"}, ECM_OPTIONS)
+
+    def key(**kwargs):
+        return simulation_key(steps, seed, weather, tmp_path / "measures", "3.9.0", **kwargs)
+
+    assert key(fidelity="full") == key()
+    assert key(fidelity="seasonal_weeks") != key()
+    assert key(fidelity="seasonal_weeks") != key(fidelity="screening")
+
+
+def test_representative_week_energy_is_annualized(eplustbl_path):
+    full = extract_simulation_results(eplustbl_path)
+    weeks = extract_simulation_results(eplustbl_path, fidelity="monthly_weeks")
+
+    scale = 365 / 84
+    assert weeks["energy"]["electricity_mmbtu"] == pytest.approx(
+        full["energy"]["electricity_mmbtu"] * scale
+    )
+    assert weeks["zone_data"] == full["zone_data"]
+
+
+def test_calibration_report_compares_profiles_to_full_fidelity():
+    runs = pd.DataFrame(
+        [
+            {"sample": i, "fidelity": fidelity, "wall_time_s": time, **kpis}
+            for i, base in enumerate([100.0, 200.0, 300.0])
+            for fidelity, time, kpis in [
+                (
+                    "full",
+                    60.0,
+                    {
+                        "total_emissions_kg": base,
+                        "discounted_utility_cost_usd": base * 10,
+                        "berdo_fine_usd": 0.0,
+                    },
+                ),
+                (
+                    "screening",
+                    6.0,
+                    {
+                        "total_emissions_kg": base * 1.1,
+                        "discounted_utility_cost_usd": base * 10,
+                        "berdo_fine_usd": 5.0 if i else float("inf"),
+                    },
+                ),
+            ]
+        ]
+    )
+
+    report = calibration_error_report(runs).set_index("kpi")
+
+    carbon = report.loc["total_emissions_kg"]
+    assert carbon["fidelity"] == "screening"
+    assert carbon["mean_abs_pct_error"] == pytest.approx(10.0)
+    assert carbon["bias"] == pytest.approx(20.0)
+    assert carbon["rank_correlation"] == pytest.approx(1.0)
+    assert carbon["speedup"] == pytest.approx(10.0)
+    assert report.loc["discounted_utility_cost_usd", "max_abs_error"] == 0.0
+
+    # Failed runs drop out; zero full-fidelity values have no percentage error
+    fine = report.loc["berdo_fine_usd"]
+    assert fine["n_samples"] == 2
+    assert fine["mean_abs_error"] == pytest.approx(5.0)
+    assert pd.isna(fine["mean_abs_pct_error"])
+
+
+def test_failed_calibration_job_becomes_nan_row():
+    done, failed = Future(), Future()
+    done.set_result({"sample": 0, "fidelity": "full", "total_emissions_kg": 1.0, "error": None})
+    failed.set_exception(RuntimeError("EnergyPlus run failed"))
+
+    assert calibration_row(done, 0, "full")["total_emissions_kg"] == 1.0
+
+    row = calibration_row(failed, 1, "screening")
+    assert (row["sample"], row["fidelity"]) == (1, "screening")
+    assert row["error"] == "EnergyPlus run failed"
+    assert all(np.isnan(row[kpi]) for kpi in CALIBRATION_KPIS)
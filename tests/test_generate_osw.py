@@ -0,0 +1,94 @@
+import json
+import os
+
+from praevion_core.adapters.openstudio.generate_osw import (
+    canonical_measure_steps,
+    canonical_option,
+    canonical_steps_hash,
+    generate_osw_from_config,
+)
+from praevion_core.config.constraints import measure_options
+from praevion_core.config.paths import ECM_DIR
+
+with open(ECM_DIR / "ecm_options.json") as f:
+    ECM_OPTIONS = json.load(f)
+
+BASELINE = {
+    "upgrade_wall_insulation": "R-7.5",
+    "upgrade_roof_insulation": "R-15",
+    "upgrade_window_u_value": "None",
+    "upgrade_window_shgc": "None",
+    "adjust_infiltration_rates": "1.00",
+    "upgrade_hvac_system_choice": "Baseline",
+    "upgrade_dhw_to_hpwh": "Baseline",
+}
+
+
+def test_every_measure_declares_a_listed_noop_option():
+    for measure_info in measure_options(ECM_OPTIONS).values():
+        assert measure_info["noop_option"] in measure_info["options"]
+
+
+def test_canonical_option_matches_listed_spelling():
+    infiltration = ECM_OPTIONS["adjust_infiltration_rates"]
+    assert canonical_option(infiltration, "0.4") == "0.40"
+    assert canonical_option(infiltration, 1) == "1.00"
+    assert (
+        canonical_option(ECM_OPTIONS["upgrade_hvac_system_choice"], " mini-split") == "Mini-Split"
+    )
+    assert canonical_option(infiltration, "0.33") == "0.33"
+
+
+def test_noop_steps_are_dropped_in_preferred_order():
+    config = {
+        **BASELINE,
+        "upgrade_dhw_to_hpwh": "Upgrade",
+        "upgrade_wall_insulation": "R-20",
+    }
+    steps = [step for _, step in canonical_measure_steps(config, ECM_OPTIONS)]
+
+    assert steps == [
+        {"measure_dir_name": "upgrade_wall_insulation", "arguments": {"r_value_option": "R-20"}},
+        {"measure_dir_name": "upgrade_dhw_to_hpwh", "arguments": {"dhw_hpwh_option": "Upgrade"}},
+    ]
+    assert canonical_measure_steps(BASELINE, ECM_OPTIONS) == []
+
+
+def test_equivalent_configs_share_a_hash():
+    def steps_hash(config):
+        return canonical_steps_hash(canonical_measure_steps(config, ECM_OPTIONS))
+
+    upgraded = {**BASELINE, "adjust_infiltration_rates": "0.40"}
+    assert steps_hash(BASELINE) == steps_hash({"upgrade_hvac_system_choice": "Baseline"})
+    assert steps_hash(upgraded) == steps_hash({**upgraded, "adjust_infiltration_rates": 0.4})
+    assert steps_hash(upgraded) != steps_hash(BASELINE)
+
+
+def test_lean_output_step_requests_the_kpi_reports(tmp_path):
+    seed = tmp_path / "seed.osm"
+    seed.write_text("OS:Version,3.9.0;")
+    weather = tmp_path / "weather.epw"
+    weather.write_text("LOCATION,Boston")
+    config = {**BASELINE, "upgrade_wall_insulation": "R-20"}
+
+    def generate(**kwargs):
+        path = generate_osw_from_config(
+            config, ECM_DIR / "ecm_options.json", tmp_path / "run.osw", seed, weather, **kwargs
+        )
+        with open(path) as f:
+            return json.load(f)
+
+    osw = generate(lean_output=True)
+    lean_step = osw["steps"][-1]
+    assert lean_step["measure_dir_name"] == "set_lean_output_reports"
+    assert lean_step["arguments"]["summary_reports"] == (
+        "AnnualBuildingUtilityPerformanceSummary,InputVerificationandResultsSummary"
+    )
+    assert any(
+        os.path.isdir(os.path.join(path, "set_lean_output_reports"))
+        for path in osw["measure_paths"]
+    )
+
+    # Partial (measures-only) workflows and default runs are unchanged
+    assert len(generate(lean_output=True, stop_step=1)["steps"]) == 1
+    assert generate()["steps"] == osw["steps"][:-1]
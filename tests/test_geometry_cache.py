@@ -0,0 +1,96 @@
+import json
+
+from praevion_core.adapters.energyplus.geometry_cache import GeometryCache
+from praevion_core.domain.kpis import evaluate_kpis
+from praevion_core.domain.kpis.evaluate_kpis import evaluate_kpis_from_osw_and_csv
+
+GEOMETRY = {
+    "zone_data": {
+        "apartment_floor_area_m2": 200.0,
+        "non_apartment_floor_area_m2": 50.0,
+        "total_floor_area_m2": 250.0,
+        "apartment_count": 2,
+    },
+    "surface_areas": {"wall_area_m2": 200.0, "window_area_m2": 20.0, "roof_area_m2": 150.0},
+}
+
+
+def _counting_extractor(geometry):
+    calls = []
+
+    def extract():
+        calls.append(1)
+        return geometry
+
+    return extract, calls
+
+
+def test_first_run_fills_cache_and_later_runs_reuse_it(tmp_path):
+    seed = tmp_path / "seed.osm"
+    seed.write_text("OS:Version,3.9.0;")
+    extract, calls = _counting_extractor(GEOMETRY)
+
+    cache = GeometryCache(cache_dir=tmp_path / "geometry")
+    assert cache.resolve(str(seed), extract) == GEOMETRY
+    assert cache.resolve(str(seed), extract) == GEOMETRY
+    assert len(calls) == 1
+
+    # A fresh process (new cache object) reads the persisted entry
+    fresh_cache = GeometryCache(cache_dir=tmp_path / "geometry")
+    assert fresh_cache.resolve(str(seed), extract) == GEOMETRY
+    assert len(calls) == 1
+
+
+def test_seed_change_misses_cache(tmp_path):
+    seed = tmp_path / "seed.osm"
+    seed.write_text("OS:Version,3.9.0;")
+    extract, calls = _counting_extractor(GEOMETRY)
+
+    cache = GeometryCache(cache_dir=tmp_path / "geometry")
+    cache.resolve(str(seed), extract)
+    seed.write_text("OS:Version,3.9.0;\nOS:Space,Extra;")
+    cache.resolve(str(seed), extract)
+
+    assert len(calls) == 2
+
+
+def test_consistency_check_invalidates_on_mismatch(tmp_path):
+    seed = tmp_path / "seed.osm"
+    seed.write_text("OS:Version,3.9.0;")
+
+    cache = GeometryCache(cache_dir=tmp_path / "geometry", check_rate=1.0, seed=0)
+    cache.resolve(str(seed), lambda: GEOMETRY)
+
+    changed = {
+        "zone_data": GEOMETRY["zone_data"],
+        "surface_areas": {**GEOMETRY["surface_areas"], "wall_area_m2": 180.0},
+    }
+    assert cache.resolve(str(seed), lambda: changed) == changed
+    assert not list((tmp_path / "geometry").glob("*.json")), "Mismatch should drop the entry"
+
+
+def test_geometry_keyed_on_project_seed_not_prefix_model(
+    tmp_path, eplustbl_path, input_paths, monkeypatch
+):
+    original = evaluate_kpis.extract_simulation_results
+    seeds = []
+
+    def recording_extract(csv_path, kpi_backend, seed_file=None, fidelity=None):
+        seeds.append(seed_file)
+        return original(csv_path, kpi_backend, fidelity=fidelity)
+
+    monkeypatch.setattr(evaluate_kpis, "extract_simulation_results", recording_extract)
+
+    project_seed = tmp_path / "seed.osm"
+    project_seed.write_text("OS:Version,3.9.0;")
+    osw_path = tmp_path / "test.osw"
+    osw_path.write_text(json.dumps({"seed_file": str(tmp_path / "prefix.osm"), "steps": []}))
+
+    evaluate_kpis_from_osw_and_csv(
+        osw_path=str(osw_path),
+        csv_path=eplustbl_path,
+        seed_file=str(project_seed),
+        **input_paths,
+    )
+
+    assert seeds == [str(project_seed)]
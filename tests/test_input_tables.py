@@ -0,0 +1,70 @@
+import json
+import os
+
+import pytest
+
+from praevion_core.domain.ecm_coefficients import EcmCoefficientTable
+from praevion_core.domain.kpis.evaluate_kpis import evaluate_kpis_from_osw_and_csv
+from praevion_core.domain.kpis.input_tables import InputTableRegistry
+
+
+def test_inputs_loaded_once_until_content_changes(input_paths):
+    registry = InputTableRegistry()
+
+    first = registry.kpi_inputs(**input_paths)
+    assert registry.kpi_inputs(**input_paths) is first
+
+    # Touching a file without changing its content keeps the loaded tables
+    rates_path = input_paths["utility_rate_input_path"]
+    stat = os.stat(rates_path)
+    os.utime(rates_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    assert registry.kpi_inputs(**input_paths) is first
+
+    # Changing the content triggers a reload of that table only
+    with open(rates_path, "a") as f:
+        f.write("2100,1.0,1.0\n")
+    reloaded = registry.kpi_inputs(**input_paths)
+    assert reloaded is not first
+    assert reloaded.ec_table is first.ec_table
+    assert len(reloaded.df_rates) == len(first.df_rates) + 1
+
+
+def test_evaluate_kpis_uses_registry_inputs(tmp_path, eplustbl_path, input_paths, monkeypatch):
+    monkeypatch.setenv("GEOMETRY_CACHE", "off")
+
+    seed = tmp_path / "seed.osm"
+    seed.write_text("OS:Version,3.9.0;")
+    osw_path = tmp_path / "test.osw"
+    osw_path.write_text(
+        json.dumps(
+            {
+                "seed_file": str(seed),
+                "steps": [
+                    {
+                        "measure_dir_name": "upgrade_wall_insulation",
+                        "arguments": {"r_value_option": "R-20"},
+                    }
+                ],
+            }
+        )
+    )
+
+    kpis = evaluate_kpis_from_osw_and_csv(
+        osw_path=str(osw_path), csv_path=eplustbl_path, **input_paths
+    )
+
+    assert kpis["upgrade_wall_insulation.r_value_option"] == "R-20"
+    assert kpis["wall_ec_kg"] == pytest.approx((3.1 + 16 * 3 + 5.4) * 200.0)
+    assert kpis["berdo_fine_usd"] >= 1
+    assert kpis["discounted_utility_cost_usd"] > 0
+
+
+def test_same_file_loaded_separately_per_loader(input_paths):
+    registry = InputTableRegistry()
+    ec_path = input_paths["ec_input_path"]
+
+    df = registry.table(ec_path)
+    inputs = registry.kpi_inputs(**input_paths)
+
+    assert isinstance(inputs.ec_table, EcmCoefficientTable)
+    assert registry.table(ec_path).equals(df)
@@ -0,0 +1,103 @@
+import gzip
+import json
+import multiprocessing
+import threading
+
+from praevion_core.pipelines.kpi_log import (
+    KpiLogWriter,
+    close_kpi_log_writers,
+    compact_kpi_log,
+    get_kpi_log_writer,
+    kpi_log_files,
+    read_kpi_log,
+)
+from praevion_core.pipelines.pareto import ParetoArchive
+
+
+def _write_entries(kpi_log_path, worker, count):
+    writer = get_kpi_log_writer(kpi_log_path)
+    for i in range(count):
+        writer.write({"timestamp": f"2026{i:04d}", "run_id": f"{worker}-{i}", "pad": "x" * 20_000})
+    close_kpi_log_writers()
+
+
+def test_concurrent_workers_write_intact_segments(tmp_path):
+    log_path = str(tmp_path / "kpi_log_run.jsonl")
+
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=_write_entries, args=(log_path, w, 20)) for w in "ab"]
+    for process in processes:
+        process.start()
+
+    # Threads of one process share its segment
+    writer = KpiLogWriter(log_path, worker_id="t")
+    threads = [
+        threading.Thread(
+            target=lambda t=t: [
+                writer.write(
+                    {"timestamp": f"2026{i:04d}", "run_id": f"t{t}-{i}", "pad": "y" * 20_000}
+                )
+                for i in range(20)
+            ]
+        )
+        for t in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads + processes:
+        thread.join()
+    writer.close()
+
+    assert len(kpi_log_files(log_path)) == 3
+    entries = read_kpi_log(log_path)
+    assert len(entries) == 120
+    assert len({entry["run_id"] for entry in entries}) == 120
+    assert [entry["timestamp"] for entry in entries] == sorted(e["timestamp"] for e in entries)
+
+
+def test_compaction_merges_segments_into_one_gzip(tmp_path):
+    log_path = str(tmp_path / "kpi_log_run.jsonl")
+    for worker, timestamps in [("a", ["3", "1"]), ("b", ["2"])]:
+        writer = KpiLogWriter(log_path, worker_id=worker)
+        for timestamp in timestamps:
+            writer.write(
+                {
+                    "timestamp": timestamp,
+                    "run_id": f"{worker}{timestamp}",
+                    "success": True,
+                    "fidelity": "full",
+                    "objectives": {"normalized_objective_values": [-float(timestamp), -1.0]},
+                }
+            )
+        writer.close()
+
+    target = compact_kpi_log(log_path)
+
+    assert kpi_log_files(log_path) == [target]
+    with gzip.open(target, "rt") as f:
+        assert [json.loads(line)["run_id"] for line in f] == ["a1", "b2", "a3"]
+    assert [entry["run_id"] for entry in read_kpi_log(log_path)] == ["a1", "b2", "a3"]
+
+    archive = ParetoArchive("full")
+    assert archive.sync(log_path) == 3
+    assert archive.sync(log_path) == 0
+    assert [entry["run_id"] for entry in archive.front_entries()] == ["a1"]
+
+
+def test_entries_are_buffered_unless_multi_fidelity(tmp_path, monkeypatch):
+    log_path = str(tmp_path / "kpi_log_run.jsonl")
+    monkeypatch.delenv("KPI_LOG_FLUSH_EVERY", raising=False)
+    monkeypatch.delenv("MULTI_FIDELITY", raising=False)
+    writer = get_kpi_log_writer(log_path)
+    writer.write({"timestamp": "1", "run_id": "a"})
+
+    assert read_kpi_log(log_path) == []
+    close_kpi_log_writers(log_path)
+    assert [entry["run_id"] for entry in read_kpi_log(log_path)] == ["a"]
+
+    monkeypatch.setenv("MULTI_FIDELITY", "on")
+    writer = get_kpi_log_writer(log_path)
+    writer.write({"timestamp": "2", "run_id": "b"})
+
+    assert [entry["run_id"] for entry in read_kpi_log(log_path)] == ["a", "b"]
+    close_kpi_log_writers(log_path)
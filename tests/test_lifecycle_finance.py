@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from praevion_core.config.paths import INPUT_DIR
+from praevion_core.domain.cost.calc_cost_berdo import calculate_berdo_fine_from_factors
+from praevion_core.domain.cost.calc_cost_utility import calculate_discounted_utility_costs
+from praevion_core.domain.cost.lifecycle_finance import LifecycleFinanceModel
+
+
+@pytest.fixture(scope="module")
+def input_frames():
+    return (
+        pd.read_csv(INPUT_DIR / "operational-carbon-inputs.csv"),
+        pd.read_csv(INPUT_DIR / "berdo-thresholds-multifamily.csv"),
+        pd.read_csv(INPUT_DIR / "utility-cost-inputs.csv"),
+    )
+
+
+def _reference_fine(elec, gas, gsf, df_factors, df_thresholds, discount_rate=0.03):
+    # Year-by-year loop the batch engine replaces
+    total = 0.0
+    for i in range(min(25, len(df_factors))):
+        emissions = elec * df_factors.loc[i, "Electricity"] + gas * df_factors.loc[i, "Natural Gas"]
+        cei = emissions / gsf
+        threshold = df_thresholds.loc[i, "Emissions Threshold (kg CO2e/ft2/yr)"]
+        if cei > threshold:
+            total += (cei - threshold) * gsf / 1000 * 234 / (1 + discount_rate) ** i
+    return max(total, 1)
+
+
+def _reference_utility(elec, gas, df_rates, discount_rate=0.03):
+    total = 0.0
+    for i in range(min(25, len(df_rates))):
+        annual = (
+            elec * df_rates.loc[i, "Electricity $/MMBtu"]
+            + gas * df_rates.loc[i, "Natural Gas $/MMBtu"]
+        )
+        total += annual / (1 + discount_rate) ** i
+    return total
+
+
+def test_batch_matches_year_by_year_loop(input_frames):
+    df_factors, df_thresholds, df_rates = input_frames
+    model = LifecycleFinanceModel(df_factors, df_thresholds, df_rates)
+
+    rng = np.random.default_rng(0)
+    elec = rng.uniform(500, 5000, size=50)
+    gas = rng.uniform(0, 8000, size=50)
+    gsf = rng.uniform(40_000, 120_000, size=50)
+
+    result = model.evaluate(elec, gas, gsf)
+
+    expected_fines = [
+        _reference_fine(e, g, a, df_factors, df_thresholds)
+        for e, g, a in zip(elec, gas, gsf, strict=True)
+    ]
+    expected_costs = [_reference_utility(e, g, df_rates) for e, g in zip(elec, gas, strict=True)]
+
+    assert result["berdo_fine_usd"] == pytest.approx(expected_fines)
+    assert result["discounted_utility_cost_usd"] == pytest.approx(expected_costs)
+
+
+def test_scalar_wrappers_match_batch(input_frames):
+    df_factors, df_thresholds, df_rates = input_frames
+    model = LifecycleFinanceModel(df_factors, df_thresholds, df_rates)
+
+    fine = calculate_berdo_fine_from_factors(3000.0, 4000.0, 80_000.0, df_factors, df_thresholds)
+    cost = calculate_discounted_utility_costs(3000.0, 4000.0, df_rates)
+
+    assert fine["berdo_fine_usd"] == pytest.approx(
+        model.berdo_fines([3000.0], [4000.0], 80_000.0)[0]
+    )
+    assert cost["discounted_utility_cost_usd"] == pytest.approx(
+        model.utility_costs([3000.0], [4000.0])[0]
+    )
+
+
+def test_fine_floor_and_readonly_vectors(input_frames):
+    model = LifecycleFinanceModel(*input_frames)
+
+    # Zero usage never exceeds the threshold, so the fine is floored at $1
+    assert model.berdo_fines([0.0], [0.0], 80_000.0)[0] == 1
+
+    with pytest.raises(ValueError):
+        model.electricity_rates[0] = 0.0
@@ -0,0 +1,125 @@
+import json
+
+from praevion_core.adapters.openstudio import model_cache
+from praevion_core.adapters.openstudio.generate_osw import canonical_measure_steps
+from praevion_core.adapters.openstudio.model_cache import MeasurePrefixCache
+from praevion_core.config.paths import ECM_DIR
+
+ECM_OPTIONS_PATH = ECM_DIR / "ecm_options.json"
+with open(ECM_OPTIONS_PATH) as f:
+    ECM_OPTIONS = json.load(f)
+
+ENVELOPE = {
+    "upgrade_wall_insulation": "R-20",
+    "upgrade_roof_insulation": "R-30",
+    "adjust_infiltration_rates": "0.75",
+}
+
+
+def _seed(tmp_path):
+    seed = tmp_path / "seed.osm"
+    seed.write_text("OS:Version,3.9.0;")
+    measures = tmp_path / "measures"
+    measures.mkdir()
+    (measures / "measure.rb").write_text("# measure")
+    return seed, measures
+
+
+def _keys(cache, seed, measures, config):
+    steps = canonical_measure_steps(config, ECM_OPTIONS)
+    return steps, cache.prefix_keys(seed, steps, measures_dir=measures, version="3.9.0")
+
+
+def test_configs_sharing_an_envelope_share_prefix_keys(tmp_path):
+    seed, measures = _seed(tmp_path)
+    cache = MeasurePrefixCache(cache_dir=tmp_path / "models")
+
+    steps_a, keys_a = _keys(cache, seed, measures, {**ENVELOPE, "upgrade_dhw_to_hpwh": "Upgrade"})
+    steps_b, keys_b = _keys(
+        cache, seed, measures, {**ENVELOPE, "upgrade_hvac_system_choice": "Mini-Split"}
+    )
+
+    assert cache.prefix_depth(steps_a) == cache.prefix_depth(steps_b) == 3
+    assert keys_a[:4] == keys_b[:4]
+    assert keys_a[4] != keys_b[4]
+
+
+def test_deepest_cached_prefix_is_reused(tmp_path):
+    seed, measures = _seed(tmp_path)
+    cache = MeasurePrefixCache(cache_dir=tmp_path / "models")
+    config = {**ENVELOPE, "upgrade_dhw_to_hpwh": "Upgrade"}
+    steps, keys = _keys(cache, seed, measures, config)
+
+    assert cache.deepest(keys, 3) == (0, None)
+
+    wall_model = tmp_path / "wall.osm"
+    wall_model.write_text("OS:Version,3.9.0;\n! wall upgraded")
+    cache.store(keys[1], wall_model)
+
+    depth, path = cache.deepest(keys, cache.prefix_depth(steps))
+    assert depth == 1
+    with open(path) as f:
+        assert f.read().endswith("! wall upgraded")
+
+
+def test_resolve_returns_cached_envelope_without_running(tmp_path, monkeypatch):
+    seed, measures = _seed(tmp_path)
+    cache = MeasurePrefixCache(cache_dir=tmp_path / "models")
+    config = {**ENVELOPE, "upgrade_dhw_to_hpwh": "Upgrade"}
+    _, keys = _keys(cache, seed, measures, config)
+
+    envelope_model = tmp_path / "envelope.osm"
+    envelope_model.write_text("OS:Version,3.9.0;\n! envelope upgraded")
+    cache.store(keys[3], envelope_model)
+
+    monkeypatch.setattr(
+        cache,
+        "prefix_keys",
+        lambda seed_file, steps: MeasurePrefixCache.prefix_keys(
+            cache, seed_file, steps, measures_dir=measures, version="3.9.0"
+        ),
+    )
+    seed_file, start_step = cache.resolve(
+        config, ECM_OPTIONS_PATH, seed, tmp_path / "weather.epw", tmp_path, "run"
+    )
+
+    assert start_step == 3
+    assert seed_file == cache.path_for(keys[3])
+
+
+def test_prefix_built_only_once_seen_min_uses_times(tmp_path):
+    seed, measures = _seed(tmp_path)
+    cache = MeasurePrefixCache(cache_dir=tmp_path / "models", min_uses=2)
+    _, keys_a = _keys(cache, seed, measures, ENVELOPE)
+    _, keys_b = _keys(cache, seed, measures, {**ENVELOPE, "adjust_infiltration_rates": "0.5"})
+
+    # First sighting of every prefix: nothing is worth materializing yet
+    assert cache.build_depth(keys_a, 0, 3) == 0
+
+    # A second config sharing wall + roof makes that shared prefix the one to build
+    assert cache.build_depth(keys_b, 0, 3) == 2
+
+    # Repeating the first envelope makes its full prefix worth building
+    assert cache.build_depth(keys_a, 0, 3) == 3
+
+
+def test_resolve_skips_measures_only_run_for_unseen_prefix(tmp_path, monkeypatch):
+    seed, measures = _seed(tmp_path)
+    cache = MeasurePrefixCache(cache_dir=tmp_path / "models", min_uses=2)
+    monkeypatch.setattr(
+        cache,
+        "prefix_keys",
+        lambda seed_file, steps: MeasurePrefixCache.prefix_keys(
+            cache, seed_file, steps, measures_dir=measures, version="3.9.0"
+        ),
+    )
+
+    def fail_run(*args, **kwargs):
+        raise AssertionError("prefix should not be materialized on first sighting")
+
+    monkeypatch.setattr(model_cache, "run_osw_and_organize_logs", fail_run)
+    seed_file, start_step = cache.resolve(
+        ENVELOPE, ECM_OPTIONS_PATH, seed, tmp_path / "weather.epw", tmp_path, "run"
+    )
+
+    assert (seed_file, start_step) == (seed, 0)
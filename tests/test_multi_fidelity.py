@@ -0,0 +1,126 @@
+import json
+
+import numpy as np
+import pytest
+
+from praevion_core.pipelines import pareto, run_function_async
+from praevion_core.pipelines.kpi_log import read_kpi_log
+from praevion_core.pipelines.multi_fidelity import (
+    MultiFidelityPolicy,
+    fidelity_bias,
+    fidelity_counts,
+    is_near_front,
+)
+
+# Normalized KPIs of a config on the front and one far behind it (see record_success)
+GOOD_KPIS = {
+    "total_emissions_kg": 1_400_000,
+    "total_ec_kg": 10_000,
+    "berdo_fine_usd": 80_000,
+    "material_cost_usd": 10_000,
+    "discounted_utility_cost_usd": 1_700_000,
+}
+POOR_KPIS = {
+    "total_emissions_kg": 5_000_000,
+    "total_ec_kg": 400_000,
+    "berdo_fine_usd": 900_000,
+    "material_cost_usd": 1_000_000,
+    "discounted_utility_cost_usd": 3_500_000,
+}
+
+
+def test_near_front_allows_margin():
+    reference = np.array([[0.0, 0.0], [-1.0, 1.0]])
+
+    assert is_near_front([0.5, -0.5], np.empty((0, 2)), margin=0.0)
+    assert is_near_front([1.0, -1.0], reference, margin=0.0)
+    assert is_near_front([-0.01, -0.01], reference, margin=0.02)
+    assert not is_near_front([-0.1, -0.1], reference, margin=0.02)
+
+
+def test_only_configs_near_the_front_are_promoted(tmp_path, monkeypatch):
+    log_path = tmp_path / "kpi_log.jsonl"
+    monkeypatch.setenv("KPI_LOG_PATH", str(log_path))
+    monkeypatch.setenv("MULTI_FIDELITY", "on")
+    monkeypatch.setattr(run_function_async, "get_result_cache", lambda: None)
+    monkeypatch.setattr(pareto, "_pareto_archives", {})
+
+    evaluations = []
+
+    def fake_evaluate(config, fidelity, **kwargs):
+        evaluations.append((config["name"], fidelity))
+        return dict(GOOD_KPIS if config["name"] == "good" else POOR_KPIS)
+
+    monkeypatch.setattr(run_function_async, "evaluate_kpis_from_config", fake_evaluate)
+
+    good = run_function_async.run_function({"name": "good"})
+    poor = run_function_async.run_function({"name": "poor"})
+
+    assert evaluations == [("good", "screening"), ("good", "full"), ("poor", "screening")]
+    assert good["metadata"]["fidelity"] == "full" and good["metadata"]["promoted"]
+    assert poor["metadata"]["fidelity"] == "screening"
+
+    entries = read_kpi_log(str(log_path))
+    assert [(e["fidelity"], e["promoted"]) for e in entries] == [
+        ("screening", False),
+        ("full", True),
+        ("screening", False),
+    ]
+    assert fidelity_counts(str(log_path)) == {"screening": 2, "full": 1}
+
+    # The reference is the screening front: "good" dominates "poor"
+    reference = MultiFidelityPolicy().reference_objectives(str(log_path))
+    np.testing.assert_allclose(reference, [entries[0]["objectives"]["normalized_objective_values"]])
+
+
+def test_reference_front_reads_only_new_log_lines(tmp_path, monkeypatch):
+    log_path = tmp_path / "kpi_log.jsonl"
+    monkeypatch.setattr(pareto, "_pareto_archives", {})
+    policy = MultiFidelityPolicy()
+
+    def log(run_id, objectives):
+        entry = {
+            "run_id": run_id,
+            "success": True,
+            "fidelity": "screening",
+            "objectives": {"normalized_objective_values": objectives},
+        }
+        with open(log_path, "a") as f:
+            f.write(json.dumps(entry) + "\n")
+
+    log("a", [-0.5, -0.5, -0.5, -0.5])
+    assert len(policy.reference_objectives(str(log_path))) == 1
+
+    log("b", [-0.1, -0.1, -0.1, -0.1])
+    np.testing.assert_allclose(policy.reference_objectives(str(log_path)), [[-0.1] * 4])
+
+    # Both lines were consumed by the syncs above; nothing is read twice
+    assert pareto.get_pareto_archive("screening").sync(str(log_path)) == 0
+
+
+def test_screened_objectives_are_bias_corrected_once_calibrated():
+    policy = MultiFidelityPolicy(min_bias_pairs=2)
+    low = {"a": [-0.5, -0.5], "b": [-0.3, -0.7], "c": [-0.2, -0.2]}
+    high = {"a": [-0.6, -0.5], "b": [-0.4, -0.9]}
+
+    assert fidelity_bias(low, {"a": high["a"]}, min_pairs=2) is None
+    bias = fidelity_bias(low, high, min_pairs=2)
+    np.testing.assert_allclose(bias, [-0.1, -0.1])
+
+    screened = {"objective": [-0.2, -0.2], "metadata": {"success": True}}
+    corrected = policy.corrected(screened, bias)
+    np.testing.assert_allclose(corrected["objective"], [-0.3, -0.3])
+    assert corrected["metadata"]["objective_bias"] == pytest.approx([-0.1, -0.1])
+    assert policy.corrected(screened, None) is screened
+
+    entries = [
+        {
+            "run_id": run_id,
+            "success": True,
+            "fidelity": fidelity,
+            "objectives": {"normalized_objective_values": objectives},
+        }
+        for fidelity, values in [("screening", low), ("full", high)]
+        for run_id, objectives in values.items()
+    ]
+    np.testing.assert_allclose(policy.bias_from_entries(entries), [-0.1, -0.1])
@@ -0,0 +1,84 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from praevion_core.pipelines.logging_utils import compute_crowding_distance
+from praevion_core.pipelines.pareto import ParetoArchive, crowding_distance, non_dominated_ranks
+
+
+def brute_force_front(points):
+    return [
+        i for i, p in enumerate(points) if not any(np.all(q >= p) and np.any(q > p) for q in points)
+    ]
+
+
+def test_incremental_front_matches_brute_force():
+    rng = np.random.default_rng(0)
+    points = rng.random((300, 3))
+    archive = ParetoArchive()
+    for i, point in enumerate(points):
+        archive.add(point, {"run_id": f"run_{i}"})
+
+    expected = brute_force_front(points)
+    assert len(archive) == 300
+    assert sorted(int(e["run_id"][4:]) for e in archive.front_entries()) == expected
+    assert np.array_equal(np.flatnonzero(archive.ranks() == 0), expected)
+
+    # Re-adding a known run is ignored
+    assert not archive.add(points[expected[0]], {"run_id": f"run_{expected[0]}"})
+    assert len(archive) == 300
+
+
+def test_ranks_peel_successive_fronts():
+    points = np.array([[0.0, 0.0], [1.0, 1.0], [0.0, 2.0], [-1.0, -1.0], [0.5, 0.5]])
+    assert non_dominated_ranks(points).tolist() == [2, 0, 0, 3, 1]
+
+
+def test_crowding_distance_matches_neighbour_gaps():
+    points = np.array([[0.0, 1.0], [0.2, 0.7], [0.5, 0.4], [1.0, 0.0]])
+    distances = crowding_distance(points)
+
+    assert np.isinf(distances[[0, 3]]).all()
+    assert distances[1:3].tolist() == [0.5 + 0.6, 0.8 + 0.7]
+    assert np.isinf(crowding_distance(points[:2])).all()
+
+    df = pd.DataFrame(points, columns=["objective_0", "objective_1"], index=[10, 11, 12, 13])
+    series = compute_crowding_distance(df, ["objective_0", "objective_1"])
+    assert series.index.tolist() == [10, 11, 12, 13]
+    assert np.allclose(series.to_numpy()[1:3], distances[1:3])
+
+
+def test_sync_reads_only_new_complete_log_lines(tmp_path):
+    log_path = tmp_path / "kpi_log.jsonl"
+
+    def entry(run_id, objectives, **kwargs):
+        return json.dumps(
+            {
+                "run_id": run_id,
+                "success": True,
+                "fidelity": "full",
+                "objectives": {"normalized_objective_values": objectives},
+                **kwargs,
+            }
+        )
+
+    log_path.write_text(
+        entry("a", [-0.5, -0.5])
+        + "\n"
+        + entry("b", [-0.2, -0.9], fidelity="screening")
+        + "\n"
+        + json.dumps({"run_id": "c", "success": False})
+        + "\n"
+        + entry("d", [-0.1, -0.1])[:20]
+    )
+
+    archive = ParetoArchive("full")
+    archive.add([-0.5, -0.5], {"run_id": "a"})
+    assert archive.sync(str(log_path)) == 3
+    assert len(archive) == 1
+
+    with open(log_path, "a") as f:
+        f.write(entry("d", [-0.1, -0.1])[20:] + "\n")
+    assert archive.sync(str(log_path)) == 1
+    assert [e["run_id"] for e in archive.front_entries()] == ["d"]
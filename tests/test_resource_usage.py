@@ -0,0 +1,84 @@
+import socket
+import subprocess
+import sys
+import time
+
+from praevion_core.pipelines.resource_scheduler import MemoryAwareScheduler, memory_group
+from praevion_core.pipelines.resource_usage import run_with_resource_usage
+
+HEAT_PUMP = {"upgrade_hvac_system_choice": "ASHP", "upgrade_dhw_to_hpwh": "HPWH"}
+BASELINE = {"upgrade_hvac_system_choice": "Baseline", "upgrade_dhw_to_hpwh": "Baseline"}
+
+
+def _python(code):
+    return [sys.executable, "-c", code]
+
+
+def test_run_with_resource_usage_measures_the_child(tmp_path):
+    code = "import sys; block = bytearray(64 * 1024 * 1024); print('done'); sys.exit(2)"
+    returncode, stdout, _, usage = run_with_resource_usage(_python(code), cwd=tmp_path)
+
+    assert returncode == 2
+    assert stdout.strip() == b"done"
+    assert usage["wall_time_s"] > 0
+    if usage["max_rss_mb"] is not None:
+        assert usage["max_rss_mb"] >= 64
+
+
+def test_run_with_resource_usage_kills_on_timeout(tmp_path):
+    start = time.perf_counter()
+    returncode, _, _, _ = run_with_resource_usage(
+        _python("import time; time.sleep(30)"), cwd=tmp_path, timeout=0.2
+    )
+    assert returncode != 0
+    assert time.perf_counter() - start < 10
+
+
+def test_projection_uses_group_measurements(tmp_path):
+    scheduler = MemoryAwareScheduler(8000, db_path=tmp_path / "usage.sqlite", headroom=1.0)
+    assert scheduler.projected_mb(HEAT_PUMP) == scheduler.default_mb
+
+    scheduler.record(HEAT_PUMP, {"max_rss_mb": 1500.0, "wall_time_s": 60.0})
+    scheduler.record(HEAT_PUMP, {"max_rss_mb": 1800.0, "wall_time_s": 62.0})
+    scheduler.record(BASELINE, {"max_rss_mb": None})
+
+    assert memory_group(HEAT_PUMP) != memory_group(BASELINE)
+    assert scheduler.projected_mb(HEAT_PUMP) == 1800.0
+    # Unmeasured groups fall back to the largest measurement of any group
+    assert scheduler.projected_mb(BASELINE) == 1800.0
+    assert scheduler.projected_mb(HEAT_PUMP, runner="energyplus") == scheduler.default_mb
+
+
+def test_admission_respects_the_memory_budget(tmp_path):
+    db_path = tmp_path / "usage.sqlite"
+    scheduler = MemoryAwareScheduler(3000, db_path=db_path, headroom=1.0)
+    scheduler.record(HEAT_PUMP, {"max_rss_mb": 2000.0})
+    scheduler.record(BASELINE, {"max_rss_mb": 800.0})
+
+    # The first run is always admitted, even if it alone exceeds the budget
+    first = scheduler.try_reserve(HEAT_PUMP)
+    assert first is not None
+    assert scheduler.try_reserve(HEAT_PUMP) is None
+
+    # Another worker process sees the same reservations
+    other = MemoryAwareScheduler(3000, db_path=db_path, headroom=1.0)
+    assert other.try_reserve(BASELINE) is not None
+    assert other.try_reserve(BASELINE) is None
+
+    scheduler.release(first)
+    assert scheduler.try_reserve(HEAT_PUMP) is not None
+
+
+def test_reservations_of_dead_workers_are_reclaimed(tmp_path):
+    scheduler = MemoryAwareScheduler(1000, db_path=tmp_path / "usage.sqlite")
+
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    scheduler._connect().execute(
+        "INSERT INTO reservations VALUES (?, ?, ?, ?, ?)",
+        ("dead", socket.gethostname(), dead.pid, 900.0, time.time()),
+    )
+
+    with scheduler.slot(BASELINE):
+        rows = scheduler._connect().execute("SELECT id FROM reservations").fetchall()
+        assert "dead" not in {row[0] for row in rows}
@@ -0,0 +1,144 @@
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+
+from praevion_core.adapters.openstudio.generate_osw import canonical_measure_steps
+from praevion_core.adapters.openstudio.osw_selection import selections_from_config
+from praevion_core.pipelines.result_cache import SimulationResultCache, simulation_key
+
+RESULTS = {
+    "energy": {"electricity_mmbtu": np.float64(1200.5), "natural_gas_mmbtu": 3400.25},
+    "zone_data": {
+        "apartment_floor_area_m2": 200.0,
+        "non_apartment_floor_area_m2": 50.0,
+        "total_floor_area_m2": 250.0,
+        "apartment_count": 2,
+    },
+    "surface_areas": {"wall_area_m2": 200.0, "window_area_m2": 20.0, "roof_area_m2": 150.0},
+}
+CONFIG = {"upgrade_wall_insulation": "R-15", "adjust_infiltration_rates": "0.75"}
+ECM_OPTIONS = {
+    "upgrade_wall_insulation": {
+        "measure_dir": "data/models/openstudio_measures/insulation/upgrade_wall_insulation",
+        "argument_key": "r_value_option",
+        "options": ["R-7.5", "R-10", "R-15", "R-20"],
+        "noop_option": "R-7.5",
+    },
+    "adjust_infiltration_rates": {
+        "measure_dir": "data/models/openstudio_measures/air-sealing/adjust_infiltration_rates",
+        "argument_key": "infiltration_option",
+        "options": ["1.00", "0.75"],
+        "noop_option": "1.00",
+    },
+}
+
+
+def _model_files(tmp_path):
+    seed = tmp_path / "seed.osm"
+    seed.write_text("OS:Version,3.9.0;")
+    weather = tmp_path / "weather.epw"
+    weather.write_text("LOCATION,Boston")
+    measures = tmp_path / "measures" / "insulation" / "upgrade_wall_insulation"
+    measures.mkdir(parents=True)
+    (measures / "measure.rb").write_text("# wall measure")
+    return seed, weather, tmp_path / "measures"
+
+
+def test_key_depends_on_config_and_model_inputs(tmp_path):
+    seed, weather, measures = _model_files(tmp_path)
+
+    def key(config=CONFIG, version="3.9.0"):
+        steps = canonical_measure_steps(config, ECM_OPTIONS)
+        return simulation_key(steps, seed, weather, measures, version=version)
+
+    base = key()
+    assert key(dict(reversed(list(CONFIG.items())))) == base
+    assert key({**CONFIG, "adjust_infiltration_rates": 0.75}) == base
+    assert key({**CONFIG, "upgrade_wall_insulation": "R-20"}) != base
+    assert key(version="3.10.0") != base
+
+    (measures / "insulation" / "upgrade_wall_insulation" / "measure.rb").write_text("# edited")
+    assert key() != base
+
+    seed.write_text("OS:Version,3.9.0;\nOS:Space,Extra;")
+    weather.write_text("LOCATION,Chicago")
+    assert key() != base
+
+
+def test_results_persist_across_cache_instances(tmp_path):
+    db_path = tmp_path / "cache" / "simulation_results.sqlite"
+    cache = SimulationResultCache(db_path)
+    assert cache.get("abc") is None
+
+    cache.put("abc", CONFIG, RESULTS)
+    cache.close()
+
+    reopened = SimulationResultCache(db_path)
+    assert reopened.get("abc") == {
+        **RESULTS,
+        "energy": {"electricity_mmbtu": 1200.5, "natural_gas_mmbtu": 3400.25},
+    }
+    assert len(reopened) == 1
+
+
+def test_selections_from_config_matches_osw_layout():
+    assert selections_from_config({**CONFIG, "unknown_measure": "x"}, ECM_OPTIONS) == {
+        "upgrade_wall_insulation.r_value_option": "R-15",
+        "adjust_infiltration_rates.infiltration_option": "0.75",
+    }
+
+
+def test_claims_are_exclusive_until_released(tmp_path):
+    db_path = tmp_path / "simulation_results.sqlite"
+    owner = SimulationResultCache(db_path)
+    other = SimulationResultCache(db_path)
+
+    assert owner.acquire("abc") is None
+    assert not other.claim("abc")
+
+    owner.release("abc")
+    assert other.claim("abc")
+
+
+def test_dead_or_expired_claims_are_taken_over(tmp_path):
+    db_path = tmp_path / "simulation_results.sqlite"
+    cache = SimulationResultCache(db_path, stale_after=3600)
+
+    dead_pid = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead_pid.wait()
+    with cache._connect() as conn:
+        conn.execute(
+            "INSERT INTO inflight VALUES (?, ?, ?, ?)",
+            ("dead", socket.gethostname(), dead_pid.pid, time.time()),
+        )
+        conn.execute(
+            "INSERT INTO inflight VALUES (?, ?, ?, ?)",
+            ("expired", "other-host", 1, time.time() - 7200),
+        )
+
+    assert cache.claim("dead")
+    assert cache.claim("expired")
+
+
+def test_duplicate_waits_for_in_flight_result(tmp_path):
+    db_path = tmp_path / "simulation_results.sqlite"
+    owner = SimulationResultCache(db_path)
+    waiter = SimulationResultCache(db_path, poll_interval=0.01)
+    assert owner.acquire("abc") is None
+
+    def finish_simulation():
+        time.sleep(0.1)
+        finisher = SimulationResultCache(db_path)
+        finisher.put("abc", CONFIG, RESULTS)
+        finisher.close()
+
+    thread = threading.Thread(target=finish_simulation)
+    thread.start()
+    results = waiter.acquire("abc")
+    thread.join()
+
+    assert results["zone_data"] == RESULTS["zone_data"]
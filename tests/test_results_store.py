@@ -0,0 +1,95 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from praevion_core.pipelines.results_store import (
+    KPI_COLUMNS,
+    deduplicate_results,
+    pareto_efficient_mask,
+    read_results,
+    results_frame,
+    summarize_results,
+    write_results,
+)
+
+
+def history():
+    objectives = [
+        [-0.1, -0.5, -0.2, -0.3],
+        [-0.4, -0.1, -0.6, -0.2],
+        [-0.1, -0.5, -0.2, -0.3],
+        [-0.9, -0.9, -0.9, -0.9],
+    ]
+    return pd.DataFrame(
+        {
+            "p:upgrade_wall_insulation": ["R-20", "R-10", "R-25", "R-7.5"],
+            **{f"objective_{j}": [row[j] for row in objectives] for j in range(4)},
+            "m:objectives": [
+                {"operational_carbon_kg": 1.0e6, "material_cost_usd": 5.0e4},
+                {"operational_carbon_kg": 2.0e6, "material_cost_usd": 1.0e4},
+                str({"operational_carbon_kg": 1.0e6, "material_cost_usd": 5.0e4}),
+                None,
+            ],
+            "m:config": [{"upgrade_wall_insulation": "R-20"}, {}, {}, {}],
+            "pareto_efficient": [False, True, True, False],
+        }
+    )
+
+
+def test_kpis_become_float_columns_and_nested_metadata_json():
+    df = results_frame(history())
+
+    assert "m:objectives" not in df.columns
+    assert all(df[col].dtype == float for col in KPI_COLUMNS)
+    assert df["operational_carbon_kg"].tolist()[:3] == [1.0e6, 2.0e6, 1.0e6]
+    assert np.isnan(df.loc[3, "operational_carbon_kg"])
+    assert df.loc[0, "m:config"] == '{"upgrade_wall_insulation": "R-20"}'
+
+
+def test_dedup_prefers_pareto_efficient_rows_and_keeps_order():
+    df = deduplicate_results(results_frame(history()))
+
+    assert df["p:upgrade_wall_insulation"].tolist() == ["R-10", "R-25", "R-7.5"]
+
+
+def test_summary_uses_front_and_objective_ranges():
+    df = deduplicate_results(results_frame(history()))
+    row = summarize_results(df, "run", max_evals=4, hypervolume=0.1234567)
+
+    assert row["final_configs"] == 3 and row["duplicates_removed"] == 1
+    assert row["pareto_size"] == 2
+    assert np.isnan(row["crowding_mean"])
+    assert row["hypervolume"] == 0.123457
+    assert row["objective_0_min"] == -0.9 and row["objective_0_max"] == -0.1
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_results_store_round_trip(tmp_path, fmt):
+    if fmt == "parquet":
+        pytest.importorskip("pyarrow")
+    df = deduplicate_results(results_frame(history()))
+    path = tmp_path / f"results_run.{fmt}"
+
+    write_results(df, str(path))
+    pd.testing.assert_frame_equal(read_results(str(path)), df, check_dtype=False)
+
+
+def test_front_and_summary_only_cover_the_front_fidelity():
+    df = results_frame(
+        pd.DataFrame(
+            {
+                **{f"objective_{j}": [-0.5, -0.1, -0.9] for j in range(4)},
+                "m:fidelity": ["full", "screening", "full"],
+            }
+        )
+    )
+    df["pareto_efficient"] = pareto_efficient_mask(df, "full")
+
+    # The screened row dominates both full-fidelity rows but never joins the front
+    assert df["fidelity"].tolist() == ["full", "screening", "full"]
+    assert df["pareto_efficient"].tolist() == [True, False, False]
+
+    row = summarize_results(df, "run", max_evals=3, fidelity="full")
+    assert row["pareto_size"] == 1
+    assert row["other_fidelity_configs"] == 1
+    assert row["objective_0_max"] == -0.5
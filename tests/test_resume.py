@@ -0,0 +1,94 @@
+import json
+
+import pytest
+from deephyper.hpo import CBO
+
+from praevion_core.config.problem import problem
+from praevion_core.pipelines.design_space import DesignSpace
+from praevion_core.pipelines.multi_fidelity import MultiFidelityPolicy
+from praevion_core.pipelines.resume import (
+    completed_evaluations,
+    remaining_seeds,
+    replay_frame,
+    replayed_objectives,
+)
+
+CONFIGS = DesignSpace(problem.space).configs([0, 1, 2])
+
+
+def entry(run_id, config, success=True, fidelity="full", promoted=False, objective=-0.5):
+    logged = {
+        "timestamp": "20260101-000000",
+        "run_id": run_id,
+        "config": config,
+        "success": success,
+        "fidelity": fidelity,
+    }
+    if success:
+        logged["promoted"] = promoted
+        logged["objectives"] = {
+            "operational_carbon_kg": 1.0e6,
+            "normalized_objective_values": [objective, -0.2, -0.3, -0.4],
+        }
+    return logged
+
+
+def write_log(path, entries):
+    path.write_text("".join(json.dumps(e) + "\n" for e in entries))
+
+
+def test_each_run_replays_the_result_it_returned():
+    entries = [
+        entry("a", CONFIGS[0], fidelity="screening", objective=-0.9),
+        entry("a", CONFIGS[0], promoted=True, objective=-0.1),
+        entry("b", CONFIGS[1], fidelity="screening", objective=-0.7),
+        entry("b", CONFIGS[1], success=False),
+        entry("c", CONFIGS[2], success=False),
+    ]
+
+    chosen = {e["run_id"]: e for e in completed_evaluations(entries)}
+    assert chosen["a"]["promoted"]
+    assert chosen["b"]["fidelity"] == "screening"
+    assert not chosen["c"]["success"]
+
+
+def test_replay_fits_the_surrogate_and_skips_done_seeds(tmp_path):
+    log_path = tmp_path / "kpi_log_run.jsonl"
+    write_log(
+        log_path,
+        [
+            entry("a", CONFIGS[0], objective=-0.1),
+            entry("b", CONFIGS[1], success=False),
+            entry("partial", {"upgrade_wall_insulation": "R-20"}),
+        ],
+    )
+
+    replayed = replay_frame(str(log_path), problem.hyperparameter_names)
+
+    assert replayed["run_id"].tolist() == ["a", "b"]
+    assert replayed["operational_carbon_kg"].tolist()[0] == 1.0e6
+    assert replayed_objectives(replayed) == [[-0.1, -0.2, -0.3, -0.4], None]
+    assert remaining_seeds(CONFIGS, replayed) == CONFIGS[2:]
+
+    search = CBO(problem, random_state=1, log_dir=str(tmp_path / "search"))
+    search.fit_surrogate(replayed)
+    assert len(search._opt.Xi) == 2
+
+
+def test_replay_bias_corrects_screened_rows_and_keeps_them_off_the_front(tmp_path):
+    log_path = tmp_path / "kpi_log_run.jsonl"
+    write_log(
+        log_path,
+        [
+            entry("a", CONFIGS[0], fidelity="screening", objective=-0.5),
+            entry("a", CONFIGS[0], promoted=True, objective=-0.6),
+            entry("b", CONFIGS[1], fidelity="screening", objective=-0.2),
+        ],
+    )
+    policy = MultiFidelityPolicy(min_bias_pairs=1)
+
+    replayed = replay_frame(str(log_path), problem.hyperparameter_names, policy=policy)
+
+    assert replayed["fidelity"].tolist() == ["full", "screening"]
+    assert replayed["objective_0"].tolist() == pytest.approx([-0.6, -0.3])
+    assert replayed_objectives(replayed, "full") == [[-0.6, -0.2, -0.3, -0.4], None]
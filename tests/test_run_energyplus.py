@@ -0,0 +1,129 @@
+import os
+import stat
+import sys
+
+import pytest
+
+from praevion_core.adapters.energyplus.run_energyplus import (
+    IdfCache,
+    csv_path_from_energyplus_result,
+    run_energyplus,
+    run_idf_and_get_csv_path,
+)
+from praevion_core.domain.kpis import evaluate_kpis
+from praevion_core.pipelines.logging_utils import clean_output_dir
+from praevion_core.pipelines.result_cache import SimulationResultCache
+
+# Stand-in for the EnergyPlus CLI: `energyplus -w <epw> -d <out_dir> <idf>`
+FAKE_ENERGYPLUS = """#!{python}
+import os, sys
+args = sys.argv[1:]
+out_dir = args[args.index("-d") + 1]
+idf = open(args[-1]).read()
+if "Fatal" in idf:
+    sys.stderr.write("EnergyPlus Terminated with a Fatal Error")
+    sys.exit(1)
+with open(os.path.join(out_dir, "eplustbl.csv"), "w") as f:
+    f.write(idf)
+with open(os.path.join(out_dir, "eplusout.eso"), "w") as f:
+    f.write("x" * 4096)
+"""
+
+
+@pytest.fixture
+def energyplus_exe(tmp_path, monkeypatch):
+    exe = tmp_path / "energyplus"
+    exe.write_text(FAKE_ENERGYPLUS.format(python=sys.executable))
+    exe.chmod(exe.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("ENERGYPLUS_EXE", str(exe))
+    return exe
+
+
+def test_idf_cache_captures_in_idf(tmp_path):
+    run_dir = tmp_path / "run"
+    run_dir.mkdir()
+    cache = IdfCache(cache_dir=tmp_path / "idf")
+
+    assert cache.store("abc", run_dir) is None
+    (run_dir / "in.idf").write_text("Version,24.2;")
+    assert cache.get("abc") is None
+
+    cache.store("abc", run_dir)
+    with open(cache.get("abc")) as f:
+        assert f.read() == "Version,24.2;"
+
+    cache.invalidate("abc")
+    assert cache.get("abc") is None
+
+
+def test_direct_run_writes_report(tmp_path, energyplus_exe):
+    idf = tmp_path / "in.idf"
+    idf.write_text("Version,24.2;")
+
+    csv_path = run_idf_and_get_csv_path(idf, tmp_path / "weather.epw", tmp_path / "run")
+
+    assert os.path.dirname(csv_path) == str(tmp_path / "run")
+    with open(csv_path) as f:
+        assert f.read() == "Version,24.2;"
+
+
+def test_direct_run_failure_raises(tmp_path, energyplus_exe):
+    idf = tmp_path / "in.idf"
+    idf.write_text("Fatal")
+
+    with pytest.raises(RuntimeError, match="Fatal Error"):
+        run_idf_and_get_csv_path(idf, tmp_path / "weather.epw", tmp_path / "run")
+
+
+def test_scratch_run_persists_only_whitelisted_outputs(tmp_path, energyplus_exe, monkeypatch):
+    scratch = tmp_path / "shm"
+    monkeypatch.setenv("RUN_SCRATCH_ROOT", str(scratch))
+    idf = tmp_path / "in.idf"
+    idf.write_text("Version,24.2;")
+    run_dir = tmp_path / "run_logs" / "run"
+
+    result = run_energyplus(idf, tmp_path / "weather.epw", run_dir)
+    csv_path = csv_path_from_energyplus_result(result)
+    assert os.path.dirname(csv_path).startswith(str(scratch))
+    assert not run_dir.exists()
+
+    clean_output_dir(result["log_path"], result["persist_path"], result["scratch_dir"])
+
+    assert sorted(os.listdir(run_dir)) == ["eplustbl.csv"]
+    assert os.listdir(scratch) == []
+
+
+def test_failed_scratch_run_is_kept_for_debugging(tmp_path, energyplus_exe, monkeypatch):
+    scratch = tmp_path / "shm"
+    monkeypatch.setenv("RUN_SCRATCH_ROOT", str(scratch))
+    idf = tmp_path / "in.idf"
+    idf.write_text("Fatal")
+    run_dir = tmp_path / "run_logs" / "run"
+
+    result = run_energyplus(idf, tmp_path / "weather.epw", run_dir)
+
+    assert not result["success"] and result["scratch_dir"] is None
+    assert run_dir.is_dir()
+    assert os.listdir(scratch) == []
+
+
+def test_idf_cache_only_keyed_without_result_cache(tmp_path, monkeypatch):
+    monkeypatch.delenv("LEAN_OUTPUT", raising=False)
+    sim_keys = []
+    monkeypatch.setattr(evaluate_kpis, "prepare_config_evaluation", lambda c, f: ({}, "key"))
+    monkeypatch.setattr(
+        evaluate_kpis,
+        "simulate_and_evaluate_config",
+        lambda config, sim_key=None, **kwargs: sim_keys.append(sim_key) or {},
+    )
+    result_cache = SimulationResultCache(db_path=str(tmp_path / "results.sqlite"))
+    paths = dict.fromkeys(["df_factors", "df_embodied", "df_thresholds", "df_material", "df_rates"])
+
+    evaluate_kpis.evaluate_kpis_from_config({}, result_cache=result_cache, **paths)
+    evaluate_kpis.evaluate_kpis_from_config({}, result_cache=None, **paths)
+    monkeypatch.setenv("LEAN_OUTPUT", "on")
+    evaluate_kpis.evaluate_kpis_from_config({}, result_cache=None, **paths)
+
+    # With a result cache, a repeated key is always served from it before any IDF lookup;
+    # lean-output IDFs are captured apart from full-output ones
+    assert sim_keys == [None, "key", "key-lean"]
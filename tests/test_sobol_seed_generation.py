@@ -1,9 +1,17 @@
 import numpy as np
 import pytest
+from scipy.stats import qmc
 
 from praevion_core.config.problem import problem
-from praevion_core.pipelines.search_utils import is_valid_config
-from praevion_core.pipelines.sobol_sampler import generate_filtered_sobol_samples
+from praevion_core.pipelines.design_space import DesignSpace
+from praevion_core.pipelines.search_utils import is_valid_config, valid_config_mask
+from praevion_core.pipelines.sobol_sampler import (
+    _filter_sobol_matrix,
+    _filter_sobol_vectors,
+    decode_sobol_matrix,
+    decode_sobol_vector,
+    generate_filtered_sobol_samples,
+)
 
 
 def test_pass_rate():
@@ -73,3 +81,30 @@ def test_sample_config_format():
     # Optional: check structure
     assert isinstance(valid_configs[0], dict), "Config should be a dictionary"
     assert all(isinstance(k, str) for k in valid_configs[0].keys()), "All keys should be strings"
+
+
+def test_matrix_decoding_matches_per_sample_path():
+    vectors = qmc.Sobol(d=len(problem.space), scramble=True, seed=3).random(512)
+
+    assert _filter_sobol_matrix(vectors, problem.space, debug=False) == _filter_sobol_vectors(
+        vectors, problem.space, debug=False
+    )
+
+    names, choices, indices = decode_sobol_matrix(vectors[:16], problem.space)
+    decoded = [
+        dict(zip(names, (c[i] for c, i in zip(choices, row, strict=True)), strict=True))
+        for row in indices
+    ]
+    assert decoded == [decode_sobol_vector(v, problem.space) for v in vectors[:16]]
+
+
+def test_valid_config_mask_matches_is_valid_config():
+    space = DesignSpace(problem.space, constrained=False)
+    grid = np.indices([len(c) for c in space.choices]).reshape(len(space.choices), -1).T
+    configs = [
+        dict(zip(space.names, (c[i] for c, i in zip(space.choices, row, strict=True)), strict=True))
+        for row in grid
+    ]
+
+    mask = valid_config_mask(space.names, space.choices, grid)
+    assert mask.tolist() == [is_valid_config(config) for config in configs]